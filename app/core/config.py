@@ -1,5 +1,6 @@
 # app/config.py
 import os
+import json
 from dotenv import load_dotenv
 
 # .env 로드 (로컬환경에서만 사용)
@@ -41,15 +42,146 @@ WEIGHT_CONTEXT = 1.0            # 성별, 계절, 장소
 # SBERT 모델
 SBERT_MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
 
+# 🗂️ 모델 레지스트리 (app/core/model_registry.py, 모델별 1회 로드 후 추천기끼리 공유)
+# - MODEL_DIR/<모델 이름>/ 에 저장된 로컬 아티팩트를 checksums.sha256 검증 후 사용
+#   (python -m app.core.model_registry fetch --output <MODEL_DIR> 로 생성)
+# - MODEL_OFFLINE=true면 로컬 아티팩트가 없을 때 HuggingFace hub로 가지 않고 실패
+MODEL_DIR = os.getenv("MODEL_DIR", "")
+MODEL_OFFLINE = os.getenv("MODEL_OFFLINE", "false").lower() == "true"
+MODEL_VERIFY_CHECKSUMS = os.getenv("MODEL_VERIFY_CHECKSUMS", "true").lower() == "true"
+MODEL_LOAD_POLICY = os.getenv("MODEL_LOAD_POLICY", "eager")  # "eager": 시작 시 전부 로드, "lazy": 처음 쓸 때 로드
+MODEL_CHECKSUM_FILE = "checksums.sha256"
+
+# ⚡ 쿼리 인코더 백엔드 ("torch": SentenceTransformer, "onnx": ONNX Runtime fp32, "onnx-int8": 동적 int8 양자화)
+# - onnx 계열은 onnxruntime 설치 필요 (선택 의존성), 임베딩은 torch 대비 코사인 허용 오차 내 (benchmarks.encoders 로 확인)
+# - MODEL_DIR/<모델 이름>/onnx/ 에 export 결과가 없으면 ONNX_EXPORT_DIR 에 한 번 export 후 재사용
+ENCODER_BACKEND = os.getenv("ENCODER_BACKEND", "torch")
+SBERT_ENCODER_BACKEND = os.getenv("SBERT_ENCODER_BACKEND", ENCODER_BACKEND)
+PBTI_ENCODER_BACKEND = os.getenv("PBTI_ENCODER_BACKEND", ENCODER_BACKEND)
+ONNX_EXPORT_DIR = os.getenv("ONNX_EXPORT_DIR", "/tmp/perfume_onnx")
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))  # 0: onnxruntime 기본값 (코어 수)
+
+# 🧺 쿼리 encode 마이크로 배칭 (app/core/encode_batcher.py)
+# - 동시 요청의 encode 호출을 ENCODE_BATCH_WINDOW_MS 동안 (최대 ENCODE_BATCH_MAX_SIZE 문장) 모아 forward 한 번으로 처리
+# - 동시 요청이 없으면 기다리지 않으므로 단일 요청 지연은 그대로
+ENCODE_BATCH_ENABLED = os.getenv("ENCODE_BATCH_ENABLED", "true").lower() == "true"
+ENCODE_BATCH_WINDOW_MS = float(os.getenv("ENCODE_BATCH_WINDOW_MS", "2"))
+ENCODE_BATCH_MAX_SIZE = int(os.getenv("ENCODE_BATCH_MAX_SIZE", "64"))
+
 # 📊 TF-IDF 설정
 TFIDF_NGRAM_RANGE = (1, 2)
 TFIDF_MAX_FEATURES = 3000
 
+# ⏱️ /recommend/full 요청당 시간 예산 (opt-in, 0이면 비활성화)
+# - 시나리오가 시간 안에 오지 않으면 템플릿 시나리오로 대체, 추천이 시간 안에 끝나지 않으면 504
+# - gpt-4 시나리오(최대 400 토큰)는 8초를 넘기는 경우가 많으므로 켤 때는 넉넉하게 설정
+RECOMMEND_DEADLINE_SECONDS = float(os.getenv("RECOMMEND_DEADLINE_SECONDS", "0"))
+
+# 📝 감성 시나리오 변형 풀 (키워드 조합별 미리 생성된 시나리오 재사용)
+SCENARIO_POOL_ENABLED = os.getenv("SCENARIO_POOL_ENABLED", "true").lower() == "true"
+SCENARIO_POOL_SIZE = int(os.getenv("SCENARIO_POOL_SIZE", "4"))  # 키워드 조합당 보관할 변형 수
+SCENARIO_POOL_LOW_WATERMARK = 2  # 남은 변형이 이 값 미만이면 백그라운드 refill
+SCENARIO_POOL_MAX_SERVES = 3     # 한 변형을 최대 몇 번까지 제공할지
+SCENARIO_POOL_MAX_KEYS = 2000    # 보관할 키워드 조합 수 상한 (LRU)
+
 # 🧠 PBTI 전용 설정
 PBTI_SBERT_MODEL_NAME = 'all-MiniLM-L6-v2'
 PBTI_GPT_MODEL = "gpt-4o"
 PBTI_GPT_TEMPERATURE = 0.7
 
+# PBTI GPT 호출 모드
+# - "parallel": 섹션별 프롬프트 5개를 병렬 호출 (기존 방식)
+# - "single": 5개 섹션을 structured output 한 번의 호출로 요청
+PBTI_GPT_MODE = os.getenv("PBTI_GPT_MODE", "parallel")
+PBTI_SECTION_RETRY_LIMIT = 1  # single 모드에서 검증 실패 섹션 재요청 횟수
+PBTI_SECTION_TIMEOUT_SECONDS = float(os.getenv("PBTI_SECTION_TIMEOUT_SECONDS", "30"))  # 스트리밍 모드 섹션 대기 한도
+
+# PBTI 비동기 작업 (submit / poll)
+PBTI_JOB_WORKERS = int(os.getenv("PBTI_JOB_WORKERS", "4"))  # 동시에 실행할 PBTI 작업 수
+PBTI_JOB_MAX_QUEUE_SIZE = int(os.getenv("PBTI_JOB_MAX_QUEUE_SIZE", "200"))  # 대기열 상한 (초과 시 503)
+PBTI_JOB_RESULT_TTL_SECONDS = int(os.getenv("PBTI_JOB_RESULT_TTL_SECONDS", "600"))  # 완료 결과 보관 시간
+PBTI_JOB_MAX_WAIT_SECONDS = 30  # long-poll 최대 대기 시간
+
+# PBTI 점진 세션 (WebSocket): 남은 후보 MBTI 유형이 이 개수 이하이면 유형별 추천을 미리 계산
+PBTI_SESSION_SPECULATION_MAX_CANDIDATES = 9
+
+# 🚦 LLM 게이트웨이 (모든 OpenAI 호출 공통: 동시성 제한, 서킷 브레이커, hedged request)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None  # 로컬 fake 서버 등으로 바꿀 때만 설정
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))  # 동시에 진행할 OpenAI 호출 수
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))  # OpenAI 클라이언트 자체 재시도 횟수
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))  # 연속 실패 시 차단
+LLM_CIRCUIT_RESET_SECONDS = float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30"))  # 차단 후 시험 호출까지 대기
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"  # 토큰 비용이 늘어나므로 기본 비활성화
+LLM_HEDGE_QUANTILE = 0.95        # 이 분위수 지연 이후에도 응답이 없으면 hedge 요청
+LLM_HEDGE_MIN_SAMPLES = 20       # 지연 분포를 신뢰하기 위한 최소 관측 수
+LLM_HEDGE_MIN_DELAY_SECONDS = 0.5
+
+# 🧭 LLM 라우팅 테이블 (호출 용도별 모델 / 최대 출력 토큰 / temperature)
+# - 짧은 출력(scentPoint, summary)은 PBTI_FAST_GPT_MODEL로 보내 지연 시간을 줄일 수 있음
+# - pbti.sections (single 모드 통합 호출) 의 max_tokens는 요청 섹션 예산의 합으로 계산
+# - LLM_ROUTE_OVERRIDES에 JSON으로 일부 값만 덮어쓸 수 있음
+#   예) {"pbti.summary": {"model": "gpt-4o-mini"}, "scenario": {"max_tokens": 300}}
+PBTI_FAST_GPT_MODEL = os.getenv("PBTI_FAST_GPT_MODEL", PBTI_GPT_MODEL)
+SCENARIO_GPT_MODEL = os.getenv("SCENARIO_GPT_MODEL", "gpt-4")
+LLM_ROUTES = {
+    "scenario": {"model": SCENARIO_GPT_MODEL, "max_tokens": 400, "temperature": 0.85},
+    "pbti.recommendation": {"model": PBTI_GPT_MODEL, "max_tokens": 400, "temperature": PBTI_GPT_TEMPERATURE},
+    "pbti.keywords": {"model": PBTI_GPT_MODEL, "max_tokens": 800, "temperature": PBTI_GPT_TEMPERATURE},
+    "pbti.perfumeStyle": {"model": PBTI_GPT_MODEL, "max_tokens": 800, "temperature": PBTI_GPT_TEMPERATURE},
+    "pbti.scentPoint": {"model": PBTI_FAST_GPT_MODEL, "max_tokens": 300, "temperature": PBTI_GPT_TEMPERATURE},
+    "pbti.summary": {"model": PBTI_FAST_GPT_MODEL, "max_tokens": 150, "temperature": PBTI_GPT_TEMPERATURE},
+    "pbti.sections": {"model": PBTI_GPT_MODEL, "max_tokens": None, "temperature": PBTI_GPT_TEMPERATURE},
+}
+for _route, _override in json.loads(os.getenv("LLM_ROUTE_OVERRIDES") or "{}").items():
+    LLM_ROUTES.setdefault(_route, {"model": PBTI_GPT_MODEL, "max_tokens": None, "temperature": PBTI_GPT_TEMPERATURE})
+    LLM_ROUTES[_route].update(_override)
+
+# 📈 LLM 텔레메트리 (GET /metrics/llm 에서 조회할 최근 이벤트 보관 개수)
+LLM_TELEMETRY_RECENT_SIZE = int(os.getenv("LLM_TELEMETRY_RECENT_SIZE", "200"))
+
+# 💾 LLM 응답 캐시 (SQLite, 동일 답변 조합의 GPT 재호출 방지)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "/tmp/perfume_llm_cache.sqlite3")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))  # 7일
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))  # 전체 저장 응답 수 상한
+LLM_CACHE_VARIANTS_PER_KEY = int(os.getenv("LLM_CACHE_VARIANTS_PER_KEY", "3"))  # 키당 응답 변형 개수
+
+# 🪵 로깅 (app/core/logger.py, 큐 기반 비동기 출력)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" 또는 "json" (한 줄 JSON, 로그 수집기용)
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))  # DEBUG 로그를 남길 요청 비율
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # 출력 대기 로그 상한 (초과분은 버림)
+
+# 🔥 시작 시 워밍업 (lifespan에서 추천기 병렬 생성 + 추론 예열, 완료 여부는 GET /health/ready)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"  # false면 첫 요청 때 생성
+WARMUP_QUERY = ("상큼한", "세련된", "여성", "봄", "활발한")  # 추론 예열용 추천 키워드
+WARMUP_RETRY_BASE_SECONDS = float(os.getenv("WARMUP_RETRY_BASE_SECONDS", "5"))  # 실패한 구성 요소 재시도 첫 대기 시간 (실패마다 2배)
+WARMUP_RETRY_MAX_SECONDS = float(os.getenv("WARMUP_RETRY_MAX_SECONDS", "60"))  # 재시도 대기 시간 상한
+WARMUP_PBTI_MBTI_TYPES = [a + b + c + d for a in "EI" for b in "SN" for c in "TF" for d in "JP"]  # 미리 계산할 유형
+
+# 🐢 이벤트 루프 지연 모니터 (주기적 tick 지연 측정 + 블로킹 시 루프 스레드 스택 기록)
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+LOOP_LAG_INTERVAL_SECONDS = 0.1  # tick 간격
+LOOP_BLOCK_THRESHOLD_SECONDS = float(os.getenv("LOOP_BLOCK_THRESHOLD_SECONDS", "0.25"))  # 이 이상 멈추면 블로킹으로 기록
+LOOP_BLOCK_RECENT_SIZE = 20  # 보관할 최근 블로킹 기록 수 (GET /metrics/loop)
+
+# 🔬 요청 단위 디버그 타이밍 / 프로파일링 (X-Debug-Timing 헤더 또는 ?debug_timing= 쿼리)
+# - 기본 비활성화, 켜더라도 DEBUG_TIMING_TOKEN과 X-Debug-Token이 일치하는 호출자만 허용
+#   (컨테이너 네트워크의 호출자는 모두 사설망 주소이므로 주소만으로는 허용하지 않음)
+DEBUG_TIMING_ENABLED = os.getenv("DEBUG_TIMING_ENABLED", "false").lower() == "true"
+DEBUG_TIMING_TOKEN = os.getenv("DEBUG_TIMING_TOKEN", "")
+DEBUG_PROFILE_INTERVAL_SECONDS = 0.005  # 샘플링 프로파일러 스택 수집 간격
+DEBUG_PROFILE_TOP_N = 20                # 리포트에 포함할 상위 스택 / 함수 수
+
+# 📼 트래픽 캡처 (/recommend/full, /pbti/full-result 요청 본문 + 처리 시간을 JSONL로 기록 → benchmarks.replay)
+TRAFFIC_CAPTURE_ENABLED = os.getenv("TRAFFIC_CAPTURE_ENABLED", "false").lower() == "true"
+TRAFFIC_CAPTURE_PATH = os.getenv("TRAFFIC_CAPTURE_PATH", "/tmp/perfume_traffic.jsonl")
+TRAFFIC_CAPTURE_SAMPLE_RATE = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1.0"))  # 기록할 요청 비율
+TRAFFIC_CAPTURE_MAX_MB = float(os.getenv("TRAFFIC_CAPTURE_MAX_MB", "100"))  # 초과 시 .1 파일로 교체
+TRAFFIC_CAPTURE_QUEUE_SIZE = 10000      # 기록 대기 상한 (초과분은 버림)
+TRAFFIC_CAPTURE_MAX_BODY_BYTES = 16384  # 이보다 큰 요청 본문은 기록하지 않음
+TRAFFIC_CAPTURE_MAX_FIELD_LENGTH = 200  # 필드 값 최대 길이 (초과분 자름)
+
 # 향수 계열 분류 (다양성 향상을 위한 새로운 시스템)
 FRAGRANCE_FAMILIES = {
     '플로럴': ['꽃', '꽃향기', '플로럴', '로즈', '자스민', '피오니', '라일락'],
@@ -0,0 +1,160 @@
+# app/core/encode_batcher.py
+# 동시 요청의 쿼리 encode를 짧은 시간 창 동안 모아 한 번의 배치 forward로 처리 (마이크로 배칭)
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from app.core.config import ENCODE_BATCH_WINDOW_MS, ENCODE_BATCH_MAX_SIZE
+from app.core.metrics import REGISTRY, LabeledHistogram, STAGE_BUCKETS
+
+ENCODE_BATCH_TEXTS = REGISTRY.register(LabeledHistogram(
+    "encode_batch_texts", "배치 forward 한 번에 묶인 문장 수", ["model"], buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+))
+ENCODE_BATCH_CALLS = REGISTRY.register(LabeledHistogram(
+    "encode_batch_calls", "배치 forward 한 번에 묶인 encode 호출 수", ["model"], buckets=(1, 2, 4, 8, 16, 32)
+))
+ENCODE_QUEUE_WAIT = REGISTRY.register(LabeledHistogram(
+    "encode_queue_wait_seconds", "encode 호출이 배치 시작까지 기다린 시간 (초)", ["model"], buckets=STAGE_BUCKETS
+))
+
+
+class _Pending:
+    """배치 대기 중인 encode 호출 하나"""
+
+    __slots__ = ("texts", "enqueued", "done", "result", "error")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class BatchingEncoder:
+    """
+    인코더 래퍼 - 스레드풀에서 동시에 들어온 encode 호출을 전용 스레드가 모아 한 번에 encode
+    - 첫 호출을 꺼낸 뒤 window_ms 동안 (또는 문장 수가 max_batch에 닿을 때까지) 더 모아서 배치 실행
+    - 직전 배치가 호출 하나뿐이었으면 (동시 요청 없음) 기다리지 않고 이미 쌓인 호출만 묶음
+      → 동시성 1에서는 지연이 늘지 않고, 부하가 오면 forward 한 번에 여러 요청을 처리
+    - max_batch보다 큰 목록 (카탈로그 임베딩) / 추가 인자가 있는 호출은 배칭 없이 바로 encode
+    - 같은 배치의 호출은 결과도 오류도 함께 받음
+    """
+
+    def __init__(self, encoder: Any, name: str, window_ms: float = ENCODE_BATCH_WINDOW_MS, max_batch: int = ENCODE_BATCH_MAX_SIZE):
+        self.encoder = encoder
+        self.name = name
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Optional[_Pending]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._last_batch_calls = 1
+        # 통계는 배치 스레드와 호출 스레드 양쪽에서 갱신되므로 별도 락으로 보호
+        self._stats_lock = threading.Lock()
+        self._stats = {"batches": 0, "calls": 0, "texts": 0, "direct_calls": 0, "errors": 0, "max_batch_texts": 0}
+
+    def __getattr__(self, name: str) -> Any:
+        # get_sentence_embedding_dimension 등 나머지 속성은 원래 인코더로 위임
+        return getattr(self.encoder, name)
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+    def encode(self, sentences: Union[str, List[str]], **kwargs) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if kwargs or not texts or len(texts) > self.max_batch:
+            self._count("direct_calls")
+            return self.encoder.encode(sentences, **kwargs)
+
+        pending = _Pending(texts)
+        with self._lock:
+            if self._closed:
+                pending = None
+            else:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._worker, name=f"encode-batcher-{self.name}", daemon=True)
+                    self._thread.start()
+                self._queue.put(pending)
+        if pending is None:
+            self._count("direct_calls")
+            return self.encoder.encode(sentences)
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result[0] if single else pending.result
+
+    def _worker(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, count, stopping = [first], len(first.texts), False
+            wait = self.window if self._last_batch_calls > 1 else 0.0
+            deadline = time.perf_counter() + wait
+            while count < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                count += len(item.texts)
+            self._run(batch)
+            if stopping:
+                return
+
+    def _run(self, batch: List[_Pending]) -> None:
+        started = time.perf_counter()
+        texts = [text for item in batch for text in item.texts]
+        try:
+            embeddings = self.encoder.encode(texts, batch_size=len(texts))
+        except Exception as e:
+            self._count("errors")
+            for item in batch:
+                item.error = e
+                item.done.set()
+            return
+
+        offset = 0
+        for item in batch:
+            item.result = embeddings[offset:offset + len(item.texts)]
+            offset += len(item.texts)
+            ENCODE_QUEUE_WAIT.observe(started - item.enqueued, model=self.name)
+            item.done.set()
+        self._last_batch_calls = len(batch)
+        with self._stats_lock:
+            self._stats["batches"] += 1
+            self._stats["calls"] += len(batch)
+            self._stats["texts"] += len(texts)
+            self._stats["max_batch_texts"] = max(self._stats["max_batch_texts"], len(texts))
+        ENCODE_BATCH_TEXTS.observe(len(texts), model=self.name)
+        ENCODE_BATCH_CALLS.observe(len(batch), model=self.name)
+
+    def close(self) -> None:
+        """대기 중인 호출까지 처리한 뒤 배치 스레드 종료 (이후 호출은 바로 encode)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["window_ms"] = self.window * 1000
+        stats["max_batch"] = self.max_batch
+        stats["queued"] = self._queue.qsize()
+        stats["avg_batch_calls"] = round(stats["calls"] / stats["batches"], 3) if stats["batches"] else 0.0
+        stats["avg_batch_texts"] = round(stats["texts"] / stats["batches"], 3) if stats["batches"] else 0.0
+        return stats
@@ -0,0 +1,55 @@
+# app/core/http_metrics.py
+import time
+
+from app.core.logger import get_logging_stats
+from app.core.metrics import REGISTRY, Counter, Gauge, LabeledHistogram, stats_lines
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "HTTP 요청 수", ["method", "path", "status"]
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수 (스트리밍 응답은 본문 전송이 끝날 때까지 포함)"
+))
+HTTP_DURATION = REGISTRY.register(LabeledHistogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지, 초)", ["method", "path"]
+))
+REGISTRY.register_collector(lambda: stats_lines("logging", get_logging_stats()))
+
+
+def _route_path(scope) -> str:
+    """라우트 템플릿 경로 (/pbti/jobs/{job_id}) - 매칭되지 않은 경로는 하나로 묶어 라벨 수 제한"""
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class HTTPMetricsMiddleware:
+    """
+    HTTP 요청 수 / 처리 중 요청 수 / 처리 시간 수집 ASGI 미들웨어
+    - StreamingResponse (SSE) 도 마지막 본문 chunk 전송까지 측정
+    - /metrics 스크랩 요청 자체는 제외
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = {"code": 500}
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            path = _route_path(scope)
+            HTTP_REQUESTS.inc(method=scope["method"], path=path, status=status["code"])
+            HTTP_DURATION.observe(time.perf_counter() - started, method=scope["method"], path=path)
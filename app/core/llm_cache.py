@@ -0,0 +1,208 @@
+# app/core/llm_cache.py
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.metrics import REGISTRY, stats_lines
+from app.core.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_VARIANTS_PER_KEY
+)
+
+
+def make_cache_key(model: str, prompt: str, extra: str = "") -> str:
+    """
+    정규화된 프롬프트 해시 키 생성
+    - 공백/줄바꿈 차이는 무시 (같은 답변 조합이면 같은 키)
+    - 모델명, 응답 형식 등 출력에 영향을 주는 값은 extra로 함께 해싱
+    """
+    normalized = " ".join(prompt.split())
+    raw = f"{model}\x1f{extra}\x1f{normalized}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 영구 캐시 (SQLite)
+    - 키당 여러 개의 응답 변형(variant)을 저장하고 그중 하나를 랜덤 반환 (출력 다양성 유지)
+    - 변형이 variants_per_key개 모이기 전까지는 miss로 처리하여 새 응답을 생성하도록 함
+    - TTL 만료 + 전체 행 수 기준(LRU) eviction
+    - 조회는 읽기 전용: 만료 행은 건너뛰기만 하고, LRU 사용 시각 갱신은 모아 두었다가 put에서 한 번에 반영
+    - 비동기 코드에서는 aget / aput 사용 (SQLite I/O를 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        variants_per_key: int = LLM_CACHE_VARIANTS_PER_KEY
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.variants_per_key = max(1, variants_per_key)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._pending_touches = {}  # row id → 마지막 사용 시각 (다음 쓰기 때 반영)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_key ON llm_responses (cache_key)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_used ON llm_responses (last_used_at)")
+        self._conn.commit()
+
+    def _expire_before(self) -> float:
+        return time.time() - self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """변형이 충분히 쌓인 키면 그중 하나를 반환, 아니면 None (miss)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, value FROM llm_responses WHERE cache_key = ? AND created_at >= ?",
+                (key, self._expire_before())
+            ).fetchall()
+
+            if len(rows) < self.variants_per_key:
+                self._stats["misses"] += 1
+                return None
+
+            row_id, value = random.choice(rows)
+            self._pending_touches[row_id] = time.time()
+            self._stats["hits"] += 1
+        return json.loads(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """새 응답 변형 저장 (키당 variants_per_key개 초과분은 저장하지 않음)"""
+        now = time.time()
+        with self._lock:
+            self._flush_touches_locked()
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses WHERE cache_key = ? AND created_at >= ?",
+                (key, self._expire_before())
+            ).fetchone()[0]
+            if count >= self.variants_per_key:
+                self._conn.commit()
+                return
+            self._conn.execute(
+                "INSERT INTO llm_responses (cache_key, value, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            self._stats["stores"] += 1
+            self._evict_locked()
+            self._conn.commit()
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get을 스레드풀에서 실행 (이벤트 루프에서 호출)"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def aput(self, key: str, value: Any) -> None:
+        """put을 스레드풀에서 실행 (이벤트 루프에서 호출)"""
+        await asyncio.get_running_loop().run_in_executor(None, self.put, key, value)
+
+    def variant_count(self, key: str) -> int:
+        """만료되지 않은 변형 개수 (오프라인 warm-up 진행 확인용)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM llm_responses WHERE cache_key = ? AND created_at >= ?",
+                (key, self._expire_before())
+            ).fetchone()[0]
+
+    def _flush_touches_locked(self) -> None:
+        """모아 둔 LRU 사용 시각을 한 번의 executemany로 반영"""
+        if not self._pending_touches:
+            return
+        self._conn.executemany(
+            "UPDATE llm_responses SET last_used_at = ? WHERE id = ?",
+            [(used_at, row_id) for row_id, used_at in self._pending_touches.items()]
+        )
+        self._pending_touches.clear()
+
+    def _evict_locked(self) -> None:
+        """TTL 만료 행 삭제 후, 최대 행 수를 넘으면 가장 오래 사용되지 않은 행부터 삭제"""
+        cursor = self._conn.execute(
+            "DELETE FROM llm_responses WHERE created_at < ?", (self._expire_before(),)
+        )
+        evicted = cursor.rowcount
+        total = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+        overflow = total - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_responses WHERE id IN "
+                "(SELECT id FROM llm_responses ORDER BY last_used_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            evicted += cursor.rowcount
+        self._stats["evictions"] += max(0, evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (hit rate 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            stats["keys"] = self._conn.execute(
+                "SELECT COUNT(DISTINCT cache_key) FROM llm_responses"
+            ).fetchone()[0]
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["path"] = self.path
+        stats["variants_per_key"] = self.variants_per_key
+        return stats
+
+
+# 전역 캐시 인스턴스 (최초 사용 시 생성)
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """전역 LLM 응답 캐시 반환 (LLM_CACHE_ENABLED=false면 None)"""
+    global _llm_cache
+
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache()
+    return _llm_cache
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """조회용 캐시 통계 (조회만으로 캐시 DB 파일을 만들지 않도록 아직 생성 전이면 생성하지 않음)"""
+    if not LLM_CACHE_ENABLED:
+        return {"enabled": False}
+    cache = _llm_cache
+    if cache is None:
+        return {"enabled": True, "initialized": False}
+    return cache.stats()
+
+
+def _llm_cache_metrics() -> list:
+    # 스크랩만으로 캐시 DB를 만들지 않도록 이미 생성된 경우에만 노출
+    return stats_lines("llm_cache", _llm_cache.stats()) if _llm_cache is not None else []
+
+
+REGISTRY.register_collector(_llm_cache_metrics)
@@ -0,0 +1,393 @@
+# app/core/llm_gateway.py
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError
+
+from app.core.config import (
+    settings,
+    OPENAI_BASE_URL,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_CIRCUIT_RESET_SECONDS,
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_QUANTILE,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_MIN_DELAY_SECONDS,
+    LLM_ROUTES
+)
+from app.core.metrics import REGISTRY, Histogram, sample_lines, stats_lines
+from app.core.profiling import start_span, end_span
+from app.core.llm_telemetry import llm_telemetry
+from app.core.logger import get_logger, kv
+
+logger = get_logger("llm")
+
+
+class LLMCircuitOpen(Exception):
+    """서킷 브레이커가 열려 있어 업스트림 호출 없이 즉시 실패"""
+
+
+def get_llm_route(name: str) -> Dict[str, Any]:
+    """라우팅 테이블 항목 (model, max_tokens, temperature) 복사본"""
+    if name not in LLM_ROUTES:
+        raise KeyError(f"정의되지 않은 LLM 라우트입니다: {name}")
+    return dict(LLM_ROUTES[name])
+
+
+def _usage_tokens(response: Any) -> tuple:
+    """응답 usage에서 (prompt_tokens, completion_tokens) 추출 (없으면 0)"""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0, 0
+    return getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0
+
+
+def _is_upstream_failure(error: Exception, caller_timeout: bool = False) -> bool:
+    """
+    업스트림 장애로 볼 오류인지 (연결 오류, 5xx, 429만 서킷 브레이커에 반영)
+    - 호출자가 timeout(남은 시간 예산)을 지정한 경우의 타임아웃은 취소와 같이 취급
+    - 요청 자체가 잘못된 4xx나 코드 오류는 반영하지 않음
+    """
+    if isinstance(error, APITimeoutError):
+        return not caller_timeout
+    if isinstance(error, APIConnectionError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500 or error.status_code == 429
+    return False
+
+
+class CircuitBreaker:
+    """
+    모델별 서킷 브레이커 (스레드 안전)
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 호출 없이 즉시 실패
+    - half_open: reset_timeout 이후 시험 호출 1건만 허용, 성공하면 closed / 실패하면 다시 open
+    - 시험 호출 슬롯은 그 호출을 맡은 쪽만 해제 (allow()가 시험 호출 여부를 함께 반환)
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> tuple:
+        """(호출 허용 여부, 이 호출이 half_open 시험 호출인지)"""
+        with self._lock:
+            if self.state == "closed":
+                return True, False
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True, True
+            return False, False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, trial: bool = False) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning("🔌 LLM 서킷 브레이커 open", extra=kv(
+                        failures=self._failures, reset_seconds=self.reset_timeout
+                    ))
+                self.state = "open"
+                self._opened_at = time.monotonic()
+            if trial:
+                self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """시험 호출이 결과 없이 끝난 경우 (취소 등) 다음 요청이 다시 시험할 수 있도록 해제 (시험 호출을 맡은 쪽만 호출)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"state": self.state, "consecutive_failures": self._failures}
+
+
+class LLMGateway:
+    """
+    OpenAI 호출 공통 게이트웨이 (bulkhead)
+    - 동시 호출 수 제한 (asyncio.Semaphore, 프로세스 전체에서 LLM_MAX_CONCURRENCY 하나로 공유)
+    - 모델별 서킷 브레이커로 업스트림 장애 시 즉시 실패
+    - hedged request: 모델별 p95 지연 이후에도 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+    - 모델별 지연 시간 히스토그램 (성공한 호출 기준, 대기열 시간 제외)
+    - route를 주면 라우팅 테이블의 model / max_tokens / temperature 적용
+    - 호출마다 모델, 토큰 사용량, 지연 시간을 텔레메트리(app/core/llm_telemetry.py)에 라우트별로 기록
+    - OPENAI_BASE_URL로 로컬 fake 서버에 연결 가능
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        hedge_enabled: bool = LLM_HEDGE_ENABLED,
+        hedge_quantile: float = LLM_HEDGE_QUANTILE,
+        hedge_min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+        hedge_min_delay: float = LLM_HEDGE_MIN_DELAY_SECONDS,
+        base_url: Optional[str] = OPENAI_BASE_URL
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.hedge_enabled = hedge_enabled
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.base_url = base_url
+        self._semaphore = None  # 이벤트 루프 안에서 최초 호출 시 생성
+        self._async_clients = {}  # API 키별 클라이언트 (커넥션 풀 재사용)
+        self._breakers = {}
+        self._latency = {}
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"calls": 0, "errors": 0, "rejected": 0, "hedged": 0, "hedge_wins": 0}
+
+    # -------------------------------------------------------------------------
+    # 클라이언트 / 모델별 상태
+    # -------------------------------------------------------------------------
+
+    def prepare(self) -> None:
+        """
+        기본 API 키의 AsyncOpenAI 클라이언트를 미리 생성 (lifespan 시작 시 호출)
+        - 클라이언트 / SSL 컨텍스트 생성이 1초 가까이 걸려 첫 LLM 호출 때 이벤트 루프를 막지 않도록 함
+        """
+        if settings.OPENAI_API_KEY:
+            self._get_async_client(None)
+
+    def _get_async_client(self, api_key: Optional[str]) -> AsyncOpenAI:
+        api_key = api_key or settings.OPENAI_API_KEY
+        if api_key not in self._async_clients:
+            self._async_clients[api_key] = AsyncOpenAI(
+                api_key=api_key, base_url=self.base_url, max_retries=LLM_MAX_RETRIES
+            )
+        return self._async_clients[api_key]
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        with self._lock:
+            if model not in self._breakers:
+                self._breakers[model] = CircuitBreaker(LLM_CIRCUIT_FAILURE_THRESHOLD, LLM_CIRCUIT_RESET_SECONDS)
+            return self._breakers[model]
+
+    def latency_histogram(self, model: str) -> Histogram:
+        with self._lock:
+            if model not in self._latency:
+                self._latency[model] = Histogram()
+            return self._latency[model]
+
+    @staticmethod
+    def _resolve(model: Optional[str], route: Optional[str], kwargs: Dict[str, Any]) -> tuple:
+        """라우트 기본값 위에 호출 인자를 덮어써 (model, 요청 인자) 반환 (None 값 인자는 라우트 기본값 유지)"""
+        if route is None:
+            return model, kwargs
+        params = get_llm_route(route)
+        options = {
+            key: params[key] for key in ("max_tokens", "temperature") if params.get(key) is not None
+        }
+        options.update({key: value for key, value in kwargs.items() if value is not None})
+        return model or params["model"], options
+
+    def _check_breaker(self, model: str) -> tuple:
+        """(서킷 브레이커, 시험 호출 여부) - 차단 중이면 LLMCircuitOpen"""
+        breaker = self._breaker(model)
+        allowed, trial = breaker.allow()
+        if not allowed:
+            self._stats["rejected"] += 1
+            raise LLMCircuitOpen(f"LLM 업스트림 장애로 호출을 차단 중입니다 (model={model})")
+        return breaker, trial
+
+    def _record(
+        self,
+        model: str,
+        route: Optional[str],
+        breaker: CircuitBreaker,
+        trial: bool,
+        started: float,
+        error: Optional[Exception],
+        response: Any = None,
+        caller_timeout: bool = False
+    ) -> None:
+        elapsed = time.monotonic() - started
+        if error is None:
+            breaker.record_success()
+            self.latency_histogram(model).observe(elapsed)
+            prompt_tokens, completion_tokens = _usage_tokens(response)
+            llm_telemetry.record_call(route or model, model, elapsed, prompt_tokens, completion_tokens)
+            return
+        self._stats["errors"] += 1
+        llm_telemetry.record_call(route or model, model, elapsed, error=type(error).__name__)
+        if _is_upstream_failure(error, caller_timeout):
+            breaker.record_failure(trial)
+        elif trial:
+            breaker.release_trial()
+
+    # -------------------------------------------------------------------------
+    # 비동기 호출
+    # -------------------------------------------------------------------------
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _call(self, model: str, route: Optional[str], api_key: Optional[str], kwargs: Dict[str, Any]) -> Any:
+        """동시성 제한 + 서킷 브레이커를 거친 단일 호출"""
+        client = self._get_async_client(api_key)
+        span = start_span(f"llm:{route or model}")
+        try:
+            async with self._get_semaphore():
+                # 대기열에 있는 동안 half_open 시험 호출을 붙잡지 않도록 슬롯을 얻은 뒤 서킷 브레이커 확인
+                breaker, trial = self._check_breaker(model)
+                self._in_flight += 1
+                started = time.monotonic()
+                try:
+                    response = await client.chat.completions.create(model=model, **kwargs)
+                except asyncio.CancelledError:
+                    if trial:
+                        breaker.release_trial()
+                    raise
+                except Exception as e:
+                    self._record(model, route, breaker, trial, started, e, caller_timeout="timeout" in kwargs)
+                    raise
+                finally:
+                    self._in_flight -= 1
+        finally:
+            end_span(span)
+        self._record(model, route, breaker, trial, started, None, response)
+        return response
+
+    def _hedge_delay(self, model: str) -> Optional[float]:
+        """hedged request 시작 지연 (샘플이 부족하거나 비활성화면 None)"""
+        if not self.hedge_enabled:
+            return None
+        histogram = self.latency_histogram(model)
+        if histogram.count < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, histogram.quantile(self.hedge_quantile))
+
+    async def chat(
+        self,
+        model: Optional[str] = None,
+        api_key: Optional[str] = None,
+        route: Optional[str] = None,
+        **kwargs
+    ) -> Any:
+        """
+        chat.completions.create 호출 (응답 객체 그대로 반환)
+        hedge가 켜져 있으면 p95 지연 이후 같은 요청을 한 번 더 보내 먼저 성공한 응답 사용
+        """
+        model, kwargs = self._resolve(model, route, kwargs)
+        self._stats["calls"] += 1
+        delay = self._hedge_delay(model)
+        if delay is None:
+            return await self._call(model, route, api_key, kwargs)
+
+        primary = asyncio.ensure_future(self._call(model, route, api_key, kwargs))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            return primary.result()
+
+        self._stats["hedged"] += 1
+        hedge = asyncio.ensure_future(self._call(model, route, api_key, kwargs))
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def stream(
+        self,
+        model: Optional[str] = None,
+        api_key: Optional[str] = None,
+        route: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[Any]:
+        """
+        스트리밍 호출 (chunk를 순서대로 반환)
+        스트림이 끝날 때까지 동시성 슬롯을 점유하며, hedge는 적용하지 않음
+        토큰 사용량 집계를 위해 마지막 chunk에 usage를 포함하도록 요청 (choices가 빈 chunk)
+        """
+        model, kwargs = self._resolve(model, route, kwargs)
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        self._stats["calls"] += 1
+        client = self._get_async_client(api_key)
+        async with self._get_semaphore():
+            # 슬롯 대기 중 취소되어도 half_open 시험 호출이 남지 않도록 슬롯을 얻은 뒤 서킷 브레이커 확인
+            breaker, trial = self._check_breaker(model)
+            self._in_flight += 1
+            started = time.monotonic()
+            try:
+                usage_chunk = None
+                response = await client.chat.completions.create(model=model, stream=True, **kwargs)
+                async for chunk in response:
+                    if getattr(chunk, "usage", None) is not None:
+                        usage_chunk = chunk
+                    yield chunk
+            except (asyncio.CancelledError, GeneratorExit):
+                if trial:
+                    breaker.release_trial()
+                raise
+            except Exception as e:
+                self._record(model, route, breaker, trial, started, e, caller_timeout="timeout" in kwargs)
+                raise
+            else:
+                self._record(model, route, breaker, trial, started, None, usage_chunk)
+            finally:
+                self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """게이트웨이 상태 (동시성, 서킷 브레이커, hedge, 모델별 지연 시간)"""
+        stats = dict(self._stats)
+        stats["max_concurrency"] = self.max_concurrency
+        stats["in_flight"] = self._in_flight
+        stats["hedge_enabled"] = self.hedge_enabled
+        stats["circuit"] = {model: breaker.to_dict() for model, breaker in list(self._breakers.items())}
+        stats["latency"] = {model: histogram.snapshot() for model, histogram in list(self._latency.items())}
+        return stats
+
+
+# 전역 LLM 게이트웨이 (모든 OpenAI 호출이 공유)
+llm_gateway = LLMGateway()
+
+
+def get_llm_gateway_stats() -> Dict[str, Any]:
+    return llm_gateway.stats()
+
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def _gateway_metrics() -> list:
+    stats = llm_gateway.stats()
+    circuit = {(model,): _CIRCUIT_STATE_VALUES[state["state"]] for model, state in stats["circuit"].items()}
+    return stats_lines("llm_gateway", stats) + sample_lines(
+        "llm_circuit_state", "LLM 서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)", "gauge", circuit, ["model"]
+    )
+
+
+REGISTRY.register_collector(_gateway_metrics)
@@ -0,0 +1,156 @@
+# app/core/llm_telemetry.py
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from app.core.config import LLM_TELEMETRY_RECENT_SIZE
+from app.core.metrics import REGISTRY, Histogram, histogram_lines, sample_lines
+
+# 토큰 수 히스토그램 버킷
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+def _new_route_stats() -> Dict[str, Any]:
+    return {
+        "calls": 0,
+        "errors": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "parse_ok": 0,
+        "parse_failed": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "models": {},
+        "latency": Histogram(),
+        "prompt_token_hist": Histogram(TOKEN_BUCKETS),
+        "completion_token_hist": Histogram(TOKEN_BUCKETS)
+    }
+
+
+class LLMTelemetry:
+    """
+    LLM 호출 텔레메트리 (라우트별 집계 + 최근 이벤트 기록, 스레드 안전)
+    - call: 모델, prompt/completion 토큰 수, 지연 시간, 오류 (게이트웨이에서 기록)
+    - parse: GPT 응답 JSON 파싱 성공 여부 (extract_json → json.loads)
+    - cache: LLM 응답 캐시 hit / miss
+    """
+
+    def __init__(self, recent_size: int = LLM_TELEMETRY_RECENT_SIZE):
+        self._routes = {}
+        self._recent = deque(maxlen=recent_size)
+        self._lock = threading.Lock()
+
+    def _route(self, route: str) -> Dict[str, Any]:
+        if route not in self._routes:
+            self._routes[route] = _new_route_stats()
+        return self._routes[route]
+
+    def _append(self, event: str, route: str, **fields) -> None:
+        self._recent.append({"event": event, "ts": round(time.time(), 3), "route": route, **fields})
+
+    def record_call(
+        self,
+        route: str,
+        model: str,
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        error: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            stats = self._route(route)
+            stats["calls"] += 1
+            stats["models"][model] = stats["models"].get(model, 0) + 1
+            if error is not None:
+                stats["errors"] += 1
+            else:
+                stats["prompt_tokens"] += prompt_tokens
+                stats["completion_tokens"] += completion_tokens
+            self._append(
+                "call", route,
+                model=model,
+                latency=round(latency, 4),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                error=error
+            )
+        # 히스토그램은 자체 락 사용
+        if error is None:
+            stats["latency"].observe(latency)
+            stats["prompt_token_hist"].observe(prompt_tokens)
+            stats["completion_token_hist"].observe(completion_tokens)
+
+    def record_parse(self, route: str, success: bool) -> None:
+        with self._lock:
+            self._route(route)["parse_ok" if success else "parse_failed"] += 1
+            self._append("parse", route, success=success)
+
+    def record_cache(self, route: str, hit: bool) -> None:
+        with self._lock:
+            self._route(route)["cache_hits" if hit else "cache_misses"] += 1
+            self._append("cache", route, hit=hit)
+
+    def routes(self) -> Dict[str, Dict[str, Any]]:
+        """라우트별 집계 (카운터 + 히스토그램 요약)"""
+        with self._lock:
+            items = [(route, dict(stats, models=dict(stats["models"]))) for route, stats in self._routes.items()]
+        result = {}
+        for route, stats in items:
+            parsed = stats["parse_ok"] + stats["parse_failed"]
+            lookups = stats["cache_hits"] + stats["cache_misses"]
+            result[route] = {
+                key: value for key, value in stats.items()
+                if key not in ("latency", "prompt_token_hist", "completion_token_hist")
+            }
+            result[route]["parse_success_rate"] = round(stats["parse_ok"] / parsed, 4) if parsed else None
+            result[route]["cache_hit_rate"] = round(stats["cache_hits"] / lookups, 4) if lookups else None
+            result[route]["latency"] = stats["latency"].snapshot()
+            result[route]["prompt_tokens_per_call"] = stats["prompt_token_hist"].snapshot()
+            result[route]["completion_tokens_per_call"] = stats["completion_token_hist"].snapshot()
+        return result
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 이벤트 (최신순)"""
+        with self._lock:
+            events = list(self._recent)
+        return events[::-1][:max(0, limit)]
+
+    def prometheus_lines(self) -> List[str]:
+        """Prometheus 지표 줄 (REGISTRY collector)"""
+        with self._lock:
+            items = list(self._routes.items())
+        counters = {
+            "calls": {}, "errors": {}, "tokens": {}, "parse": {}, "cache": {}
+        }
+        for route, stats in items:
+            counters["calls"][(route,)] = stats["calls"]
+            counters["errors"][(route,)] = stats["errors"]
+            counters["tokens"][(route, "prompt")] = stats["prompt_tokens"]
+            counters["tokens"][(route, "completion")] = stats["completion_tokens"]
+            counters["parse"][(route, "ok")] = stats["parse_ok"]
+            counters["parse"][(route, "failed")] = stats["parse_failed"]
+            counters["cache"][(route, "hit")] = stats["cache_hits"]
+            counters["cache"][(route, "miss")] = stats["cache_misses"]
+        return (
+            sample_lines("llm_calls_total", "LLM 호출 수", "counter", counters["calls"], ["route"])
+            + sample_lines("llm_call_errors_total", "LLM 호출 오류 수", "counter", counters["errors"], ["route"])
+            + sample_lines("llm_tokens_total", "LLM 사용 토큰 수", "counter", counters["tokens"], ["route", "type"])
+            + sample_lines("llm_parse_total", "LLM 응답 JSON 파싱 결과 수", "counter", counters["parse"], ["route", "result"])
+            + sample_lines("llm_cache_lookups_total", "LLM 응답 캐시 조회 수", "counter", counters["cache"], ["route", "result"])
+            + histogram_lines(
+                "llm_call_duration_seconds", "LLM 호출 처리 시간 (성공 호출, 초)",
+                {(route,): stats["latency"] for route, stats in items}, ["route"]
+            )
+        )
+
+    def snapshot(self, recent: int = 0) -> Dict[str, Any]:
+        data = {"routes": self.routes()}
+        if recent:
+            data["recent"] = self.recent(recent)
+        return data
+
+
+# 전역 LLM 텔레메트리
+llm_telemetry = LLMTelemetry()
+REGISTRY.register_collector(llm_telemetry.prometheus_lines)
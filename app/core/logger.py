@@ -0,0 +1,227 @@
+# app/core/logger.py
+# 구조화 로깅 (요청 컨텍스트 + 레벨 제한 + DEBUG 샘플링 + 큐 기반 비동기 출력)
+import atexit
+import contextvars
+import copy
+import functools
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import LOG_LEVEL, LOG_FORMAT, LOG_DEBUG_SAMPLE_RATE, LOG_QUEUE_SIZE
+
+ROOT_LOGGER_NAME = "perfume"
+REQUEST_ID_HEADER = "x-request-id"
+
+# 요청 단위 컨텍스트 (asyncio task / 컨텍스트를 복사한 스레드에서 공유)
+_request_id = contextvars.ContextVar("request_id", default=None)
+_stage_timings = contextvars.ContextVar("stage_timings", default=None)
+_debug_sampled = contextvars.ContextVar("debug_sampled", default=None)
+
+_logging_stats = {"dropped": 0}
+
+
+def kv(**fields) -> Dict[str, Any]:
+    """구조화 필드를 logging extra로 전달 - logger.info("추천 완료", extra=kv(results=3))"""
+    return {"fields": fields}
+
+
+def get_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def add_stage_timing(stage: str, seconds: float) -> None:
+    """현재 요청의 단계별 처리 시간 누적 (요청 컨텍스트 밖이면 무시)"""
+    timings = _stage_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def get_stage_timings() -> Dict[str, float]:
+    return dict(_stage_timings.get() or {})
+
+
+def bind_context(func: Callable, *args) -> Callable[[], Any]:
+    """
+    현재 컨텍스트(요청 ID, 단계별 처리 시간)를 복사해 실행하는 callable 반환
+    - run_in_executor는 컨텍스트를 넘기지 않으므로 스레드풀 작업에 사용
+    """
+    context = contextvars.copy_context()
+    return functools.partial(context.run, func, *args)
+
+
+class _ContextFilter(logging.Filter):
+    """
+    호출 스레드에서 요청 컨텍스트를 레코드에 복사하고 DEBUG 로그를 샘플링
+    - DEBUG 로그는 요청 단위로 남길지 결정 (한 요청의 DEBUG 로그는 모두 남거나 모두 빠짐)
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        if record.levelno > logging.DEBUG or LOG_DEBUG_SAMPLE_RATE >= 1:
+            return True
+        sampled = _debug_sampled.get()
+        if sampled is None:
+            sampled = random.random() < LOG_DEBUG_SAMPLE_RATE
+        return sampled
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """
+    큐가 가득 차면 기다리지 않고 버리는 QueueHandler
+    - 메시지 포맷팅은 출력 스레드(QueueListener)에서 수행
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _logging_stats["dropped"] += 1
+
+
+def _format_field(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":"))
+    return json.dumps(text, ensure_ascii=False) if " " in text else text
+
+
+class TextFormatter(logging.Formatter):
+    """2025-01-01 12:00:00 INFO perfume.hybrid [요청ID] 메시지 key=value ..."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            self.formatTime(record, "%Y-%m-%d %H:%M:%S"),
+            record.levelname,
+            record.name,
+            f"[{getattr(record, 'request_id', None) or '-'}]",
+            record.getMessage()
+        ]
+        fields = getattr(record, "fields", None)
+        if fields:
+            parts.extend(f"{key}={_format_field(value)}" for key, value in fields.items())
+        line = " ".join(parts)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON (로그 수집기용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", None),
+            "msg": record.getMessage()
+        }
+        data.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+_listener = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging() -> None:
+    """perfume.* 로거 설정 (최초 1회, 출력은 QueueListener 스레드가 담당)"""
+    global _listener
+
+    if _listener is not None:
+        return
+    with _setup_lock:
+        if _listener is not None:
+            return
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+
+        queue_handler = _DroppingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        queue_handler.addFilter(_ContextFilter())
+
+        root = logging.getLogger(ROOT_LOGGER_NAME)
+        root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+        root.addHandler(queue_handler)
+        root.propagate = False
+
+        _listener = QueueListener(queue_handler.queue, stream_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """perfume.{name} 로거 반환"""
+    setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    stats = dict(_logging_stats)
+    stats["queued"] = _listener.queue.qsize() if _listener is not None else 0
+    return stats
+
+
+logger = get_logger("http")
+
+
+class RequestContextMiddleware:
+    """
+    요청 ID / 단계별 처리 시간 컨텍스트 ASGI 미들웨어
+    - X-Request-ID 헤더가 있으면 그대로 쓰고 없으면 생성, 응답 헤더로 돌려줌
+    - 응답 본문 전송이 끝나면 요청 요약(상태, 처리 시간, 단계별 처리 시간)을 한 줄로 기록
+      (/metrics 스크랩, /health 프로브는 제외)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(REQUEST_ID_HEADER.encode(), b"").decode("latin-1")[:64] or uuid.uuid4().hex
+        request_id_token = _request_id.set(request_id)
+        timings_token = _stage_timings.set({})
+        sampled_token = _debug_sampled.set(random.random() < LOG_DEBUG_SAMPLE_RATE)
+        started = time.perf_counter()
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (REQUEST_ID_HEADER.encode(), request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if scope["path"] != "/metrics" and not scope["path"].startswith("/health/"):
+                logger.info("요청 완료", extra=kv(
+                    method=scope["method"],
+                    path=scope["path"],
+                    status=status["code"],
+                    duration_ms=round((time.perf_counter() - started) * 1000, 1),
+                    stages_ms={stage: round(seconds * 1000, 1) for stage, seconds in get_stage_timings().items()}
+                ))
+            _request_id.reset(request_id_token)
+            _stage_timings.reset(timings_token)
+            _debug_sampled.reset(sampled_token)
@@ -0,0 +1,140 @@
+# app/core/loop_monitor.py
+# 이벤트 루프 지연 측정 + 블로킹 감지 (watchdog 스레드가 멈춘 루프 스레드의 스택을 기록)
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from app.core.config import (
+    LOOP_MONITOR_ENABLED,
+    LOOP_LAG_INTERVAL_SECONDS,
+    LOOP_BLOCK_THRESHOLD_SECONDS,
+    LOOP_BLOCK_RECENT_SIZE
+)
+from app.core.logger import get_logger, kv
+from app.core.metrics import REGISTRY, Counter, Gauge, LabeledHistogram, STAGE_BUCKETS
+
+logger = get_logger("loop")
+
+LOOP_LAG = REGISTRY.register(LabeledHistogram(
+    "event_loop_lag_seconds", "이벤트 루프 tick 지연 (예정 시각 대비, 초)", buckets=STAGE_BUCKETS
+))
+LOOP_LAG_MAX = REGISTRY.register(Gauge(
+    "event_loop_lag_max_seconds", "모니터 시작 이후 최대 이벤트 루프 지연 (초)"
+))
+LOOP_BLOCKED = REGISTRY.register(Counter(
+    "event_loop_blocked_total", "LOOP_BLOCK_THRESHOLD_SECONDS 이상 이벤트 루프가 멈춘 횟수"
+))
+
+
+class EventLoopMonitor:
+    """
+    이벤트 루프 지연 모니터
+    - tick task: LOOP_LAG_INTERVAL_SECONDS 마다 깨어나 예정 시각 대비 지연을 히스토그램에 기록
+    - watchdog 스레드: tick이 임계값 이상 멈추면 그 순간 루프 스레드 스택을 캡처해 로그 + 최근 기록에 저장
+    - 루프가 다시 돌면 해당 블로킹 기록에 실제 멈춘 시간을 채움
+    """
+
+    def __init__(
+        self,
+        interval: float = LOOP_LAG_INTERVAL_SECONDS,
+        threshold: float = LOOP_BLOCK_THRESHOLD_SECONDS,
+        recent_size: int = LOOP_BLOCK_RECENT_SIZE
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self._recent = deque(maxlen=recent_size)
+        self._pending = None  # 감지했지만 아직 끝나지 않은 블로킹 기록
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id = None
+        self._task = None
+        self._watchdog = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {"ticks": 0, "blocked": 0, "max_lag": 0.0}
+
+    def start(self) -> None:
+        """이벤트 루프 안에서 호출 (startup)"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.ensure_future(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._watchdog.join(timeout=1)
+        self._task = None
+        self._watchdog = None
+
+    async def _tick(self) -> None:
+        loop = asyncio.get_event_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._heartbeat = time.monotonic()
+            self._stats["ticks"] += 1
+            LOOP_LAG.observe(lag)
+            if lag > self._stats["max_lag"]:
+                self._stats["max_lag"] = lag
+                LOOP_LAG_MAX.set(lag)
+            with self._lock:
+                pending, self._pending = self._pending, None
+            if pending is not None:
+                pending["blocked_seconds"] = round(lag + self.interval, 3)
+                logger.warning("🐢 이벤트 루프 블로킹 종료", extra=kv(blocked_seconds=pending["blocked_seconds"]))
+
+    def _watch(self) -> None:
+        check_interval = max(0.01, self.threshold / 4)
+        while not self._stop.wait(check_interval):
+            stalled = time.monotonic() - self._heartbeat - self.interval
+            if stalled < self.threshold:
+                continue
+            with self._lock:
+                if self._pending is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = traceback.format_stack(frame) if frame is not None else []
+                self._pending = {
+                    "detected_at": round(time.time(), 3),
+                    "detected_after_seconds": round(stalled, 3),
+                    "blocked_seconds": None,
+                    "stack": [line.rstrip() for line in stack]
+                }
+                self._recent.append(self._pending)
+            self._stats["blocked"] += 1
+            LOOP_BLOCKED.inc()
+            logger.warning(
+                "🐢 이벤트 루프 블로킹 감지",
+                extra=kv(stalled_seconds=round(stalled, 3), stack="".join(stack[-8:]))
+            )
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 블로킹 기록 (최신순)"""
+        with self._lock:
+            events = list(self._recent)
+        return events[::-1][:max(0, limit)]
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["max_lag"] = round(stats["max_lag"], 4)
+        stats["running"] = self._task is not None
+        stats["interval"] = self.interval
+        stats["threshold"] = self.threshold
+        stats["lag"] = LOOP_LAG.labels().snapshot()
+        return stats
+
+
+# 전역 이벤트 루프 모니터 (LOOP_MONITOR_ENABLED=false면 None)
+loop_monitor: Optional[EventLoopMonitor] = EventLoopMonitor() if LOOP_MONITOR_ENABLED else None
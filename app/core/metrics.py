@@ -0,0 +1,332 @@
+# app/core/metrics.py
+# 프로세스 내부 지표 (외부 의존성 없이 Prometheus text format 0.0.4로 노출)
+import bisect
+import functools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from app.core.logger import add_stage_timing, get_logger, kv
+from app.core.profiling import start_span, end_span, add_span
+
+logger = get_logger("metrics")
+
+# 지연 시간 히스토그램 기본 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 3, 5, 8, 13, 20, 30, 60)
+
+# 추천 파이프라인 단계별 처리 시간 버킷 (초, ms 단위 단계가 대부분)
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def _header(name: str, help_text: str, metric_type: str) -> List[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (스레드 안전)
+    - 버킷별 개수만 보관하므로 관측 수와 무관하게 메모리 일정
+    - 분위수는 버킷 안에서 선형 보간으로 추정
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 추정값 (관측이 없으면 None)"""
+        with self._lock:
+            if self._count == 0:
+                return None
+            rank = q * self._count
+            cumulative = 0
+            for i, bucket_count in enumerate(self._counts):
+                if bucket_count and cumulative + bucket_count >= rank:
+                    if i == len(self.buckets):
+                        return self._max
+                    lower = self.buckets[i - 1] if i > 0 else 0.0
+                    upper = min(self.buckets[i], self._max)
+                    return lower + (upper - lower) * max(0.0, rank - cumulative) / bucket_count
+                cumulative += bucket_count
+            return self._max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """요약 통계 (count, sum, avg, p50/p95/p99, max)"""
+        p50, p95, p99 = self.quantile(0.5), self.quantile(0.95), self.quantile(0.99)
+        with self._lock:
+            count, total, maximum = self._count, self._sum, self._max
+        return {
+            "count": count,
+            "sum": round(total, 4),
+            "avg": round(total / count, 4) if count else None,
+            "p50": round(p50, 4) if p50 is not None else None,
+            "p95": round(p95, 4) if p95 is not None else None,
+            "p99": round(p99, 4) if p99 is not None else None,
+            "max": round(maximum, 4)
+        }
+
+    def prometheus_samples(self, name: str, labels: Optional[Dict[str, Any]] = None) -> List[str]:
+        """_bucket (누적) / _sum / _count 샘플 줄"""
+        labels = labels or {}
+        with self._lock:
+            counts, total, count = list(self._counts), self._sum, self._count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(list(self.buckets) + [math.inf], counts):
+            cumulative += bucket_count
+            lines.append(f"{name}_bucket{_format_labels({**labels, 'le': _format_value(bound)})} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class _LabeledMetric:
+    """라벨 조합별 값을 가지는 지표 공통 부분"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 라벨이 맞지 않습니다: {sorted(labels)} (필요: {list(self.labelnames)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels_of(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = _header(self.name, self.help_text, self.metric_type)
+        lines.extend(
+            f"{self.name}{_format_labels(self._labels_of(key))} {_format_value(value)}" for key, value in items
+        )
+        return lines
+
+
+class Counter(_LabeledMetric):
+    """단조 증가 카운터"""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_LabeledMetric):
+    """현재 값 (증감 가능)"""
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class LabeledHistogram(_LabeledMetric):
+    """라벨 조합별 Histogram"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def labels(self, **labels) -> Histogram:
+        key = self._key(labels)
+        histogram = self._values.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(key, Histogram(self.buckets))
+        return histogram
+
+    def observe(self, value: float, **labels) -> None:
+        self.labels(**labels).observe(value)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = _header(self.name, self.help_text, self.metric_type)
+        for key, histogram in items:
+            lines.extend(histogram.prometheus_samples(self.name, self._labels_of(key)))
+        return lines
+
+
+def histogram_lines(name: str, help_text: str, histograms: Dict[tuple, Histogram], labelnames: Sequence[str]) -> List[str]:
+    """이미 가지고 있는 Histogram들을 하나의 histogram 지표로 렌더링 (collector용)"""
+    lines = _header(name, help_text, "histogram")
+    for key, histogram in sorted(histograms.items()):
+        lines.extend(histogram.prometheus_samples(name, dict(zip(labelnames, key))))
+    return lines
+
+
+def sample_lines(name: str, help_text: str, metric_type: str, samples: Dict[tuple, float], labelnames: Sequence[str] = ()) -> List[str]:
+    """라벨 조합 → 값 dict를 하나의 지표로 렌더링 (collector용)"""
+    lines = _header(name, help_text, metric_type)
+    for key, value in sorted(samples.items()):
+        lines.append(f"{name}{_format_labels(dict(zip(labelnames, key)))} {_format_value(value)}")
+    return lines
+
+
+def stats_lines(prefix: str, stats: Dict[str, Any], label: Optional[str] = None) -> List[str]:
+    """
+    기존 stats() dict를 gauge 지표로 변환 (collector용)
+    - 숫자 값만 변환 ({prefix}_{키}), 문자열/None 등은 건너뜀
+    - label을 주면 stats를 {라벨값: {키: 숫자}} 형태로 보고 라벨을 붙여 변환
+    - 누적 카운트도 gauge로 노출 (재시작 시 0으로 돌아감)
+    """
+    groups = stats if label is not None else {None: stats}
+    samples = {}
+    for label_value, group in groups.items():
+        if not isinstance(group, dict):
+            continue
+        for key, value in group.items():
+            if isinstance(value, (int, float)):
+                samples.setdefault(key, {})[(label_value,) if label is not None else ()] = value
+    lines = []
+    for key, values in sorted(samples.items()):
+        lines.extend(sample_lines(
+            f"{prefix}_{key}", f"{prefix} {key}", "gauge", values, (label,) if label is not None else ()
+        ))
+    return lines
+
+
+class MetricsRegistry:
+    """
+    지표 등록소
+    - register: Counter / Gauge / LabeledHistogram 등록
+    - register_collector: 수집 시점에 기존 stats를 읽어 지표 줄을 만드는 함수 등록
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text format 0.0.4"""
+        with self._lock:
+            metrics, collectors = list(self._metrics), list(self._collectors)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            try:
+                lines.extend(collector())
+            except Exception as e:
+                logger.warning("⚠️ 지표 수집 실패", extra=kv(collector=getattr(collector, "__name__", str(collector)), error=str(e)))
+        return "\n".join(lines) + "\n"
+
+
+# 전역 지표 등록소
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.register(LabeledHistogram(
+    "perfume_stage_duration_seconds",
+    "추천 파이프라인 단계별 처리 시간 (초)",
+    ["stage"],
+    STAGE_BUCKETS
+))
+
+
+def _record_stage(stage: str, seconds: float) -> None:
+    STAGE_DURATION.observe(seconds, stage=stage)
+    add_stage_timing(stage, seconds)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """단계 히스토그램 + 현재 요청의 단계별 처리 시간 (요청 완료 로그, 디버그 타이밍 트리) 에 기록"""
+    _record_stage(stage, seconds)
+    add_span(stage, seconds)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """with 블록 처리 시간을 단계 히스토그램에 기록"""
+    span = start_span(stage)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record_stage(stage, time.perf_counter() - started)
+        end_span(span)
+
+
+def timed_stage(stage: str):
+    """함수 처리 시간을 단계 히스토그램에 기록하는 데코레이터 (디버그 모드면 타이밍 트리 span도 기록)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            span = start_span(stage)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record_stage(stage, time.perf_counter() - started)
+                end_span(span)
+        return wrapper
+    return decorator
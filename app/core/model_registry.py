@@ -0,0 +1,306 @@
+# app/core/model_registry.py
+# 프로세스 전역 모델 레지스트리 (모델별 1회 로드 + 추천기끼리 공유, 로컬 아티팩트 checksum 검증)
+#   python -m app.core.model_registry fetch --output ./models    → 모델 저장 + checksums.sha256 생성
+#   python -m app.core.model_registry fetch --output ./models --onnx   → ONNX / int8 export 포함 (<모델>/onnx/)
+#   python -m app.core.model_registry verify --output ./models   → 저장된 아티팩트 검증
+import argparse
+import gc
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sentence_transformers import SentenceTransformer
+
+from app.core.config import (
+    MODEL_DIR,
+    MODEL_OFFLINE,
+    MODEL_VERIFY_CHECKSUMS,
+    MODEL_CHECKSUM_FILE,
+    SBERT_MODEL_NAME,
+    PBTI_SBERT_MODEL_NAME,
+    SBERT_ENCODER_BACKEND,
+    PBTI_ENCODER_BACKEND,
+    ONNX_EXPORT_DIR,
+    ONNX_INTRA_OP_THREADS,
+    ENCODE_BATCH_ENABLED
+)
+from app.core.encode_batcher import BatchingEncoder
+from app.core.logger import get_logger, kv
+from app.core.metrics import REGISTRY, Gauge
+from app.core.onnx_encoder import ENCODER_BACKENDS, ONNX_MODEL_FILES, OnnxSentenceEncoder, export_onnx
+
+logger = get_logger("models")
+
+# 서비스에서 사용하는 모델 (fetch 대상)
+KNOWN_MODELS = [SBERT_MODEL_NAME, PBTI_SBERT_MODEL_NAME]
+# 추천기별 (모델, 인코더 백엔드) (eager 로드 대상)
+SERVICE_MODELS = [(SBERT_MODEL_NAME, SBERT_ENCODER_BACKEND), (PBTI_SBERT_MODEL_NAME, PBTI_ENCODER_BACKEND)]
+
+MODEL_LOAD_SECONDS = REGISTRY.register(Gauge(
+    "model_load_seconds", "모델 로드 시간 (초)", ["model", "source"]
+))
+MODEL_PARAMETER_BYTES = REGISTRY.register(Gauge(
+    "model_parameter_bytes", "모델 파라미터 메모리 (바이트)", ["model"]
+))
+
+
+class ModelArtifactError(RuntimeError):
+    """로컬 모델 아티팩트가 없거나 checksum이 맞지 않음"""
+
+
+def model_key(model_name: str, backend: str = "torch") -> str:
+    """레지스트리 / 지표 키 (torch는 모델 이름 그대로, 그 외는 "<모델>@<백엔드>")"""
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
+
+
+def artifact_dir(model_name: str, root: str = MODEL_DIR) -> str:
+    """모델 이름 → 로컬 아티팩트 디렉토리 (org/name 형식은 org__name)"""
+    return os.path.join(root, model_name.replace("/", "__"))
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _artifact_files(directory: str) -> List[str]:
+    files = []
+    for base, _, names in os.walk(directory):
+        for name in names:
+            relative = os.path.relpath(os.path.join(base, name), directory)
+            if relative != MODEL_CHECKSUM_FILE:
+                files.append(relative)
+    return sorted(files)
+
+
+def write_checksums(directory: str) -> int:
+    """디렉토리 안 모든 파일의 sha256 목록 작성 (sha256sum 형식) → 파일 수 반환"""
+    files = _artifact_files(directory)
+    with open(os.path.join(directory, MODEL_CHECKSUM_FILE), "w", encoding="utf-8") as f:
+        for relative in files:
+            f.write(f"{_sha256(os.path.join(directory, relative))}  {relative}\n")
+    return len(files)
+
+
+def verify_checksums(directory: str) -> int:
+    """checksums.sha256 과 실제 파일 비교 (목록 누락 / 불일치 시 ModelArtifactError) → 검증한 파일 수 반환"""
+    manifest = os.path.join(directory, MODEL_CHECKSUM_FILE)
+    if not os.path.exists(manifest):
+        raise ModelArtifactError(f"checksum 목록이 없습니다: {manifest}")
+    expected = {}
+    with open(manifest, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                digest, relative = line.rstrip("\n").split("  ", 1)
+                expected[relative] = digest
+    missing = [relative for relative in expected if not os.path.exists(os.path.join(directory, relative))]
+    if missing:
+        raise ModelArtifactError(f"아티팩트 파일 누락: {missing[:5]}")
+    mismatched = [relative for relative, digest in expected.items() if _sha256(os.path.join(directory, relative)) != digest]
+    if mismatched:
+        raise ModelArtifactError(f"checksum 불일치: {mismatched[:5]}")
+    return len(expected)
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _parameter_bytes(model: Any) -> Optional[int]:
+    if isinstance(model, OnnxSentenceEncoder):
+        return model.model_bytes
+    parameters = getattr(model, "parameters", None)
+    if parameters is None:
+        return None
+    return sum(parameter.numel() * parameter.element_size() for parameter in parameters())
+
+
+class ModelRegistry:
+    """
+    인코더 인스턴스를 (모델 이름, 백엔드)별로 한 번만 로드해 공유
+    - MODEL_DIR에 아티팩트가 있으면 checksum 검증 후 로컬 경로로 로드 (네트워크 없이 시작 가능)
+    - 없으면 MODEL_OFFLINE=false일 때만 hub 이름으로 로드
+    - 모델별 로드 시간 / 출처 / 파라미터 메모리 / RSS 증가량 기록
+      (RSS 증가량은 다른 모델과 동시에 로드되면 서로 섞일 수 있음)
+    - onnx 백엔드: 로컬 아티팩트의 onnx/ 를 쓰고, 없으면 torch 모델을 ONNX_EXPORT_DIR 에 한 번 export
+    """
+
+    def __init__(
+        self,
+        model_dir: str = MODEL_DIR,
+        offline: bool = MODEL_OFFLINE,
+        verify: bool = MODEL_VERIFY_CHECKSUMS,
+        onnx_threads: int = ONNX_INTRA_OP_THREADS
+    ):
+        self.model_dir = model_dir
+        self.offline = offline
+        self.verify = verify
+        self.onnx_threads = onnx_threads
+        self._models: Dict[str, Any] = {}
+        self._info: Dict[str, Dict[str, Any]] = {}
+        self._batchers: Dict[str, BatchingEncoder] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, model_name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(model_name, threading.Lock())
+
+    def resolve(self, model_name: str) -> tuple:
+        """모델 이름 → (로드 경로, 출처 "local" | "hub")"""
+        if self.model_dir:
+            directory = artifact_dir(model_name, self.model_dir)
+            if os.path.isdir(directory):
+                if self.verify:
+                    verify_checksums(directory)
+                return directory, "local"
+        if self.offline:
+            raise ModelArtifactError(
+                f"MODEL_OFFLINE인데 로컬 아티팩트가 없습니다: {model_name} (MODEL_DIR={self.model_dir or '미설정'})"
+            )
+        return model_name, "hub"
+
+    def get(self, model_name: str, backend: str = "torch") -> Any:
+        """모델 반환 (처음 호출한 스레드가 로드, 같은 모델을 동시에 요청한 스레드는 기다렸다가 공유)"""
+        if backend not in ENCODER_BACKENDS:
+            raise ValueError(f"알 수 없는 인코더 백엔드: {backend} ({', '.join(ENCODER_BACKENDS)})")
+        key = model_key(model_name, backend)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock_for(key):
+            model = self._models.get(key)
+            if model is None:
+                model = self._load(model_name, backend)
+        return model
+
+    def _onnx_encoder(self, model_name: str, path: str, source: str, backend: str) -> OnnxSentenceEncoder:
+        directory = os.path.join(path, "onnx") if source == "local" else ""
+        if not (directory and os.path.exists(os.path.join(directory, ONNX_MODEL_FILES[backend]))):
+            directory = artifact_dir(model_name, ONNX_EXPORT_DIR)
+            if not os.path.exists(os.path.join(directory, ONNX_MODEL_FILES[backend])):
+                logger.info("ONNX export 시작", extra=kv(model=model_name, output=directory))
+                export_onnx(SentenceTransformer(path), directory)
+        return OnnxSentenceEncoder(directory, backend=backend, intra_op_threads=self.onnx_threads)
+
+    def _load(self, model_name: str, backend: str) -> Any:
+        key = model_key(model_name, backend)
+        path, source = self.resolve(model_name)
+        gc.collect()
+        rss_before = _rss_bytes()
+        started = time.perf_counter()
+        if backend == "torch":
+            model = SentenceTransformer(path)
+        else:
+            model = self._onnx_encoder(model_name, path, source, backend)
+        seconds = time.perf_counter() - started
+        rss_after = _rss_bytes()
+        info = {
+            "backend": backend,
+            "source": source,
+            "path": path,
+            "load_seconds": round(seconds, 3),
+            "parameter_bytes": _parameter_bytes(model),
+            "rss_delta_bytes": rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+            "loaded_at": time.time()
+        }
+        self._models[key] = model
+        self._info[key] = info
+        MODEL_LOAD_SECONDS.set(seconds, model=key, source=source)
+        if info["parameter_bytes"] is not None:
+            MODEL_PARAMETER_BYTES.set(info["parameter_bytes"], model=key)
+        logger.info("모델 로드 완료", extra=kv(model=key, **{k: v for k, v in info.items() if k != "loaded_at"}))
+        return model
+
+    def batcher(self, model_name: str, backend: str = "torch") -> BatchingEncoder:
+        """모델을 감싼 마이크로 배칭 인코더 (모델별 배치 스레드 하나를 추천기끼리 공유)"""
+        key = model_key(model_name, backend)
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            model = self.get(model_name, backend)
+            with self._locks_guard:
+                batcher = self._batchers.get(key)
+                if batcher is None:
+                    batcher = self._batchers[key] = BatchingEncoder(model, key)
+        return batcher
+
+    def preload(self, models: Optional[List[tuple]] = None) -> None:
+        """eager 정책: 목록의 (모델, 백엔드)를 모두 로드 (이미 로드된 모델은 건너뜀)"""
+        for model_name, backend in models or SERVICE_MODELS:
+            self.get(model_name, backend)
+
+    def clear(self) -> None:
+        """로드한 모델 해제 (벤치마크 / 인코더 교체용)"""
+        for batcher in self._batchers.values():
+            batcher.close()
+        self._batchers.clear()
+        self._models.clear()
+        self._info.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model_dir": self.model_dir or None,
+            "offline": self.offline,
+            "models": {name: dict(info) for name, info in self._info.items()},
+            "batching": {name: batcher.stats() for name, batcher in self._batchers.items()},
+            "pending": [key for key in (model_key(*model) for model in SERVICE_MODELS) if key not in self._info]
+        }
+
+
+model_registry = ModelRegistry()
+
+
+def get_sentence_model(model_name: str, backend: str = "torch") -> Any:
+    """
+    공유 인코더 반환 (추천기 생성자에서 사용, 어느 백엔드든 encode() 결과는 numpy 배열)
+    - ENCODE_BATCH_ENABLED면 동시 요청의 encode를 모으는 배칭 래퍼 반환
+    """
+    if ENCODE_BATCH_ENABLED:
+        return model_registry.batcher(model_name, backend)
+    return model_registry.get(model_name, backend)
+
+
+def fetch(output: str, model_names: List[str], onnx: bool = False) -> None:
+    """
+    hub에서 모델을 받아 output/<모델>/ 에 저장하고 checksums.sha256 작성 (Docker 빌드 / 배포 전 준비)
+    - onnx=True면 output/<모델>/onnx/ 에 fp32 / int8 ONNX도 export (checksum 대상에 포함)
+    """
+    for model_name in model_names:
+        directory = artifact_dir(model_name, output)
+        started = time.perf_counter()
+        model = SentenceTransformer(model_name)
+        model.save(directory)
+        if onnx:
+            export_onnx(model, os.path.join(directory, "onnx"))
+        count = write_checksums(directory)
+        print(f"📦 {model_name} → {directory} ({count}개 파일, {time.perf_counter() - started:.1f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="모델 아티팩트 준비 / 검증")
+    parser.add_argument("command", choices=("fetch", "verify"))
+    parser.add_argument("--output", default=MODEL_DIR or "models", help="아티팩트 루트 디렉토리 (MODEL_DIR)")
+    parser.add_argument("--models", default=",".join(KNOWN_MODELS), help="모델 이름 목록 (쉼표 구분)")
+    parser.add_argument("--onnx", action="store_true", help="fetch 시 ONNX / int8 export 포함 (onnxruntime 필요)")
+    args = parser.parse_args()
+    model_names = [name.strip() for name in args.models.split(",") if name.strip()]
+
+    if args.command == "fetch":
+        fetch(args.output, model_names, onnx=args.onnx)
+        return
+    for model_name in model_names:
+        directory = artifact_dir(model_name, args.output)
+        print(f"✅ {model_name}: {verify_checksums(directory)}개 파일 검증")
+
+
+if __name__ == "__main__":
+    main()
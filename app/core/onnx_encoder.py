@@ -0,0 +1,157 @@
+# app/core/onnx_encoder.py
+# ONNX Runtime 쿼리 인코더 (SentenceTransformer.encode 대체, CPU 전용)
+# - export_onnx: SentenceTransformer 전체 파이프라인(Transformer + Pooling + Normalize)을 ONNX 그래프 하나로 export
+#   → 런타임에는 토크나이저(tokenizers) + onnxruntime만 사용 (torch 호출 오버헤드 없음)
+# - model_int8.onnx: 가중치 동적 int8 양자화 버전 (크기 약 1/4, 짧은 질의에서 더 빠름)
+import json
+import os
+import shutil
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+# 백엔드 이름 → ONNX 파일 이름
+ONNX_MODEL_FILES = {
+    "onnx": "model.onnx",
+    "onnx-int8": "model_int8.onnx"
+}
+ENCODER_BACKENDS = ("torch", *ONNX_MODEL_FILES)
+ENCODER_CONFIG_FILE = "encoder_config.json"
+TOKENIZER_FILE = "tokenizer.json"
+
+
+def _import_onnxruntime():
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise RuntimeError("onnx 인코더 백엔드에는 onnxruntime이 필요합니다 (pip install onnxruntime)") from e
+    return onnxruntime
+
+
+def export_onnx(model: Any, output_dir: str, opset: int = 14) -> Dict[str, Any]:
+    """
+    SentenceTransformer → output_dir/{model.onnx, model_int8.onnx, tokenizer.json, encoder_config.json}
+    - 출력 "sentence_embedding"은 모델의 pooling / normalize 설정이 그대로 반영된 문장 임베딩
+    - 임시 디렉토리에 쓴 뒤 이름을 바꿔 동시에 export한 다른 프로세스와 섞이지 않게 함
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    _import_onnxruntime()
+
+    features = model.tokenize(["이 향수는 차분하고 따뜻한 느낌의 향수입니다."])
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in features]
+
+    class SentenceEmbedding(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.model = model
+
+        def forward(self, *inputs):
+            return self.model(dict(zip(input_names, inputs)))["sentence_embedding"]
+
+    staging = f"{output_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    fp32_path = os.path.join(staging, ONNX_MODEL_FILES["onnx"])
+    model.to("cpu").eval()
+    with torch.no_grad():
+        torch.onnx.export(
+            SentenceEmbedding(),
+            tuple(features[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["sentence_embedding"],
+            dynamic_axes={**{name: {0: "batch", 1: "sequence"} for name in input_names}, "sentence_embedding": {0: "batch"}},
+            opset_version=opset,
+            do_constant_folding=True
+        )
+    quantize_dynamic(fp32_path, os.path.join(staging, ONNX_MODEL_FILES["onnx-int8"]), weight_type=QuantType.QInt8)
+
+    tokenizer = model.tokenizer
+    if not getattr(tokenizer, "is_fast", False):
+        raise RuntimeError("onnx 인코더는 fast 토크나이저(tokenizer.json)가 있는 모델만 지원합니다")
+    tokenizer.save_pretrained(staging)
+    config = {
+        "input_names": input_names,
+        "dimension": model.get_sentence_embedding_dimension(),
+        "max_seq_length": model.max_seq_length,
+        "do_lower_case": bool(getattr(model[0], "do_lower_case", False)),
+        "pad_token": tokenizer.pad_token,
+        "pad_token_id": tokenizer.pad_token_id,
+        "opset": opset
+    }
+    with open(os.path.join(staging, ENCODER_CONFIG_FILE), "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+
+    try:
+        os.rename(staging, output_dir)
+    except OSError:
+        # 다른 프로세스가 먼저 export를 끝낸 경우 그 결과를 사용
+        shutil.rmtree(staging, ignore_errors=True)
+    return config
+
+
+class OnnxSentenceEncoder:
+    """
+    SentenceTransformer.encode 호환 인코더 (추천기 코드 변경 없이 백엔드 교체)
+    - 단일 문자열 → (dim,), 리스트 → (n, dim) float32 numpy 배열
+    - 배치 안에서 길이순으로 정렬해 패딩을 줄이고 원래 순서로 되돌림 (SentenceTransformer와 동일)
+    - InferenceSession.run은 스레드 안전하므로 추천기끼리 인스턴스 하나를 공유
+    """
+
+    def __init__(self, directory: str, backend: str = "onnx", intra_op_threads: int = 0):
+        from tokenizers import Tokenizer
+        onnxruntime = _import_onnxruntime()
+
+        with open(os.path.join(directory, ENCODER_CONFIG_FILE), encoding="utf-8") as f:
+            self.config = json.load(f)
+        self.backend = backend
+        self.model_path = os.path.join(directory, ONNX_MODEL_FILES[backend])
+        self.model_bytes = os.path.getsize(self.model_path)
+        self.dimension = self.config["dimension"]
+        self.input_names: List[str] = self.config["input_names"]
+
+        self._tokenizer = Tokenizer.from_file(os.path.join(directory, TOKENIZER_FILE))
+        self._tokenizer.enable_truncation(max_length=self.config["max_seq_length"])
+        self._tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self._session = onnxruntime.InferenceSession(self.model_path, options, providers=["CPUExecutionProvider"])
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def _prepare(self, text: str) -> str:
+        text = str(text).strip()
+        return text.lower() if self.config["do_lower_case"] else text
+
+    def _run(self, texts: List[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch([self._prepare(text) for text in texts])
+        inputs = {
+            "input_ids": np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            "token_type_ids": np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        }
+        return self._session.run(None, {name: inputs[name] for name in self.input_names})[0]
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        **kwargs
+    ) -> np.ndarray:
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        order = np.argsort([-len(text) for text in texts], kind="stable")
+        for start in range(0, len(texts), batch_size):
+            indices = order[start:start + batch_size]
+            embeddings[indices] = self._run([texts[index] for index in indices])
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms == 0, 1.0, norms)
+        return embeddings[0] if single else embeddings
@@ -0,0 +1,296 @@
+# app/core/profiling.py
+# 요청 단위 디버그 타이밍 트리 + 샘플링 프로파일러 (디버그 토큰을 보낸 호출자가 요청한 경우에만 동작)
+import asyncio
+import contextvars
+import functools
+import hmac
+import json
+import sys
+import threading
+import time
+from collections import Counter as _Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs
+
+from app.core.config import (
+    DEBUG_TIMING_ENABLED,
+    DEBUG_TIMING_TOKEN,
+    DEBUG_PROFILE_INTERVAL_SECONDS,
+    DEBUG_PROFILE_TOP_N
+)
+from app.core.logger import get_logger, kv
+
+logger = get_logger("profiling")
+
+DEBUG_TIMING_HEADER = b"x-debug-timing"
+DEBUG_TOKEN_HEADER = b"x-debug-token"
+DEBUG_TIMING_QUERY = "debug_timing"
+
+# 현재 span 노드 (디버그 모드가 아니면 None → span 함수는 바로 반환)
+_current_node = contextvars.ContextVar("trace_node", default=None)
+
+
+class _TraceNode:
+    """타이밍 트리 노드 - 같은 부모 아래 같은 이름의 span은 하나로 합산 (calls 증가)"""
+
+    __slots__ = ("name", "trace", "seconds", "calls", "children")
+
+    def __init__(self, name: str, trace: "_Trace"):
+        self.name = name
+        self.trace = trace
+        self.seconds = 0.0
+        self.calls = 0
+        self.children = {}
+
+    def child(self, name: str) -> "_TraceNode":
+        with self.trace.lock:
+            node = self.children.get(name)
+            if node is None:
+                node = self.children[name] = _TraceNode(name, self.trace)
+        return node
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"name": self.name, "ms": round(self.seconds * 1000, 2), "calls": self.calls}
+        if self.children:
+            data["children"] = [child.to_dict() for child in list(self.children.values())]
+        return data
+
+
+class _Trace:
+    """요청 하나의 타이밍 트리 + 스레드별 열린 span 수 (프로파일러 샘플 대상)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loop_thread = threading.get_ident()
+        self.active = _Counter()
+        self.root = _TraceNode("request", self)
+
+    def sample_threads(self) -> list:
+        """이벤트 루프 스레드 + 지금 이 요청의 span을 실행 중인 스레드"""
+        with self.lock:
+            threads = {thread_id for thread_id, depth in self.active.items() if depth > 0}
+        threads.add(self.loop_thread)
+        return list(threads)
+
+
+def start_span(name: str):
+    """span 시작 (디버그 모드가 아니면 None 반환)"""
+    parent = _current_node.get()
+    if parent is None:
+        return None
+    node = parent.child(name)
+    thread_id = threading.get_ident()
+    with node.trace.lock:
+        node.trace.active[thread_id] += 1
+    return node, thread_id, _current_node.set(node), time.perf_counter()
+
+
+def end_span(span) -> None:
+    if span is None:
+        return
+    node, thread_id, token, started = span
+    elapsed = time.perf_counter() - started
+    with node.trace.lock:
+        node.seconds += elapsed
+        node.calls += 1
+        node.trace.active[thread_id] -= 1
+    _current_node.reset(token)
+
+
+def add_span(name: str, seconds: float) -> None:
+    """이미 측정된 구간을 현재 span의 자식으로 기록"""
+    parent = _current_node.get()
+    if parent is None:
+        return
+    node = parent.child(name)
+    with node.trace.lock:
+        node.seconds += seconds
+        node.calls += 1
+
+
+@contextmanager
+def trace_span(name: str):
+    span = start_span(name)
+    try:
+        yield
+    finally:
+        end_span(span)
+
+
+def traced(name: str):
+    """함수 실행을 타이밍 트리 span으로 기록하는 데코레이터 (동기 / async 함수 모두 지원)"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                span = start_span(name)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    end_span(span)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            span = start_span(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end_span(span)
+        return wrapper
+    return decorator
+
+
+class SamplingProfiler:
+    """
+    요청을 처리 중인 스레드(이벤트 루프 + span 실행 중인 스레드풀 스레드)의 스택을 주기적으로 샘플링
+    - 이벤트 루프 스레드 샘플에는 같은 시간에 처리된 다른 요청과 대기(select) 도 섞일 수 있음
+    """
+
+    def __init__(self, trace: _Trace, interval: float = DEBUG_PROFILE_INTERVAL_SECONDS):
+        self.trace = trace
+        self.interval = interval
+        self.samples = 0
+        self._stacks = _Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="debug-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in self.trace.sample_threads():
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < 64:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self._stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def report(self, top_n: int = DEBUG_PROFILE_TOP_N) -> Dict[str, Any]:
+        """collapsed 스택 상위 N개 + 함수별 self 샘플 수"""
+        leaf = _Counter()
+        for stack, count in self._stacks.items():
+            leaf[stack[-1]] += count
+        return {
+            "samples": self.samples,
+            "interval_ms": round(self.interval * 1000, 2),
+            "top_functions": [{"function": name, "samples": count} for name, count in leaf.most_common(top_n)],
+            "top_stacks": [
+                {"stack": ";".join(stack), "samples": count} for stack, count in self._stacks.most_common(top_n)
+            ]
+        }
+
+
+def _is_authorized(headers: Dict[bytes, bytes]) -> bool:
+    """
+    DEBUG_TIMING_TOKEN과 일치하는 X-Debug-Token을 보낸 호출자 (토큰 미설정 시 모두 거부)
+    - 배포 환경의 호출자(Spring 컨테이너 등)는 모두 사설망 주소이므로 주소는 보지 않음
+    """
+    if not DEBUG_TIMING_TOKEN:
+        return False
+    token = headers.get(DEBUG_TOKEN_HEADER, b"").decode("latin-1")
+    return hmac.compare_digest(token, DEBUG_TIMING_TOKEN)
+
+
+def _requested_mode(scope, headers: Dict[bytes, bytes]) -> Optional[str]:
+    """요청한 디버그 모드 ("timing" / "profile", 요청하지 않았으면 None)"""
+    value = headers.get(DEBUG_TIMING_HEADER, b"").decode("latin-1")
+    if not value and scope.get("query_string"):
+        value = (parse_qs(scope["query_string"].decode("latin-1")).get(DEBUG_TIMING_QUERY) or [""])[0]
+    value = value.strip().lower()
+    if value in ("profile", "2"):
+        return "profile"
+    if value in ("1", "true", "timing"):
+        return "timing"
+    return None
+
+
+class DebugTimingMiddleware:
+    """
+    요청 단위 디버그 타이밍 ASGI 미들웨어
+    - X-Debug-Timing: 1 (또는 ?debug_timing=1) → 단계별 타이밍 트리
+    - X-Debug-Timing: profile → 타이밍 트리 + 샘플링 프로파일 리포트
+    - JSON 응답이면 본문의 "_debug" 키로 반환, 그 외(SSE 등) 는 요청 ID와 함께 로그로 기록
+    - 디버그 토큰이 일치하는 호출자만 허용하고, 요청하지 않은 요청은 그대로 통과 (span 함수는 컨텍스트 조회 한 번으로 종료)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not DEBUG_TIMING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or [])
+        mode = _requested_mode(scope, headers)
+        if mode is None or not _is_authorized(headers):
+            await self.app(scope, receive, send)
+            return
+
+        trace = _Trace()
+        token = _current_node.set(trace.root)
+        profiler = SamplingProfiler(trace) if mode == "profile" else None
+        if profiler is not None:
+            profiler.start()
+
+        started = time.perf_counter()
+        response = {"start": None, "body": [], "buffered": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                response["buffered"] = content_type.startswith(b"application/json")
+                if response["buffered"]:
+                    response["start"] = message
+                    return
+            elif message["type"] == "http.response.body" and response["buffered"]:
+                response["body"].append(message.get("body", b""))
+                return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_node.reset(token)
+            if profiler is not None:
+                profiler.stop()
+            trace.root.seconds = time.perf_counter() - started
+            trace.root.calls = 1
+
+        report = {"timing": trace.root.to_dict()}
+        if profiler is not None:
+            report["profile"] = profiler.report()
+
+        if not response["buffered"]:
+            logger.info("🔬 디버그 타이밍", extra=kv(path=scope["path"], **report))
+            return
+
+        body = b"".join(response["body"])
+        try:
+            data = json.loads(body)
+            if isinstance(data, dict):
+                data["_debug"] = report
+                body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            else:
+                logger.info("🔬 디버그 타이밍", extra=kv(path=scope["path"], **report))
+        except ValueError:
+            logger.info("🔬 디버그 타이밍", extra=kv(path=scope["path"], **report))
+
+        start = dict(response["start"])
+        start["headers"] = [
+            (name, value) for name, value in start.get("headers", []) if name.lower() != b"content-length"
+        ] + [(b"content-length", str(len(body)).encode())]
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
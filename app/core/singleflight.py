@@ -0,0 +1,82 @@
+# app/core/singleflight.py
+import asyncio
+import copy
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict
+
+from app.core.metrics import REGISTRY, stats_lines
+
+
+def make_request_key(*parts: Any, exact: bool = False) -> str:
+    """
+    요청 내용 정규화 키 (문자열은 공백 정규화 + 소문자, 나머지는 JSON 직렬화)
+    exact=True면 문자열을 그대로 사용 (입력 원문에 따라 결과가 달라지는 작업용)
+    """
+    def _normalize(value):
+        if isinstance(value, str) and not exact:
+            return " ".join(value.split()).lower()
+        if isinstance(value, (list, tuple)):
+            return [_normalize(v) for v in value]
+        return value
+
+    raw = json.dumps([_normalize(p) for p in parts], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    동일 요청 병합 (single-flight)
+    - 같은 키의 작업이 진행 중이면 새로 실행하지 않고 진행 중인 결과를 함께 기다림
+    - 작업이 끝나면 키를 지우므로 결과를 캐싱하지는 않음 (동시 요청만 병합)
+    - copy_result=True면 호출자마다 결과의 복사본을 반환 (호출자가 결과를 수정해도 서로 영향 없음)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight = {}
+        self._stats = {"executed": 0, "coalesced": 0, "errors": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]], copy_result: bool = False) -> Any:
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            # 대기 중인 요청이 취소되어도 공유 작업은 계속 진행
+            result = await asyncio.shield(future)
+            return copy.deepcopy(result) if copy_result else result
+
+        self._stats["executed"] += 1
+        future = asyncio.ensure_future(func())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        try:
+            result = await asyncio.shield(future)
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        return copy.deepcopy(result) if copy_result else result
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["in_flight"] = len(self._in_flight)
+        total = stats["executed"] + stats["coalesced"]
+        stats["coalesce_rate"] = round(stats["coalesced"] / total, 4) if total else 0.0
+        return stats
+
+
+# 용도별 single-flight 그룹 (통계를 따로 보기 위해 분리)
+recommend_flight = SingleFlight("recommend")
+scenario_flight = SingleFlight("scenario")
+pbti_flight = SingleFlight("pbti")
+llm_flight = SingleFlight("llm")
+
+
+def get_singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 single-flight 그룹 통계"""
+    return {
+        group.name: group.stats()
+        for group in (recommend_flight, scenario_flight, pbti_flight, llm_flight)
+    }
+
+
+REGISTRY.register_collector(lambda: stats_lines("singleflight", get_singleflight_stats(), label="group"))
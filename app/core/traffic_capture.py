@@ -0,0 +1,204 @@
+# app/core/traffic_capture.py
+# 트래픽 캡처 (요청 본문 + 처리 시간을 JSONL로 기록, benchmarks/replay.py로 다른 빌드에 재생)
+import atexit
+import json
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import (
+    TRAFFIC_CAPTURE_ENABLED,
+    TRAFFIC_CAPTURE_PATH,
+    TRAFFIC_CAPTURE_SAMPLE_RATE,
+    TRAFFIC_CAPTURE_MAX_MB,
+    TRAFFIC_CAPTURE_QUEUE_SIZE,
+    TRAFFIC_CAPTURE_MAX_BODY_BYTES,
+    TRAFFIC_CAPTURE_MAX_FIELD_LENGTH
+)
+from app.core.logger import get_logger, kv
+from app.core.metrics import REGISTRY, stats_lines
+from app.models.schemas import RecommendationRequest, PbtiRequest
+
+logger = get_logger("traffic")
+
+
+def _schema_fields(model) -> Tuple[str, ...]:
+    fields = getattr(model, "model_fields", None) or model.__fields__
+    return tuple(fields)
+
+
+# 캡처 대상 경로 → 기록할 요청 필드 (스키마에 없는 필드는 버림)
+CAPTURE_ROUTES = {
+    "/recommend/full": _schema_fields(RecommendationRequest),
+    "/pbti/full-result": _schema_fields(PbtiRequest)
+}
+
+
+def sanitize_body(raw: bytes, fields: Tuple[str, ...]) -> Optional[Dict[str, str]]:
+    """
+    요청 본문 정리 (JSON 파싱 실패 / 객체가 아니면 None)
+    - 스키마 필드만 남기고, 문자열로 바꾼 뒤 제어 문자 제거 + 최대 길이로 자름
+    """
+    try:
+        data = json.loads(raw)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    body = {}
+    for field in fields:
+        value = data.get(field)
+        if value is None:
+            continue
+        text = "".join(ch for ch in str(value) if ch.isprintable())
+        body[field] = text[:TRAFFIC_CAPTURE_MAX_FIELD_LENGTH]
+    return body
+
+
+class TrafficRecorder:
+    """
+    캡처 기록을 백그라운드 스레드에서 JSONL 파일에 추가
+    - 요청 경로에서는 큐에 넣기만 함 (가득 차면 버리고 dropped 증가)
+    - 파일이 max_bytes를 넘으면 <path>.1 로 교체 (이전 .1은 덮어씀)
+    """
+
+    def __init__(
+        self,
+        path: str = TRAFFIC_CAPTURE_PATH,
+        max_bytes: int = int(TRAFFIC_CAPTURE_MAX_MB * 1024 * 1024),
+        queue_size: int = TRAFFIC_CAPTURE_QUEUE_SIZE
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stats = {"recorded": 0, "dropped": 0, "skipped": 0, "rotations": 0, "write_errors": 0}
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="traffic-capture", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._stats["dropped"] += 1
+
+    def skip(self) -> None:
+        """본문이 너무 크거나 JSON이 아니어서 기록하지 않은 요청"""
+        self._stats["skipped"] += 1
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return open(self.path, "a", encoding="utf-8")
+
+    def _run(self) -> None:
+        f = None
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            try:
+                if f is None:
+                    f = self._open()
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                self._stats["recorded"] += 1
+                # 대기 중인 기록이 없을 때만 flush (몰릴 때는 한 번에 기록)
+                if self._queue.empty():
+                    f.flush()
+                    if f.tell() >= self.max_bytes:
+                        f.close()
+                        os.replace(self.path, self.path + ".1")
+                        self._stats["rotations"] += 1
+                        f = self._open()
+            except OSError as e:
+                self._stats["write_errors"] += 1
+                logger.warning("트래픽 캡처 기록 실패", extra=kv(path=self.path, error=str(e)))
+                if f is not None:
+                    f.close()
+                f = None
+        if f is not None:
+            f.close()
+
+    def close(self) -> None:
+        """남은 기록을 모두 쓰고 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "queued": self._queue.qsize()}
+
+
+traffic_recorder = TrafficRecorder()
+if TRAFFIC_CAPTURE_ENABLED:
+    REGISTRY.register_collector(lambda: stats_lines("traffic_capture", traffic_recorder.stats()))
+
+
+class TrafficCaptureMiddleware:
+    """
+    캡처 대상 경로의 요청 본문 / 응답 상태 / 처리 시간 기록 ASGI 미들웨어 (TRAFFIC_CAPTURE_ENABLED)
+    - 본문은 앱이 읽는 receive 메시지를 그대로 복사 (다시 읽지 않음)
+    - 기록: {"ts": 요청 시작 epoch, "path", "body", "status", "ms"} 한 줄 JSON
+    """
+
+    def __init__(self, app, recorder: TrafficRecorder = traffic_recorder, sample_rate: float = TRAFFIC_CAPTURE_SAMPLE_RATE):
+        self.app = app
+        self.recorder = recorder
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        fields = CAPTURE_ROUTES.get(scope["path"]) if scope["type"] == "http" else None
+        if fields is None or scope["method"] != "POST" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        requested_at = time.time()
+        started = time.perf_counter()
+        chunks = []
+        size = {"bytes": 0}
+        status = {"code": 500}
+
+        async def receive_wrapper():
+            message = await receive()
+            if message["type"] == "http.request" and size["bytes"] <= TRAFFIC_CAPTURE_MAX_BODY_BYTES:
+                body = message.get("body", b"")
+                size["bytes"] += len(body)
+                chunks.append(body)
+            return message
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            body = None
+            if size["bytes"] <= TRAFFIC_CAPTURE_MAX_BODY_BYTES:
+                body = sanitize_body(b"".join(chunks), fields)
+            if body is None:
+                self.recorder.skip()
+            else:
+                self.recorder.record({
+                    "ts": round(requested_at, 3),
+                    "path": scope["path"],
+                    "body": body,
+                    "status": status["code"],
+                    "ms": round((time.perf_counter() - started) * 1000, 1)
+                })
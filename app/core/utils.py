@@ -1,5 +1,6 @@
 # app/utils.py
 import boto3
+import json
 from io import BytesIO
 import os
 import pandas as pd
@@ -32,3 +33,11 @@ def safe_str(value) -> str:
         return str(value).replace("\n", " ").strip()
     except Exception:
         return ""
+
+def format_sse(event: str, data) -> str:
+    """
+    Server-Sent Events 메시지 한 건 생성
+    data는 JSON으로 직렬화 (한글 그대로 유지)
+    """
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
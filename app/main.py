@@ -1,17 +1,58 @@
 # app/main.py
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.routers import recommendations, pbti
+from app.routers import recommendations, pbti, metrics, health
+from app.core.http_metrics import HTTPMetricsMiddleware
+from app.core.logger import RequestContextMiddleware
+from app.core.profiling import DebugTimingMiddleware
+from app.services.pbti.job_queue import pbti_job_queue
+from app.core.loop_monitor import loop_monitor
+from app.core.llm_gateway import llm_gateway
+from app.core.traffic_capture import TrafficCaptureMiddleware
+from app.core.config import TRAFFIC_CAPTURE_ENABLED
+from app.services.warmup import start_warmup
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    시작: OpenAI 클라이언트 생성 + 이벤트 루프 모니터 + 추천기 병렬 워밍업 (백그라운드, 완료 여부는 /health/ready)
+    종료: 워밍업 중단, PBTI 작업 워커 / 이벤트 루프 모니터 정리
+    """
+    # 요청 처리 전에 클라이언트(SSL 컨텍스트 포함)를 만들어 첫 LLM 호출의 루프 정지 방지
+    llm_gateway.prepare()
+    if loop_monitor is not None:
+        loop_monitor.start()
+    warmup_task = start_warmup()
+    yield
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await pbti_job_queue.shutdown()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
 
 app = FastAPI(
     title="PerfumeOnMe FAST API",
     description="향수 추천 및 감성 시나리오 생성, PBTI API 통합",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# 요청 본문 / 처리 시간 캡처 (TRAFFIC_CAPTURE_ENABLED, benchmarks.replay 로 재생)
+if TRAFFIC_CAPTURE_ENABLED:
+    app.add_middleware(TrafficCaptureMiddleware)
+# HTTP 요청 지표 수집 (/metrics)
+app.add_middleware(HTTPMetricsMiddleware)
+# 요청 단위 디버그 타이밍 (X-Debug-Timing 헤더, DEBUG_TIMING_TOKEN 일치 호출자만)
+app.add_middleware(DebugTimingMiddleware)
+# 요청 ID / 단계별 처리 시간 컨텍스트 (가장 바깥에서 실행)
+app.add_middleware(RequestContextMiddleware)
+
 # 라우터 등록
 app.include_router(recommendations.router)
 app.include_router(pbti.router)
+app.include_router(metrics.router)
+app.include_router(health.router)
 
 @app.get("/")
 async def root():
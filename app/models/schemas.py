@@ -25,6 +25,7 @@ class FragranceRecommendation(BaseModel):
 class RecommendationResponse(BaseModel):
     scenario: str
     recommendations: List[FragranceRecommendation]
+    degraded: bool = False  # 시간 예산 초과/GPT 오류로 템플릿 시나리오를 사용한 경우 True
 
 # PBTI 전용 스키마들
 class PbtiRequest(BaseModel):
@@ -0,0 +1,36 @@
+# app/routers/health.py
+
+import time
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from app.services.warmup import readiness
+from typing import Dict, Any
+
+router = APIRouter(
+    prefix="/health",
+    tags=["health"],
+    responses={404: {"description": "Not found"}},
+)
+
+_process_started = time.monotonic()
+
+@router.get("/live")
+async def live() -> Dict[str, Any]:
+    """
+    Liveness 프로브
+
+    - 프로세스와 이벤트 루프가 응답하면 항상 200 (모델 로딩 중에도 200)
+    - 실패가 반복되면 컨테이너 재시작 대상
+    """
+    return {"status": "alive", "uptime_seconds": round(time.monotonic() - _process_started, 1)}
+
+@router.get("/ready")
+async def ready() -> JSONResponse:
+    """
+    Readiness 프로브
+
+    - 모든 추천기(TF-IDF, SBERT, Hybrid, PBTI) 생성 + 예열이 끝나면 200, 아니면 503
+    - components에 구성 요소별 상태, 로드 완료 시각(loaded_at), 걸린 시간(seconds), 실패 사유 포함
+    """
+    snapshot = readiness.snapshot()
+    return JSONResponse(snapshot, status_code=200 if readiness.is_ready() else 503)
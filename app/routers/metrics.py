@@ -0,0 +1,84 @@
+# app/routers/metrics.py
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from app.core.metrics import REGISTRY
+from app.core.llm_telemetry import llm_telemetry
+from app.core.llm_gateway import get_llm_gateway_stats
+from app.core.llm_cache import get_llm_cache_stats
+from app.core.loop_monitor import loop_monitor
+from app.core.model_registry import model_registry
+from typing import Dict, Any
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    Prometheus 스크랩 API (text format 0.0.4)
+
+    - HTTP 요청 수 / 처리 중 요청 수 / 처리 시간 (라우트 템플릿 경로별)
+    - 추천 파이프라인 단계별 처리 시간 히스토그램 (perfume_stage_duration_seconds)
+    - LLM 라우트별 호출 수 / 토큰 / 지연 시간 히스토그램, 서킷 브레이커 상태
+    - 캐시, 시나리오 풀, single-flight, PBTI 작업 큐 통계 (누적값도 gauge로 노출)
+    """
+    try:
+        return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"지표 조회 실패: {str(e)}")
+
+@router.get("/llm")
+async def llm_metrics(
+    recent: int = Query(0, ge=0, le=500, description="함께 반환할 최근 이벤트 개수")
+) -> Dict[str, Any]:
+    """
+    LLM 호출 텔레메트리 API
+
+    - 라우트별 호출 수, 오류 수, 사용 모델, prompt/completion 토큰 합계
+    - 라우트별 지연 시간 / 호출당 토큰 수 히스토그램 요약 (p50, p95, p99)
+    - GPT 응답 JSON 파싱 성공률, LLM 응답 캐시 hit rate
+    - 게이트웨이 상태 (동시 호출 수, 서킷 브레이커) 와 캐시 저장소 상태
+    - recent > 0 이면 최근 이벤트(call / parse / cache) 를 최신순으로 함께 반환
+    """
+    try:
+        return {
+            **llm_telemetry.snapshot(recent=recent),
+            "gateway": get_llm_gateway_stats(),
+            "cache": get_llm_cache_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"LLM 지표 조회 실패: {str(e)}")
+
+@router.get("/loop")
+async def loop_metrics(
+    recent: int = Query(5, ge=0, le=50, description="함께 반환할 최근 블로킹 기록 개수")
+) -> Dict[str, Any]:
+    """
+    이벤트 루프 지연 API
+
+    - tick 지연 히스토그램 요약 (p50, p95, p99, max)
+    - 블로킹 감지 횟수와 최근 블로킹 기록 (감지 시점 루프 스레드 스택, 실제 멈춘 시간)
+    """
+    try:
+        if loop_monitor is None:
+            return {"enabled": False}
+        return {**loop_monitor.stats(), "recent": loop_monitor.recent(recent)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이벤트 루프 지표 조회 실패: {str(e)}")
+
+@router.get("/models")
+async def model_metrics() -> Dict[str, Any]:
+    """
+    모델 레지스트리 API
+
+    - 모델별 출처(local / hub), 경로, 로드 시간, 파라미터 메모리, 로드 전후 RSS 증가량
+    - 아직 로드되지 않은 모델 목록 (lazy 정책)
+    """
+    try:
+        return model_registry.stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"모델 지표 조회 실패: {str(e)}")
@@ -1,8 +1,18 @@
 # app/routers/pbti.py
 
-from fastapi import APIRouter, HTTPException
+import json
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.core.config import PBTI_JOB_MAX_WAIT_SECONDS
 from app.models.schemas import PbtiRequest
-from app.services.pbti.pbti_service import get_full_pbti_result, get_pbti_status
+from app.services.pbti.pbti_service import (
+    get_full_pbti_result,
+    stream_pbti_result,
+    iter_pbti_sections,
+    get_pbti_status
+)
+from app.services.pbti.job_queue import pbti_job_queue, PbtiJobQueueFull
+from app.services.pbti.session import PbtiSession
 from typing import Dict, Any
 
 router = APIRouter(
@@ -33,6 +43,100 @@ async def full_result(request: PbtiRequest) -> Dict[str, Any]:
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PBTI 분석 실패: {str(e)}")
 
+@router.post("/full-result/stream")
+async def full_result_stream(request: PbtiRequest):
+    """
+    PBTI 결과 스트리밍 API (Server-Sent Events)
+    
+    - 향수 추천(perfumeRecommend)과 GPT 섹션(recommendation, keywords, perfumeStyle, scentPoint, summary)을
+      완료되는 순서대로 `section` 이벤트로 전송합니다. ({"name": ..., "value": ...})
+    - 마지막 `done` 이벤트에 실패(failed) / 시간 초과(timedOut) 섹션 목록을 담아 전송합니다.
+    
+    Args:
+        request (PbtiRequest): 8개 질문에 대한 답변
+    """
+    return StreamingResponse(
+        stream_pbti_result(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/jobs", status_code=202)
+async def submit_job(request: PbtiRequest) -> Dict[str, Any]:
+    """
+    PBTI 비동기 작업 제출 API
+    
+    - 답변을 대기열에 넣고 바로 작업 id를 반환합니다. (HTTP 연결을 분석 시간 동안 붙잡지 않음)
+    - 같은 답변 조합이 이미 대기/실행 중이면 그 작업의 id를 반환합니다.
+    - 결과는 GET /pbti/jobs/{jobId} 로 조회합니다.
+    
+    Returns:
+        Dict[str, Any]: {"jobId": str, "status": "queued" | "running" | ...}
+    """
+    try:
+        job = await pbti_job_queue.submit(request)
+    except PbtiJobQueueFull:
+        raise HTTPException(status_code=503, detail="PBTI 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+    return job.to_dict()
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=PBTI_JOB_MAX_WAIT_SECONDS, description="완료까지 최대 대기 시간(초, long-poll)")
+) -> Dict[str, Any]:
+    """
+    PBTI 비동기 작업 조회 API (poll / long-poll)
+    
+    - status가 done이면 result에 /pbti/full-result 와 같은 형식의 결과가 담깁니다.
+    - wait를 주면 작업이 끝나거나 wait초가 지날 때까지 기다렸다가 응답합니다.
+    - 완료 후 보관 기간이 지난 작업은 404를 반환합니다.
+    """
+    job = await pbti_job_queue.wait(job_id, wait)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job.to_dict()
+
+@router.websocket("/session")
+async def pbti_session(websocket: WebSocket):
+    """
+    PBTI 점진 세션 WebSocket API
+    
+    - 클라이언트 → 서버: {"question": "qOne" ~ "qEight", "answer": str} 를 답하는 대로 전송
+    - 서버 → 클라이언트: 답변마다 {"type": "profile", ...} 부분 프로필
+      (확정된 성향 축, 확정된 키워드, 가능한 최종 유형 목록)
+    - 8개 답변이 모두 모이면 {"type": "section", "name", "value"} 를 섹션 완료 순서대로 보내고
+      {"type": "done", "failed", "timedOut"} 후 연결 종료
+    - 잘못된 메시지는 {"type": "error", "detail"} 로 알리고 세션은 유지
+    """
+    await websocket.accept()
+    session = PbtiSession()
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                await websocket.send_json({"type": "error", "detail": "메시지를 JSON으로 해석할 수 없습니다."})
+                continue
+            if not isinstance(message, dict):
+                await websocket.send_json({"type": "error", "detail": "메시지는 JSON 객체여야 합니다."})
+                continue
+            try:
+                profile = session.update(message.get("question"), message.get("answer"))
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            await websocket.send_json({"type": "profile", **profile})
+            
+            if session.is_complete:
+                async for event, payload in iter_pbti_sections(session.to_request()):
+                    await websocket.send_json({"type": event, **payload})
+                break
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session.close()
+
 @router.get("/status")
 async def pbti_status() -> Dict[str, Any]:
     """
@@ -1,8 +1,15 @@
 # app/routers/recommendations.py
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.models.schemas import RecommendationRequest, RecommendationResponse
-from app.services.recommend_full import recommend_full
+from app.services.recommend_full import (
+    recommend_full,
+    recommend_full_stream,
+    get_recommend_status,
+    RecommendDeadlineExceeded
+)
+from typing import Dict, Any
 
 router = APIRouter(
     prefix="/recommend",
@@ -27,5 +34,41 @@ async def recommend_with_scenario(req: RecommendationRequest):
             season=req.season,
             personality=req.personality
         )
+    except RecommendDeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=f"추천 실패: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"추천 실패: {str(e)}")
+
+@router.post("/full/stream")
+async def recommend_with_scenario_stream(req: RecommendationRequest):
+    """
+    감성 시나리오 + 하이브리드 향수 추천 스트리밍 API (Server-Sent Events)
+
+    - 하이브리드 추천이 끝나는 즉시 `recommendations` 이벤트로 추천 목록을 전송합니다.
+    - 이어서 GPT가 생성하는 시나리오 토큰을 `scenario` 이벤트로 흘려보냅니다.
+    - 마지막에 `done` 이벤트로 완성된 시나리오를 전송합니다.
+    """
+    return StreamingResponse(
+        recommend_full_stream(
+            ambience=req.ambience,
+            style=req.style,
+            gender=req.gender,
+            season=req.season,
+            personality=req.personality
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/status")
+async def recommend_status() -> Dict[str, Any]:
+    """
+    추천 서비스 상태 확인 API (디버깅 및 헬스체크용)
+    
+    Returns:
+        Dict[str, Any]: 데이터/시나리오 풀 상태 정보
+    """
+    try:
+        return get_recommend_status()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"추천 실패: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"상태 확인 실패: {str(e)}")
\ No newline at end of file
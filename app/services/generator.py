@@ -1,10 +1,15 @@
 # app/generator.py
-from openai import OpenAI
 import os
+import random
+import re
+from typing import AsyncIterator, Optional
 from dotenv import load_dotenv
+from app.core.llm_gateway import llm_gateway
 
 load_dotenv()
 
+SCENARIO_SYSTEM_PROMPT = "당신은 감성적인 향기 시나리오를 쓰는 향수 작가입니다."
+
 def _create_prompt(keywords: list[str]) -> str:
     """프롬프트 생성 함수 (중복 제거)"""
     return (
@@ -19,23 +24,78 @@ def _create_prompt(keywords: list[str]) -> str:
         f"사람들 속에 섞여 있지만, 뚜렷한 개성과 고요한 존재감이 느껴져요."
     )
 
-def generate_scenario_sync(keywords: list[str], api_key: str) -> str:
-    """동기 버전 (ThreadPoolExecutor에서 사용)"""
-    client = OpenAI(api_key=api_key)
-    prompt = _create_prompt(keywords)
-    
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "당신은 감성적인 향기 시나리오를 쓰는 향수 작가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.85,
-            max_tokens=400
-        )
-        return response.choices[0].message.content.strip()
-    
-    except Exception as e:
-        print(f"[OpenAI Error] 시나리오 생성 중 문제 발생: {e}")
-        return "감성 시나리오 생성에 실패했어요. 다시 시도해주세요."
+async def generate_scenario(keywords: list[str], api_key: str, timeout: Optional[float] = None) -> str:
+    """
+    비동기 버전 (실패 시 예외를 그대로 전달 - 시나리오 풀/캐시에서 사용)
+    timeout을 주면 OpenAI 요청 자체에 남은 시간 예산을 전달
+    """
+    options = {"timeout": timeout} if timeout is not None else {}
+    response = await llm_gateway.chat(
+        route="scenario",
+        api_key=api_key,
+        messages=[
+            {"role": "system", "content": SCENARIO_SYSTEM_PROMPT},
+            {"role": "user", "content": _create_prompt(keywords)}
+        ],
+        **options
+    )
+    return response.choices[0].message.content.strip()
+
+async def stream_scenario(keywords: list[str], api_key: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+    """
+    스트리밍 버전 (모델이 생성하는 토큰 조각을 순서대로 반환, 실패 시 예외 전달)
+    timeout을 주면 OpenAI 요청 자체에 남은 시간 예산을 전달
+    """
+    options = {"timeout": timeout} if timeout is not None else {}
+    stream = llm_gateway.stream(
+        route="scenario",
+        api_key=api_key,
+        messages=[
+            {"role": "system", "content": SCENARIO_SYSTEM_PROMPT},
+            {"role": "user", "content": _create_prompt(keywords)}
+        ],
+        **options
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+# 로컬 템플릿 시나리오 (시간 예산 초과 / GPT 오류 시 대체용)
+_TEMPLATE_SCENARIOS = [
+    "{season}의 공기 속에서 {ambience} 분위기를 머금은 당신이 천천히 걸음을 옮겨요. "
+    "코끝에 닿는 {notes} 향이 {style} 당신의 모습을 은은하게 감싸요. "
+    "{personality} 당신만의 존재감이 오늘 하루를 조용히 빛나게 해줘요.",
+    "{ambience} 기운이 가득한 {season}의 어느 날, {style} 차림의 당신이 문을 나서요. "
+    "스치듯 퍼지는 {notes} 향기가 당신의 발걸음을 따라 부드럽게 번져요. "
+    "{personality} 당신의 분위기가 주변을 한층 따뜻하게 물들여요.",
+    "{season} 햇살 아래, {ambience} 무드 속의 당신이 잠시 숨을 골라요. "
+    "손목에서 피어오르는 {notes} 향이 {style} 당신의 인상을 또렷하게 남겨요. "
+    "{personality} 당신의 모습이 사람들의 기억 속에 오래 머물러요.",
+]
+
+def _collect_notes(recommendations: list[dict], limit: int = 3) -> list[str]:
+    """추천 향수들의 탑 → 미들 → 베이스 노트 순으로 중복 없이 노트 이름 수집"""
+    notes = []
+    for field in ("topNote", "middleNote", "baseNote"):
+        for item in recommendations:
+            for note in re.split(r"[,/·\s]+", item.get(field, "") or ""):
+                if note and note not in notes:
+                    notes.append(note)
+                if len(notes) >= limit:
+                    return notes
+    return notes
+
+def build_template_scenario(keywords: list[str], recommendations: list[dict]) -> str:
+    """
+    GPT 없이 키워드 조합 + 추천 향수 노트로 감성 시나리오 생성
+    (성별 키워드는 프롬프트 규칙과 같이 사용하지 않음)
+    """
+    ambience, style, _gender, season, personality = keywords
+    notes = _collect_notes(recommendations)
+    return random.choice(_TEMPLATE_SCENARIOS).format(
+        ambience=ambience,
+        style=style,
+        season=season,
+        personality=personality,
+        notes=", ".join(notes) if notes else "은은한"
+    )
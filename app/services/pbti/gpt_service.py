@@ -2,23 +2,29 @@
 
 import json
 import re
-from openai import OpenAI
-from app.models.schemas import PbtiRequest
-from app.core.config import settings, PBTI_GPT_MODEL, PBTI_GPT_TEMPERATURE
-from app.services.pbti.mbti_analyzer import calculate_keywords_by_text
+from typing import Any, Dict, List, Optional, Tuple
+from app.models.schemas import PbtiRequest, PbtiKeyword, PbtiPerfumeStyle, PbtiScentPoint
+from app.core.config import PBTI_SECTION_RETRY_LIMIT
+from app.core.llm_cache import get_llm_cache, make_cache_key
+from app.core.singleflight import llm_flight
+from app.core.llm_gateway import llm_gateway, get_llm_route
+from app.core.llm_telemetry import llm_telemetry
+from app.core.logger import get_logger, kv
+from app.services.pbti.mbti_analyzer import calculate_keywords_by_text, get_answers
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+# OpenAI 호출은 공통 LLM 게이트웨이(app/core/llm_gateway.py)를 통해 수행
+# (동시성 제한, 서킷 브레이커, hedged request)
+# 모델 / max_tokens / temperature는 섹션별 라우트(config.LLM_ROUTES의 "pbti.<섹션>")로 결정
+
+logger = get_logger("pbti")
+
+SYSTEM_PROMPT = "정확한 JSON만 출력하는 향수 분석가입니다."
 
 # GPT 병렬 호출용 프롬프트 함수들 (pbti.py 274~454줄)
+# keywords를 넘기면 calculate_keywords_by_text 재계산을 생략 (요청당 한 번만 계산)
 
-def prompt_recommendation(request: PbtiRequest) -> str:
-    answers = [
-        request.qOne, request.qTwo, request.qThree, request.qFour,
-        request.qFive, request.qSix, request.qSeven, request.qEight
-    ]
-    keywords = calculate_keywords_by_text(answers)
-    
+def _user_context(request: PbtiRequest, keywords: List[str]) -> str:
+    """모든 프롬프트에 공통으로 들어가는 답변 + 키워드 블록"""
     return f"""
 아래는 사용자가 향수 성향 테스트에 응답한 결과입니다.:
 Q1: {request.qOne}
@@ -36,162 +42,88 @@ keyword2: {keywords[1]}
 keyword3: {keywords[2]}
 keyword4: {keywords[3]}
 
-각 질문에 대한 사용자의 답변과 키워드를 분석하여 'recommendation' 필드만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
+"""
+
+def prompt_recommendation(request: PbtiRequest, keywords: Optional[List[str]] = None) -> str:
+    if keywords is None:
+        keywords = calculate_keywords_by_text(get_answers(request))
+    
+    return _user_context(request, keywords) + """각 질문에 대한 사용자의 답변과 키워드를 분석하여 'recommendation' 필드만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
 추가로 "recommendation"은 '당신은' 으로 시작되도록 하세요. 예시 정도의 분량으로 출력하세요.
 예시:
-{{"recommendation": "당신은 어디서든 존재감을 뽐내는 리더 타입!
-밝고 또렷한 향이 당신의 에너지를 더 빛나게 해줄 거예요."}}
+{"recommendation": "당신은 어디서든 존재감을 뽐내는 리더 타입!
+밝고 또렷한 향이 당신의 에너지를 더 빛나게 해줄 거예요."}
 """
 
-def prompt_keywords(request: PbtiRequest) -> str:
-    answers = [
-        request.qOne, request.qTwo, request.qThree, request.qFour,
-        request.qFive, request.qSix, request.qSeven, request.qEight
-    ]
-    keywords = calculate_keywords_by_text(answers)
+def prompt_keywords(request: PbtiRequest, keywords: Optional[List[str]] = None) -> str:
+    if keywords is None:
+        keywords = calculate_keywords_by_text(get_answers(request))
     
-    return f"""
-아래는 사용자가 향수 성향 테스트에 응답한 결과입니다.:
-Q1: {request.qOne}
-Q2: {request.qTwo}
-Q3: {request.qThree}
-Q4: {request.qFour}
-Q5: {request.qFive}
-Q6: {request.qSix}
-Q7: {request.qSeven}
-Q8: {request.qEight}
-
-이 사용자는 다음과 같은 향수 성향 키워드를 가지고 있습니다:
-keyword1: {keywords[0]}
-keyword2: {keywords[1]}
-keyword3: {keywords[2]}
-keyword4: {keywords[3]}
-
-이 키워드 각각에 대해 향수 성향 기반 설명(keywordDescription)을 작성하세요. 각 키워드는 다음 JSON 형식의 "keywords" 필드에 배열로 포함되어야 합니다.
+    return _user_context(request, keywords) + """이 키워드 각각에 대해 향수 성향 기반 설명(keywordDescription)을 작성하세요. 각 키워드는 다음 JSON 형식의 "keywords" 필드에 배열로 포함되어야 합니다.
 또한 각 keywords 배열의 "keyword"는 위의 향수 성향 키워드에서 그대로 사용하세요. GPT가 임의로 바꾸지 마세요.
 
 아래 JSON 예시처럼, "keywords" 배열에 4개 항목을 포함하세요. JSON 데이터만 정확하게 출력해주세요.
 예시:
-{{
+{
   "keywords": [
-    {{"keyword": "...", "keywordDescription": "..."}},
-    {{"keyword": "...", "keywordDescription": "..."}},
-    {{"keyword": "...", "keywordDescription": "..."}},
-    {{"keyword": "...", "keywordDescription": "..."}}
+    {"keyword": "...", "keywordDescription": "..."},
+    {"keyword": "...", "keywordDescription": "..."},
+    {"keyword": "...", "keywordDescription": "..."},
+    {"keyword": "...", "keywordDescription": "..."}
   ]
-}}
+}
 """
 
-def prompt_perfume_style(request: PbtiRequest) -> str:
-    answers = [
-        request.qOne, request.qTwo, request.qThree, request.qFour,
-        request.qFive, request.qSix, request.qSeven, request.qEight
-    ]
-    keywords = calculate_keywords_by_text(answers)
+def prompt_perfume_style(request: PbtiRequest, keywords: Optional[List[str]] = None) -> str:
+    if keywords is None:
+        keywords = calculate_keywords_by_text(get_answers(request))
     
-    return f"""
-아래는 사용자가 향수 성향 테스트에 응답한 결과입니다.:
-Q1: {request.qOne}
-Q2: {request.qTwo}
-Q3: {request.qThree}
-Q4: {request.qFour}
-Q5: {request.qFive}
-Q6: {request.qSix}
-Q7: {request.qSeven}
-Q8: {request.qEight}
-
-이 사용자는 다음과 같은 향수 성향 키워드를 가지고 있습니다:
-keyword1: {keywords[0]}
-keyword2: {keywords[1]}
-keyword3: {keywords[2]}
-keyword4: {keywords[3]}
-
-각 질문에 대한 사용자의 답변과 키워드를 분석하여 'perfumeStyle' 객체만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
+    return _user_context(request, keywords) + """각 질문에 대한 사용자의 답변과 키워드를 분석하여 'perfumeStyle' 객체만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
 추가로 "perfumeStyle" 내 "notes" 배열에는 5개 항목을 포함하세요.
 그리고 category의 예시는 '시트러스', '우디' 등의 실제 존재하는 노트를 예시로 들어주고 한국어로 출력하세요.
 "description"은 ~향기로 끝나도록 해주세요. 마지막으로 예시 정도의 분량으로 출력하세요.
 예시:
-{{
-  "perfumeStyle": {{
+{
+  "perfumeStyle": {
     "description": "선명하고 또렷한 인상을 남기는 향기",
     "notes": [
-      {{"category": "시트러스", "categoryDescription": "상쾌하고 활기찬 에너지"}},
-      {{"category": "앰버", "categoryDescription": "깊이 있는 고급스러운 마무리"}},
-      {{"category": "...", "categoryDescription": "..."}},
-      {{"category": "...", "categoryDescription": "..."}},
-      {{"category": "...", "categoryDescription": "..."}}
+      {"category": "시트러스", "categoryDescription": "상쾌하고 활기찬 에너지"},
+      {"category": "앰버", "categoryDescription": "깊이 있는 고급스러운 마무리"},
+      {"category": "...", "categoryDescription": "..."},
+      {"category": "...", "categoryDescription": "..."},
+      {"category": "...", "categoryDescription": "..."}
     ]
-  }}
-}}
+  }
+}
 """
 
-def prompt_scent_point(request: PbtiRequest) -> str:
-    answers = [
-        request.qOne, request.qTwo, request.qThree, request.qFour,
-        request.qFive, request.qSix, request.qSeven, request.qEight
-    ]
-    keywords = calculate_keywords_by_text(answers)
+def prompt_scent_point(request: PbtiRequest, keywords: Optional[List[str]] = None) -> str:
+    if keywords is None:
+        keywords = calculate_keywords_by_text(get_answers(request))
     
-    return f"""
-아래는 사용자가 향수 성향 테스트에 응답한 결과입니다.:
-Q1: {request.qOne}
-Q2: {request.qTwo}
-Q3: {request.qThree}
-Q4: {request.qFour}
-Q5: {request.qFive}
-Q6: {request.qSix}
-Q7: {request.qSeven}
-Q8: {request.qEight}
-
-이 사용자는 다음과 같은 향수 성향 키워드를 가지고 있습니다:
-keyword1: {keywords[0]}
-keyword2: {keywords[1]}
-keyword3: {keywords[2]}
-keyword4: {keywords[3]}
-
-각 질문에 대한 사용자의 답변과 키워드를 분석하여 'scentPoint' 배열만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
+    return _user_context(request, keywords) + """각 질문에 대한 사용자의 답변과 키워드를 분석하여 'scentPoint' 배열만 JSON으로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
 그리고 category의 예시는 '시트러스', '우디' 등의 실제 존재하는 노트를 예시로 들어주고 한국어로 출력하세요.
 "scentPoint" 배열 내의 "point"는 사용자와 잘 어울릴 수록 숫자를 크게 부여하고 숫자가 큰 순서대로 출력해주세요. "scentPoint" 배열에는 5개 항목을 포함하세요.
 예시:
-{{
+{
   "scentPoint": [
-    {{"category": "...", "point": 5}},
-    {{"category": "...", "point": 4}},
-    {{"category": "...", "point": 3}},
-    {{"category": "...", "point": 2}},
-    {{"category": "...", "point": 1}}
+    {"category": "...", "point": 5},
+    {"category": "...", "point": 4},
+    {"category": "...", "point": 3},
+    {"category": "...", "point": 2},
+    {"category": "...", "point": 1}
   ]
-}}
+}
 """
 
-def prompt_summary(request: PbtiRequest) -> str:
-    answers = [
-        request.qOne, request.qTwo, request.qThree, request.qFour,
-        request.qFive, request.qSix, request.qSeven, request.qEight
-    ]
-    keywords = calculate_keywords_by_text(answers)
+def prompt_summary(request: PbtiRequest, keywords: Optional[List[str]] = None) -> str:
+    if keywords is None:
+        keywords = calculate_keywords_by_text(get_answers(request))
     
-    return f"""
-아래는 사용자가 향수 성향 테스트에 응답한 결과입니다.:
-Q1: {request.qOne}
-Q2: {request.qTwo}
-Q3: {request.qThree}
-Q4: {request.qFour}
-Q5: {request.qFive}
-Q6: {request.qSix}
-Q7: {request.qSeven}
-Q8: {request.qEight}
-
-이 사용자는 다음과 같은 향수 성향 키워드를 가지고 있습니다:
-keyword1: {keywords[0]}
-keyword2: {keywords[1]}
-keyword3: {keywords[2]}
-keyword4: {keywords[3]}
-
-각 질문에 대한 사용자의 답변과 키워드를 분석하여 'summary' 필드만 JSON 문자열로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
+    return _user_context(request, keywords) + """각 질문에 대한 사용자의 답변과 키워드를 분석하여 'summary' 필드만 JSON 문자열로 출력하세요. JSON 데이터만 정확하게 출력해주세요.
 추가로 "summary"는 사용자의 성격이 반영되는 단어가 들어가도록 간단하게 요약해주세요. 예시 정도의 분량으로 출력하세요.
 예시:
-{{"summary": "사람들과의 에너지 흐름을 잘 이끌어내는 계획형 외향인" }}
+{"summary": "사람들과의 에너지 흐름을 잘 이끌어내는 계획형 외향인" }
 """
 
 # JSON 추출 함수 (pbti.py 456~463줄)
@@ -204,20 +136,254 @@ def extract_json(text: str) -> str:
     # 코드블록 없으면 원본 반환
     return text
 
+def parse_gpt_json(text: str) -> Optional[dict]:
+    """GPT 응답 텍스트를 dict로 파싱 (실패 시 None)"""
+    try:
+        data = json.loads(extract_json(text))
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def section_route(section: str) -> str:
+    """PBTI 섹션의 LLM 라우트 이름"""
+    return f"pbti.{section}"
+
+def prompt_cache_key(prompt: str, route: str, sections: Optional[List[str]] = None) -> str:
+    """PBTI 프롬프트의 LLM 캐시 키 (라우트의 모델/온도, 요청 섹션 포함)"""
+    params = get_llm_route(route)
+    extra = f"temperature={params['temperature']}"
+    if sections:
+        extra += f"|sections={','.join(sections)}"
+    return make_cache_key(params["model"], prompt, extra)
+
 # GPT 비동기 호출 함수 (pbti.py 465~480줄)
-async def call_gpt_async(prompt: str) -> dict:
-    response = client.chat.completions.create(
-        model=PBTI_GPT_MODEL,
-        messages=[
-            {"role": "system", "content": "정확한 JSON만 출력하는 향수 분석가입니다."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=PBTI_GPT_TEMPERATURE
+async def call_gpt_async(prompt: str, route: str) -> dict:
+    # 캐시에 변형이 충분히 쌓여 있으면 그중 하나 반환
+    cache = get_llm_cache()
+    cache_key = prompt_cache_key(prompt, route)
+    if cache is not None:
+        cached = await cache.aget(cache_key)
+        llm_telemetry.record_cache(route, cached is not None)
+        if cached is not None:
+            return cached
+
+    async def _request() -> dict:
+        response = await llm_gateway.chat(
+            route=route,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        text = response.choices[0].message.content.strip()
+
+        data = parse_gpt_json(text)
+        llm_telemetry.record_parse(route, data is not None)
+        if data and cache is not None:
+            await cache.aput(cache_key, data)
+        return data or {}
+
+    # 같은 프롬프트가 동시에 들어오면 GPT 호출 한 번을 공유
+    return await llm_flight.do(cache_key, _request)
+
+# =============================================================================
+# 단일 호출 모드 (PBTI_GPT_MODE = "single")
+# - 5개 섹션을 structured output(JSON schema, strict) 한 번의 호출로 요청
+# - 섹션별 검증 후 실패한 섹션만 다시 요청
+# =============================================================================
+
+PBTI_SECTIONS = ["recommendation", "keywords", "perfumeStyle", "scentPoint", "summary"]
+PBTI_SECTIONS_ROUTE = "pbti.sections"
+
+# 섹션별 배열 항목 수 (기존 섹션 프롬프트 / 응답 형식과 동일)
+PBTI_KEYWORD_COUNT = 4
+PBTI_NOTE_COUNT = 5
+PBTI_SCENT_POINT_COUNT = 5
+
+# 섹션별 JSON schema (strict 모드: 모든 필드 required + additionalProperties false)
+# strict 모드는 minItems / maxItems를 보장하지 않으므로 항목 수는 description으로 안내하고 validate_section에서 검증
+PBTI_SECTION_SCHEMAS = {
+    "recommendation": {"type": "string"},
+    "keywords": {
+        "type": "array",
+        "description": f"정확히 {PBTI_KEYWORD_COUNT}개 항목",
+        "items": {
+            "type": "object",
+            "properties": {
+                "keyword": {"type": "string"},
+                "keywordDescription": {"type": "string"}
+            },
+            "required": ["keyword", "keywordDescription"],
+            "additionalProperties": False
+        }
+    },
+    "perfumeStyle": {
+        "type": "object",
+        "properties": {
+            "description": {"type": "string"},
+            "notes": {
+                "type": "array",
+                "description": f"정확히 {PBTI_NOTE_COUNT}개 항목",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "category": {"type": "string"},
+                        "categoryDescription": {"type": "string"}
+                    },
+                    "required": ["category", "categoryDescription"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["description", "notes"],
+        "additionalProperties": False
+    },
+    "scentPoint": {
+        "type": "array",
+        "description": f"정확히 {PBTI_SCENT_POINT_COUNT}개 항목",
+        "items": {
+            "type": "object",
+            "properties": {
+                "category": {"type": "string"},
+                "point": {"type": "integer"}
+            },
+            "required": ["category", "point"],
+            "additionalProperties": False
+        }
+    },
+    "summary": {"type": "string"}
+}
+
+# 섹션별 작성 지침 (기존 섹션 프롬프트의 요구사항을 한 줄씩 요약)
+PBTI_SECTION_GUIDES = {
+    "recommendation": '"recommendation": \'당신은\' 으로 시작하는 두 문장 정도의 성향 설명',
+    "keywords": f'"keywords": 위 {PBTI_KEYWORD_COUNT}개 키워드 각각에 대한 향수 성향 기반 설명(keywordDescription), 정확히 {PBTI_KEYWORD_COUNT}개 항목. "keyword"는 위의 키워드를 그대로 사용하고 임의로 바꾸지 마세요.',
+    "perfumeStyle": f'"perfumeStyle": "description"은 ~향기로 끝나는 한 문장, "notes"는 \'시트러스\', \'우디\' 등 실제 존재하는 노트(한국어) 정확히 {PBTI_NOTE_COUNT}개와 각 categoryDescription',
+    "scentPoint": f'"scentPoint": 실제 존재하는 노트(한국어) category 정확히 {PBTI_SCENT_POINT_COUNT}개와 사용자와 어울리는 정도 point. 잘 어울릴수록 큰 숫자를 부여하고 숫자가 큰 순서대로 출력',
+    "summary": '"summary": 사용자의 성격이 반영되는 단어가 들어간 한 줄 요약 (예: 사람들과의 에너지 흐름을 잘 이끌어내는 계획형 외향인)'
+}
+
+def build_pbti_profile(request: PbtiRequest) -> Dict[str, Any]:
+    """요청당 한 번만 계산하는 파생 프로필 (답변 + 성향 키워드)"""
+    answers = get_answers(request)
+    return {
+        "answers": answers,
+        "keywords": calculate_keywords_by_text(answers)
+    }
+
+def prompt_sections(request: PbtiRequest, keywords: List[str], sections: List[str]) -> str:
+    """지정한 섹션들을 하나의 JSON 객체로 요청하는 통합 프롬프트"""
+    guides = "\n".join(f"- {PBTI_SECTION_GUIDES[section]}" for section in sections)
+    return _user_context(request, keywords) + (
+        "각 질문에 대한 사용자의 답변과 키워드를 분석하여 아래 항목들을 하나의 JSON 객체로 출력하세요.\n"
+        f"{guides}\n"
     )
-    text = response.choices[0].message.content.strip()
 
-    json_str = extract_json(text)
+def _build_response_format(sections: List[str]) -> Dict[str, Any]:
+    """요청 섹션만 포함하는 strict JSON schema response_format"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "pbti_analysis",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {section: PBTI_SECTION_SCHEMAS[section] for section in sections},
+                "required": list(sections),
+                "additionalProperties": False
+            }
+        }
+    }
+
+def validate_section(section: str, value: Any) -> bool:
+    """섹션 값이 응답 스키마(PbtiFullResponse의 해당 필드)와 항목 수에 맞는지 검증 (실패 시 재요청 대상)"""
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError:
-        return {}
\ No newline at end of file
+        if section in ("recommendation", "summary"):
+            return isinstance(value, str) and bool(value.strip())
+        if section == "keywords":
+            return (isinstance(value, list) and len(value) == PBTI_KEYWORD_COUNT
+                    and all(PbtiKeyword(**item) for item in value))
+        if section == "perfumeStyle":
+            return isinstance(value, dict) and len(PbtiPerfumeStyle(**value).notes) == PBTI_NOTE_COUNT
+        if section == "scentPoint":
+            return (isinstance(value, list) and len(value) == PBTI_SCENT_POINT_COUNT
+                    and all(PbtiScentPoint(**item) for item in value))
+    except (TypeError, ValueError):
+        # pydantic ValidationError는 ValueError 하위 클래스
+        return False
+    return False
+
+def split_valid_sections(data: Optional[dict], sections: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """파싱 결과를 (검증 통과 섹션, 실패 섹션 목록)으로 분리"""
+    valid, failed = {}, []
+    for section in sections:
+        value = (data or {}).get(section)
+        if validate_section(section, value):
+            valid[section] = value
+        else:
+            failed.append(section)
+    return valid, failed
+
+def sections_max_tokens(sections: List[str]) -> int:
+    """통합 호출의 출력 토큰 예산 (요청 섹션별 라우트 예산의 합)"""
+    return sum(get_llm_route(section_route(section))["max_tokens"] or 0 for section in sections)
+
+async def call_gpt_sections_async(request: PbtiRequest, keywords: List[str], sections: List[str]) -> Optional[dict]:
+    """지정 섹션들을 structured output 한 번의 호출로 요청"""
+    prompt = prompt_sections(request, keywords, sections)
+    cache = get_llm_cache()
+    cache_key = prompt_cache_key(prompt, PBTI_SECTIONS_ROUTE, sections)
+    if cache is not None:
+        cached = await cache.aget(cache_key)
+        llm_telemetry.record_cache(PBTI_SECTIONS_ROUTE, cached is not None)
+        if cached is not None:
+            return cached
+
+    async def _request() -> Optional[dict]:
+        response = await llm_gateway.chat(
+            route=PBTI_SECTIONS_ROUTE,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=sections_max_tokens(sections) or None,
+            response_format=_build_response_format(sections)
+        )
+        data = parse_gpt_json(response.choices[0].message.content or "")
+        llm_telemetry.record_parse(PBTI_SECTIONS_ROUTE, data is not None)
+
+        # 모든 섹션이 검증을 통과한 응답만 캐시
+        if cache is not None and not split_valid_sections(data, sections)[1]:
+            await cache.aput(cache_key, data)
+        return data
+
+    return await llm_flight.do(cache_key, _request)
+
+async def call_gpt_single_async(request: PbtiRequest, profile: Optional[Dict[str, Any]] = None) -> dict:
+    """
+    단일 호출 모드 PBTI 분석
+    - 5개 섹션을 한 번에 요청하고, 검증에 실패한 섹션만 재요청
+    - 재요청 한도를 넘겨도 실패한 섹션은 결과에서 제외
+    """
+    if profile is None:
+        profile = build_pbti_profile(request)
+    keywords = profile["keywords"]
+
+    result = {}
+    pending = list(PBTI_SECTIONS)
+    for attempt in range(PBTI_SECTION_RETRY_LIMIT + 1):
+        try:
+            data = await call_gpt_sections_async(request, keywords, pending)
+        except Exception as e:
+            logger.error("PBTI 통합 분석 호출 실패", extra=kv(attempt=attempt + 1, error=f"{type(e).__name__}: {e}"))
+            data = None
+
+        valid, pending = split_valid_sections(data, pending)
+        result.update(valid)
+        if not pending:
+            break
+        logger.warning("⚠️ PBTI 섹션 검증 실패 - 재요청", extra=kv(attempt=attempt + 1, sections=",".join(pending)))
+
+    if pending:
+        logger.error("❌ PBTI 섹션 최종 실패", extra=kv(sections=",".join(pending)))
+    return result
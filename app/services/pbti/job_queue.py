@@ -0,0 +1,166 @@
+# app/services/pbti/job_queue.py
+
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.core.metrics import REGISTRY, stats_lines
+from app.core.config import PBTI_JOB_WORKERS, PBTI_JOB_MAX_QUEUE_SIZE, PBTI_JOB_RESULT_TTL_SECONDS
+from app.core.logger import get_logger, kv
+from app.models.schemas import PbtiRequest
+from app.services.pbti.pbti_service import get_full_pbti_result, request_key
+
+logger = get_logger("pbti")
+
+
+class PbtiJobQueueFull(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없음"""
+
+
+class PbtiJob:
+    """PBTI 비동기 작업 하나의 상태"""
+
+    def __init__(self, request: PbtiRequest, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.request = request
+        self.status = "queued"  # queued → running → done / failed
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.done_event = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"jobId": self.id, "status": self.status}
+        if self.status == "done":
+            data["result"] = self.result
+        elif self.status == "failed":
+            data["error"] = self.error
+        return data
+
+
+class PbtiJobQueue:
+    """
+    PBTI 작업 큐 (프로세스 내부)
+    - 고정 개수의 워커가 대기열에서 작업을 꺼내 get_full_pbti_result 실행
+    - 같은 답변 조합이 대기/실행 중이면 새 작업을 만들지 않고 기존 작업 id 반환
+    - 완료된 작업 결과는 result_ttl 동안만 보관
+    """
+
+    def __init__(
+        self,
+        worker_count: int = PBTI_JOB_WORKERS,
+        max_queue_size: int = PBTI_JOB_MAX_QUEUE_SIZE,
+        result_ttl: float = PBTI_JOB_RESULT_TTL_SECONDS
+    ):
+        self.worker_count = worker_count
+        self.max_queue_size = max_queue_size
+        self.result_ttl = result_ttl
+        self._jobs = {}        # job id → PbtiJob
+        self._in_flight = {}   # request key → 대기/실행 중인 PbtiJob
+        self._queue = None
+        self._workers = []
+        self._stats = {"submitted": 0, "deduplicated": 0, "completed": 0, "failed": 0, "rejected": 0}
+
+    def _ensure_started(self) -> None:
+        """워커는 이벤트 루프 안에서 최초 제출 시 시작"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if not self._workers:
+            self._workers = [
+                asyncio.ensure_future(self._worker(i)) for i in range(self.worker_count)
+            ]
+
+    async def submit(self, request: PbtiRequest) -> PbtiJob:
+        """작업 제출 (동일 답변 조합이 진행 중이면 그 작업 반환)"""
+        self._ensure_started()
+        self._purge_expired()
+
+        key = request_key(request)
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            self._stats["deduplicated"] += 1
+            return existing
+
+        job = PbtiJob(request, key)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            raise PbtiJobQueueFull()
+
+        self._jobs[job.id] = job
+        self._in_flight[key] = job
+        self._stats["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[PbtiJob]:
+        self._purge_expired()
+        return self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[PbtiJob]:
+        """long-poll: 작업이 끝나거나 timeout이 지날 때까지 대기"""
+        job = self.get(job_id)
+        if job is None or job.finished or timeout <= 0:
+            return job
+        try:
+            await asyncio.wait_for(job.done_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return job
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = "running"
+            try:
+                job.result = await get_full_pbti_result(job.request)
+                job.status = "done"
+                self._stats["completed"] += 1
+            except Exception as e:
+                logger.error("❌ PBTI 작업 실패", extra=kv(job_id=job.id, error=f"{type(e).__name__}: {e}"))
+                job.error = f"PBTI 분석 실패: {str(e)}"
+                job.status = "failed"
+                self._stats["failed"] += 1
+            finally:
+                job.finished_at = time.time()
+                job.request = None
+                self._in_flight.pop(job.key, None)
+                job.done_event.set()
+                self._queue.task_done()
+
+    def _purge_expired(self) -> None:
+        """결과 보관 기간이 지난 완료 작업 삭제"""
+        expire_before = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at < expire_before
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def shutdown(self) -> None:
+        """워커 종료 (서버 종료 시)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize() if self._queue is not None else 0
+        stats["in_flight"] = len(self._in_flight)
+        stats["stored"] = len(self._jobs)
+        stats["workers"] = len(self._workers)
+        return stats
+
+
+# 전역 작업 큐
+pbti_job_queue = PbtiJobQueue()
+REGISTRY.register_collector(lambda: stats_lines("pbti_jobs", pbti_job_queue.stats()))
@@ -1,7 +1,8 @@
 # app/services/pbti/mbti_analyzer.py
 
 from app.models.schemas import PbtiRequest
-from typing import List
+from itertools import product
+from typing import Dict, List, Optional
 
 # MBTI 성향별 설명 딕셔너리
 mbti_trait_descriptions = {
@@ -26,52 +27,98 @@ mbti_trait_descriptions = {
     "JP": "They embody both structure and adaptability — capable of planning while staying flexible."
 }
 
+# PbtiRequest 필드명 (질문 순서)
+QUESTION_FIELDS = ["qOne", "qTwo", "qThree", "qFour", "qFive", "qSix", "qSeven", "qEight"]
+
+# 성향 축별 판별 규칙: (축 이름, 질문 인덱스 2개, 첫 성향 단어, 두 번째 성향 단어)
+# determine_mbti_type / calculate_keywords_by_text / determine_partial_profile 이 공유
+AXIS_RULES = [
+    ("EI", (0, 1), {0: ["칫솔을", "바로"], 1: ["버튼", "분사해"]}, {0: ["수건으로", "닦고"], 1: ["중간에", "내리는"]}),
+    ("SN", (2, 3), {2: ["알림처럼", "미리"], 3: ["신호가 바뀌기 직전", "분사해"]}, {2: ["버스가", "가방에서 꺼내"], 3: ["기다리다", "향이 옅어지면"]}),
+    ("TF", (4, 5), {4: ["공간", "퍼뜨린다"], 5: ["목줄", "가볍게"]}, {4: ["기분", "헹굴 때마다"], 5: ["손목에", "레이어링한다"]}),
+    ("JP", (6, 7), {6: ["리모컨을", "채널을 돌리며"], 7: ["이불 위에서", "잔향을"]}, {6: ["광고가", "확실히"], 7: ["중앙에서", "톡톡"]}),
+]
+
+# 축 판별 결과 → 성향 키워드
+AXIS_KEYWORDS = {
+    "E": "긍정적 임팩트를 가진 당신", "I": "은은한 집중형인 당신", "EI": "외향과 내향의 균형을 지닌 당신",
+    "S": "촉각에 민감한 당신", "N": "직관으로 이끄는 당신", "SN": "감각과 직관을 오가는 당신",
+    "T": "세부까지 놓치지 않는 당신", "F": "감성을 우선하는 당신", "TF": "사고와 감정을 조화시키는 당신",
+    "J": "미리 움직이는 당신", "P": "순간을 즐기는 당신", "JP": "계획과 즉흥이 공존하는 당신",
+}
+
+def _axis_label(axis: str, first_score: int, second_score: int) -> str:
+    if first_score == second_score:
+        return axis
+    return axis[0] if first_score > second_score else axis[1]
+
+def _axis_scores(indices: tuple, first_words: dict, second_words: dict, answers: List[Optional[str]]) -> tuple:
+    """답한 질문 기준 (첫 성향 점수, 두 번째 성향 점수, 답하지 않은 질문 인덱스)"""
+    first_score = second_score = 0
+    unanswered = []
+    for index in indices:
+        answer = answers[index]
+        if answer is None:
+            unanswered.append(index)
+            continue
+        if any(word in answer for word in first_words[index]):
+            first_score += 1
+        if any(word in answer for word in second_words[index]):
+            second_score += 1
+    return first_score, second_score, unanswered
+
+def _axis_labels(answers: List[str]) -> List[str]:
+    """8개 답변 → 축별 판별 결과 (예: ["E", "SN", "F", "J"])"""
+    labels = []
+    for axis, indices, first_words, second_words in AXIS_RULES:
+        first_score, second_score, _ = _axis_scores(indices, first_words, second_words, answers)
+        labels.append(_axis_label(axis, first_score, second_score))
+    return labels
+
+def determine_partial_profile(answers: List[Optional[str]]) -> Dict[str, object]:
+    """
+    일부 질문만 답한 상태의 부분 프로필 계산 (답하지 않은 질문은 None)
+    - axes: 축별 {"result": 확정된 판별 결과 또는 None, "candidates": 가능한 판별 결과 목록}
+    - keywords: 확정된 축의 성향 키워드 (미확정 축은 None)
+    - candidateTypes: 남은 답변에 따라 나올 수 있는 최종 MBTI 문자열 목록
+    """
+    axes = {}
+    for axis, indices, first_words, second_words in AXIS_RULES:
+        first_score, second_score, unanswered = _axis_scores(indices, first_words, second_words, answers)
+
+        # 남은 질문 답변이 각 성향에 줄 수 있는 점수 조합을 모두 대입
+        outcomes = []
+        for extra in product([(0, 0), (1, 0), (0, 1), (1, 1)], repeat=len(unanswered)):
+            label = _axis_label(
+                axis,
+                first_score + sum(e[0] for e in extra),
+                second_score + sum(e[1] for e in extra)
+            )
+            if label not in outcomes:
+                outcomes.append(label)
+
+        axes[axis] = {
+            "result": outcomes[0] if not unanswered else None,
+            "candidates": outcomes
+        }
+
+    candidate_types = ["".join(labels) for labels in product(*[axes[a]["candidates"] for a, *_ in AXIS_RULES])]
+    return {
+        "axes": axes,
+        "keywords": [AXIS_KEYWORDS[axes[a]["result"]] if axes[a]["result"] else None for a, *_ in AXIS_RULES],
+        "candidateTypes": candidate_types
+    }
+
+# 요청에서 8개 답변을 질문 순서대로 추출
+def get_answers(data: PbtiRequest) -> List[str]:
+    return [
+        data.qOne, data.qTwo, data.qThree, data.qFour,
+        data.qFive, data.qSix, data.qSeven, data.qEight
+    ]
+
 # 사용자 MBTI 판별 (키워드 기반) - pbti.py 77~121줄
 def determine_mbti_type(data: PbtiRequest) -> str:
-    eScore = iScore = sScore = nScore = tScore = fScore = jScore = pScore = 0
-
-    if "칫솔을" in data.qOne or "바로" in data.qOne:
-        eScore += 1
-    if "수건으로" in data.qOne or "닦고" in data.qOne:
-        iScore += 1
-    if "버튼" in data.qTwo or "분사해" in data.qTwo:
-        eScore += 1
-    if "중간에" in data.qTwo or "내리는" in data.qTwo:
-        iScore += 1
-
-    if "알림처럼" in data.qThree or "미리" in data.qThree:
-        sScore += 1
-    if "버스가" in data.qThree or "가방에서 꺼내" in data.qThree:
-        nScore += 1
-    if "신호가 바뀌기 직전" in data.qFour or "분사해" in data.qFour:
-        sScore += 1
-    if "기다리다" in data.qFour or "향이 옅어지면" in data.qFour:
-        nScore += 1
-
-    if "공간" in data.qFive or "퍼뜨린다" in data.qFive:
-        tScore += 1
-    if "기분" in data.qFive or "헹굴 때마다" in data.qFive:
-        fScore += 1
-    if "목줄" in data.qSix or "가볍게" in data.qSix:
-        tScore += 1
-    if "손목에" in data.qSix or "레이어링한다" in data.qSix:
-        fScore += 1
-
-    if "리모컨을" in data.qSeven or "채널을 돌리며" in data.qSeven:
-        jScore += 1
-    if "광고가" in data.qSeven or "확실히" in data.qSeven:
-        pScore += 1
-    if "이불 위에서" in data.qEight or "잔향을" in data.qEight:
-        jScore += 1
-    if "중앙에서" in data.qEight or "톡톡" in data.qEight:
-        pScore += 1
-
-    mbti = ""
-    mbti += "EI" if eScore == iScore else ("E" if eScore > iScore else "I")
-    mbti += "SN" if sScore == nScore else ("S" if sScore > nScore else "N")
-    mbti += "TF" if tScore == fScore else ("T" if tScore > fScore else "F")
-    mbti += "JP" if jScore == pScore else ("J" if jScore > pScore else "P")
-    return mbti
+    return "".join(_axis_labels(get_answers(data)))
 
 # 사용자 설명 문장 생성 
 def build_user_description(mbti: str) -> str:
@@ -113,74 +160,4 @@ def build_user_description(mbti: str) -> str:
 
 # 사용자 응답 기반 키워드 결정 함수 
 def calculate_keywords_by_text(answers: List[str]) -> List[str]:
-    q1, q2, q3, q4, q5, q6, q7, q8 = answers
-
-    e_score = i_score = s_score = n_score = t_score = f_score = j_score = p_score = 0
-
-    # Q1~Q2 → E/I
-    if any(word in q1 for word in ["칫솔을", "바로"]):
-        e_score += 1
-    if any(word in q1 for word in ["수건으로", "닦고"]):
-        i_score += 1
-
-    if any(word in q2 for word in ["버튼", "분사해"]):
-        e_score += 1
-    if any(word in q2 for word in ["중간에", "내리는"]):
-        i_score += 1
-
-    # Q3~Q4 → S/N
-    if any(word in q3 for word in ["알림처럼", "미리"]):
-        s_score += 1
-    if any(word in q3 for word in ["버스가", "가방에서 꺼내"]):
-        n_score += 1
-
-    if any(word in q4 for word in ["신호가 바뀌기 직전", "분사해"]):
-        s_score += 1
-    if any(word in q4 for word in ["기다리다", "향이 옅어지면"]):
-        n_score += 1
-
-    # Q5~Q6 → T/F
-    if any(word in q5 for word in ["공간", "퍼뜨린다"]):
-        t_score += 1
-    if any(word in q5 for word in ["기분", "헹굴 때마다"]):
-        f_score += 1
-
-    if any(word in q6 for word in ["목줄", "가볍게"]):
-        t_score += 1
-    if any(word in q6 for word in ["손목에", "레이어링한다"]):
-        f_score += 1
-
-    # Q7~Q8 → J/P
-    if any(word in q7 for word in ["리모컨을", "채널을 돌리며"]):
-        j_score += 1
-    if any(word in q7 for word in ["광고가", "확실히"]):
-        p_score += 1
-
-    if any(word in q8 for word in ["이불 위에서", "잔향을"]):
-        j_score += 1
-    if any(word in q8 for word in ["중앙에서", "톡톡"]):
-        p_score += 1
-
-    # 키워드 결정
-    keyword1 = (
-        "긍정적 임팩트를 가진 당신" if e_score > i_score else
-        "은은한 집중형인 당신" if e_score < i_score else
-        "외향과 내향의 균형을 지닌 당신"
-    )
-    keyword2 = (
-        "촉각에 민감한 당신" if s_score > n_score else
-        "직관으로 이끄는 당신" if s_score < n_score else
-        "감각과 직관을 오가는 당신"
-    )
-    keyword3 = (
-        "세부까지 놓치지 않는 당신" if t_score > f_score else
-        "감성을 우선하는 당신" if t_score < f_score else
-        "사고와 감정을 조화시키는 당신"
-    )
-    keyword4 = (
-        "미리 움직이는 당신" if j_score > p_score else
-        "순간을 즐기는 당신" if j_score < p_score else
-        "계획과 즉흥이 공존하는 당신"
-    )
-
-    return [keyword1, keyword2, keyword3, keyword4]
\ No newline at end of file
+    return [AXIS_KEYWORDS[label] for label in _axis_labels(answers)]
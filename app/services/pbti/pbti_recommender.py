@@ -1,14 +1,24 @@
 # app/services/pbti/pbti_recommender.py
 
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
-from app.core.config import S3_BUCKET, S3_KEY, PBTI_SBERT_MODEL_NAME
+from app.core.config import S3_BUCKET, S3_KEY, PBTI_SBERT_MODEL_NAME, PBTI_ENCODER_BACKEND
 from app.core.utils import load_excel_from_s3, safe_str
+from app.core.metrics import REGISTRY, Counter, stats_lines, timed_stage
+from app.core.model_registry import get_sentence_model
+from app.core.logger import get_logger, kv
 from app.models.schemas import PbtiRequest
 from app.services.pbti.mbti_analyzer import determine_mbti_type, build_user_description
 from typing import List, Dict, Any
+import threading
+import numpy as np
 import pandas as pd
 
+logger = get_logger("pbti")
+
+PBTI_MBTI_CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "pbti_mbti_cache_lookups_total", "PBTI MBTI 유형별 추천 결과 캐시 조회 수", ["result"]
+))
+
 class PBTIPerfumeRecommender:
     """PBTI 전용 향수 추천기 (기존 SBERT 추천기와 동일한 패턴)"""
     _cache = None  # 클래스 캐싱
@@ -17,11 +27,13 @@ class PBTIPerfumeRecommender:
         # S3에서 로드 (캐싱)
         if PBTIPerfumeRecommender._cache is None:
             PBTIPerfumeRecommender._cache = load_excel_from_s3(S3_BUCKET, S3_KEY)
-            print(f"PBTI: S3에서 향수 데이터 로드 완료: {len(PBTIPerfumeRecommender._cache)}개 향수")
+            logger.info("PBTI 향수 데이터 로드 완료", extra=kv(perfumes=len(PBTIPerfumeRecommender._cache)))
         
         self.df = PBTIPerfumeRecommender._cache.copy()
         self.df = self.df.dropna(subset=["향수이름", "향수 키워드"])
-        self.model = SentenceTransformer(PBTI_SBERT_MODEL_NAME)
+        self.model = get_sentence_model(PBTI_SBERT_MODEL_NAME, PBTI_ENCODER_BACKEND)  # 프로세스 전역 공유 인스턴스
+        # MBTI 유형별 추천 결과 캐시 (결과가 유형에만 의존하므로 최대 81개)
+        self._mbti_cache = {}
         
         # 향수 임베딩 데이터 준비
         self._prepare_perfume_embeddings()
@@ -32,7 +44,9 @@ class PBTIPerfumeRecommender:
         self.df["임베딩문장"] = self.df.apply(self._build_perfume_sentence, axis=1)
         # 임베딩 벡터 생성
         self.df["임베딩벡터"] = self.df["임베딩문장"].apply(lambda x: self.model.encode(x))
-        print("PBTI: 향수 데이터 임베딩 처리 완료")
+        # 유사도 계산용 행렬 (요청마다 다시 쌓지 않도록 미리 구성)
+        self.embedding_matrix = np.vstack(self.df["임베딩벡터"].tolist())
+        logger.info("PBTI 향수 데이터 임베딩 완료", extra=kv(perfumes=len(self.df)))
         
     def _build_perfume_sentence(self, row) -> str:
         """향수 임베딩 문장 생성 함수"""
@@ -44,21 +58,30 @@ class PBTIPerfumeRecommender:
     
     def recommend(self, request: PbtiRequest) -> List[Dict[str, Any]]:
         """PBTI 기반 향수 추천"""
-        # MBTI 분석 및 사용자 벡터 생성
-        mbti = determine_mbti_type(request)
+        return self.recommend_for_mbti(determine_mbti_type(request))
+    
+    def recommend_for_mbti(self, mbti: str) -> List[Dict[str, Any]]:
+        """MBTI 유형 기반 향수 추천 (유형별 결과 캐싱)"""
+        if mbti not in self._mbti_cache:
+            PBTI_MBTI_CACHE_LOOKUPS.inc(result="miss")
+            self._mbti_cache[mbti] = self._recommend_uncached(mbti)
+        else:
+            PBTI_MBTI_CACHE_LOOKUPS.inc(result="hit")
+        return [dict(item) for item in self._mbti_cache[mbti]]
+    
+    @timed_stage("pbti_embed_lookup")
+    def _recommend_uncached(self, mbti: str) -> List[Dict[str, Any]]:
+        # 사용자 벡터 생성
         user_sentence = build_user_description(mbti)
         user_vector = self.model.encode(user_sentence)
         
         # 코사인 유사도 계산
-        similarities = []
-        for embedding in self.df["임베딩벡터"]:
-            similarity = cosine_similarity([user_vector], [embedding])[0][0]
-            similarities.append(similarity)
-        
-        self.df["유사도"] = similarities
+        # (스레드풀에서 동시에 호출되므로 공유 DataFrame에 유사도 컬럼을 쓰지 않음)
+        similarities = cosine_similarity([user_vector], self.embedding_matrix)[0]
         
         # 상위 3개 향수 선택
-        top_matches = self.df.sort_values(by="유사도", ascending=False).head(3)
+        top_indices = np.argsort(-similarities, kind="stable")[:3]
+        top_matches = self.df.iloc[top_indices]
         
         # 응답 형식에 맞게 변환
         result = []
@@ -74,22 +97,44 @@ class PBTIPerfumeRecommender:
 
 # 전역 추천기 인스턴스 (기존 패턴과 동일)
 _pbti_recommender = None
+_pbti_recommender_lock = threading.Lock()
 
-def get_perfume_recommendations(request: PbtiRequest) -> List[Dict[str, Any]]:
-    """전역 추천기를 사용한 향수 추천 (기존 패턴 호환)"""
+def get_pbti_recommender() -> PBTIPerfumeRecommender:
+    """
+    전역 추천기 반환 (없으면 생성)
+    - 스레드풀에서 호출되므로 최초 생성은 락으로 한 번만 수행
+    """
     global _pbti_recommender
     
     if _pbti_recommender is None:
-        _pbti_recommender = PBTIPerfumeRecommender()
+        with _pbti_recommender_lock:
+            if _pbti_recommender is None:
+                _pbti_recommender = PBTIPerfumeRecommender()
     
-    return _pbti_recommender.recommend(request)
+    return _pbti_recommender
+
+def get_perfume_recommendations(request: PbtiRequest) -> List[Dict[str, Any]]:
+    """전역 추천기를 사용한 향수 추천 (기존 패턴 호환)"""
+    return get_pbti_recommender().recommend(request)
+
+def warm_perfume_recommendations(mbti_types: List[str]) -> None:
+    """
+    추천기 생성 + 후보 MBTI 유형별 추천 결과 미리 계산 (PBTI 세션 추측 실행용)
+    mbti_types가 비어 있으면 추천기 생성(모델 로드, 임베딩)만 수행
+    """
+    recommender = get_pbti_recommender()
+    for mbti in mbti_types:
+        recommender.recommend_for_mbti(mbti)
 
 def get_model_info() -> Dict[str, Any]:
     """모델 상태 정보 반환 (디버깅용)"""
-    global _pbti_recommender
     return {
         "recommender_loaded": _pbti_recommender is not None,
         "data_loaded": PBTIPerfumeRecommender._cache is not None,
         "data_count": len(PBTIPerfumeRecommender._cache) if PBTIPerfumeRecommender._cache is not None else 0,
+        "cached_mbti_types": len(_pbti_recommender._mbti_cache) if _pbti_recommender is not None else 0,
         "model_name": PBTI_SBERT_MODEL_NAME
-    }
\ No newline at end of file
+    }
+
+
+REGISTRY.register_collector(lambda: stats_lines("pbti_model", get_model_info()))
\ No newline at end of file
@@ -1,39 +1,91 @@
 # app/services/pbti/pbti_service.py
 
 import asyncio
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Tuple
 from app.models.schemas import PbtiRequest
+from app.core.config import PBTI_GPT_MODE, PBTI_SECTION_TIMEOUT_SECONDS
+from app.core.utils import format_sse
+from app.core.singleflight import pbti_flight, make_request_key, get_singleflight_stats
+from app.core.llm_gateway import get_llm_gateway_stats
+from app.core.logger import bind_context, get_logger, kv
+from app.core.profiling import traced
 from app.services.pbti.gpt_service import (
+    PBTI_SECTIONS,
+    build_pbti_profile,
     prompt_recommendation,
     prompt_keywords,
     prompt_perfume_style,
     prompt_scent_point,
     prompt_summary,
-    call_gpt_async
+    call_gpt_async,
+    section_route,
+    call_gpt_single_async,
+    validate_section
 )
+from app.services.pbti.mbti_analyzer import get_answers
 from app.services.pbti.pbti_recommender import get_perfume_recommendations
 
+logger = get_logger("pbti")
+
+# 섹션 이름 → 섹션 프롬프트 (parallel 모드)
+SECTION_PROMPT_BUILDERS = {
+    "recommendation": prompt_recommendation,
+    "keywords": prompt_keywords,
+    "perfumeStyle": prompt_perfume_style,
+    "scentPoint": prompt_scent_point,
+    "summary": prompt_summary,
+}
+
+def _start_gpt_tasks(request: PbtiRequest, profile: Dict[str, Any]) -> Dict[asyncio.Future, List[str]]:
+    """
+    GPT 호출 태스크 시작
+    - 반환값: 태스크 → 그 태스크가 만들어내는 섹션 이름 목록
+    - single 모드는 태스크 1개가 5개 섹션을 모두 담당
+    """
+    if PBTI_GPT_MODE == "single":
+        # 5개 섹션을 한 번의 호출로 요청 (실패 섹션만 재요청)
+        return {asyncio.ensure_future(call_gpt_single_async(request, profile)): list(PBTI_SECTIONS)}
+    
+    # 5개의 GPT 프롬프트를 각각 병렬 호출
+    keywords = profile["keywords"]
+    return {
+        asyncio.ensure_future(call_gpt_async(builder(request, keywords), section_route(section))): [section]
+        for section, builder in SECTION_PROMPT_BUILDERS.items()
+    }
+
+def request_key(request: PbtiRequest) -> str:
+    """동일 답변 조합 판별용 키 (GPT 프롬프트에 답변 원문이 들어가므로 대소문자 / 공백까지 그대로 비교)"""
+    return make_request_key(get_answers(request), exact=True)
+
+@traced("pbti.get_full_pbti_result")
 async def get_full_pbti_result(request: PbtiRequest) -> Dict[str, Any]:
     """
     PBTI 전체 결과 생성 함수
-    - GPT 병렬 호출 (5개 프롬프트)
-    - 향수 추천 (SBERT 기반)
+    - GPT 병렬 호출 (5개 프롬프트) 또는 단일 structured output 호출 (PBTI_GPT_MODE)
+    - 향수 추천 (SBERT 기반, 스레드풀에서 GPT 호출과 동시에 실행)
     - 결과 통합 및 반환
+    - 답변 원문이 완전히 같은 요청이 동시에 들어오면 계산 한 번을 공유 (single-flight, 호출자마다 결과 복사본)
     
     pbti.py의 485~504줄과 동일한 로직
     """
+    key = request_key(request)
+    return await pbti_flight.do(key, lambda: _compute_full_pbti_result(request), copy_result=True)
+
+async def _compute_full_pbti_result(request: PbtiRequest) -> Dict[str, Any]:
+    
+    # 향수 추천 (CPU 바운드 + 최초 호출 시 모델 로드)을 이벤트 루프 밖에서 먼저 시작
+    loop = asyncio.get_event_loop()
+    perfume_future = loop.run_in_executor(None, bind_context(get_perfume_recommendations, request))
     
-    # 5개의 GPT 프롬프트 생성
-    prompts = [
-        prompt_recommendation(request),
-        prompt_keywords(request),
-        prompt_perfume_style(request),
-        prompt_scent_point(request),
-        prompt_summary(request),
-    ]
+    # 파생 프로필 (성향 키워드) 은 요청당 한 번만 계산
+    profile = build_pbti_profile(request)
+    gpt_tasks = _start_gpt_tasks(request, profile)
     
-    # GPT 병렬 호출 실행
-    gpt_outputs = await asyncio.gather(*[call_gpt_async(p) for p in prompts])
+    # GPT 호출 실행 + 향수 추천 완료 대기
+    gpt_outputs, perfume_recommend = await asyncio.gather(
+        asyncio.gather(*gpt_tasks),
+        perfume_future
+    )
     
     # GPT 결과들을 하나의 딕셔너리로 통합
     result = {}
@@ -42,19 +94,93 @@ async def get_full_pbti_result(request: PbtiRequest) -> Dict[str, Any]:
             result.update(out)
     
     # 향수 추천 결과 추가
-    result["perfumeRecommend"] = get_perfume_recommendations(request)
+    result["perfumeRecommend"] = perfume_recommend
     
     return result
 
+async def iter_pbti_sections(request: PbtiRequest) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    PBTI 결과를 섹션이 완료되는 순서대로 반환하는 비동기 제너레이터
+    
+    - ("section", {"name": 섹션명, "value": 섹션 값})
+      (perfumeRecommend, recommendation, keywords, perfumeStyle, scentPoint, summary)
+    - 마지막에 ("done", {"failed": [...], "timedOut": [...]}) 실패/시간 초과 섹션 목록
+    
+    PBTI_SECTION_TIMEOUT_SECONDS 안에 끝나지 않은 섹션은 취소하고 timedOut으로 보고
+    """
+    loop = asyncio.get_event_loop()
+    perfume_future = loop.run_in_executor(None, bind_context(get_perfume_recommendations, request))
+    
+    profile = build_pbti_profile(request)
+    tasks = _start_gpt_tasks(request, profile)
+    tasks[perfume_future] = ["perfumeRecommend"]
+    
+    failed, timed_out = [], []
+    deadline = loop.time() + PBTI_SECTION_TIMEOUT_SECONDS
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                sections = tasks[future]
+                try:
+                    output = future.result()
+                except Exception as e:
+                    logger.error("❌ PBTI 섹션 생성 실패", extra=kv(
+                        sections=",".join(sections), error=f"{type(e).__name__}: {e}"
+                    ))
+                    failed.extend(sections)
+                    continue
+                
+                if future is perfume_future:
+                    yield "section", {"name": "perfumeRecommend", "value": output}
+                    continue
+                
+                for section in sections:
+                    value = (output or {}).get(section)
+                    if validate_section(section, value):
+                        yield "section", {"name": section, "value": value}
+                    else:
+                        failed.append(section)
+        
+        for future in pending:
+            timed_out.extend(tasks[future])
+    finally:
+        # 시간 초과 또는 클라이언트 연결 종료 시 남은 GPT 호출 정리
+        for future in pending:
+            future.cancel()
+    
+    yield "done", {"failed": failed, "timedOut": timed_out}
+
+async def stream_pbti_result(request: PbtiRequest) -> AsyncIterator[str]:
+    """
+    PBTI 결과 섹션별 스트리밍 (SSE 메시지 단위로 반환)
+    - event: section / event: done (iter_pbti_sections 참고)
+    """
+    async for event, payload in iter_pbti_sections(request):
+        yield format_sse(event, payload)
+
 def get_pbti_status() -> Dict[str, Any]:
     """PBTI 서비스 상태 확인 (디버깅용)"""
     try:
         from app.services.pbti.pbti_recommender import get_model_info
+        from app.core.llm_cache import get_llm_cache_stats
+        from app.services.pbti.job_queue import pbti_job_queue
         model_info = get_model_info()
         
         return {
             "status": "healthy",
             "model_info": model_info,
+            "gpt_mode": PBTI_GPT_MODE,
+            "llm_cache": get_llm_cache_stats(),
+            "jobs": pbti_job_queue.stats(),
+            "singleflight": get_singleflight_stats(),
+            "llm_gateway": get_llm_gateway_stats(),
             "services": {
                 "gpt_service": "available",
                 "mbti_analyzer": "available", 
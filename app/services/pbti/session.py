@@ -0,0 +1,74 @@
+# app/services/pbti/session.py
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from app.core.config import PBTI_SESSION_SPECULATION_MAX_CANDIDATES
+from app.core.logger import get_logger, kv
+from app.models.schemas import PbtiRequest
+from app.services.pbti.mbti_analyzer import QUESTION_FIELDS, determine_partial_profile
+from app.services.pbti.pbti_recommender import warm_perfume_recommendations
+
+logger = get_logger("pbti")
+
+
+class PbtiSession:
+    """
+    PBTI 점진 세션 (WebSocket 한 연결당 하나)
+    - 질문 답변을 하나씩 받아 부분 프로필(확정된 성향 축, 키워드)을 갱신
+    - 세션 시작 시 추천기(모델 로드, 카탈로그 임베딩)를 미리 준비
+    - 가능한 최종 MBTI 유형이 충분히 좁혀지면 유형별 향수 추천을 미리 계산
+      (GPT 프롬프트는 8개 답변 원문을 그대로 포함하므로 마지막 답변 이후에 시작)
+    """
+
+    def __init__(self):
+        self.answers = {}
+        self._speculated = set()
+        self._warm_futures = []
+        self._warm([])
+
+    def _warm(self, mbti_types: List[str]) -> None:
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(None, warm_perfume_recommendations, mbti_types)
+        future.add_done_callback(self._log_warm_error)
+        self._warm_futures.append(future)
+
+    @staticmethod
+    def _log_warm_error(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            error = future.exception()
+            logger.warning("⚠️ PBTI 세션 추천 미리 계산 실패", extra=kv(error=f"{type(error).__name__}: {error}"))
+
+    def update(self, question: Optional[str], answer: Optional[str]) -> Dict[str, Any]:
+        """답변 하나 반영 후 부분 프로필 반환 (같은 질문에 다시 답하면 덮어씀)"""
+        if question not in QUESTION_FIELDS:
+            raise ValueError(f"알 수 없는 질문입니다: {question} (가능한 값: {', '.join(QUESTION_FIELDS)})")
+        if not isinstance(answer, str):
+            raise ValueError("answer는 문자열이어야 합니다.")
+        self.answers[question] = answer
+
+        profile = determine_partial_profile([self.answers.get(field) for field in QUESTION_FIELDS])
+        candidates = profile["candidateTypes"]
+
+        # 후보 유형이 충분히 적으면 아직 계산하지 않은 유형의 추천 결과를 미리 계산
+        if len(candidates) <= PBTI_SESSION_SPECULATION_MAX_CANDIDATES:
+            new_types = [mbti for mbti in candidates if mbti not in self._speculated]
+            if new_types:
+                self._speculated.update(new_types)
+                self._warm(new_types)
+
+        profile["answered"] = [field for field in QUESTION_FIELDS if field in self.answers]
+        profile["complete"] = self.is_complete
+        return profile
+
+    @property
+    def is_complete(self) -> bool:
+        return all(field in self.answers for field in QUESTION_FIELDS)
+
+    def to_request(self) -> PbtiRequest:
+        return PbtiRequest(**self.answers)
+
+    def close(self) -> None:
+        """아직 시작하지 않은 미리 계산 작업 취소"""
+        for future in self._warm_futures:
+            future.cancel()
@@ -0,0 +1,103 @@
+# app/services/pbti/warm_cache.py
+# PBTI LLM 응답 캐시 오프라인 warm-up
+#
+# 사용법:
+#   python -m app.services.pbti.warm_cache answers.jsonl [--concurrency 4]
+#
+# answers.jsonl: 한 줄에 답변 조합 하나 ({"qOne": "...", ..., "qEight": "..."})
+# 현재 PBTI_GPT_MODE 기준 프롬프트로, 키당 LLM_CACHE_VARIANTS_PER_KEY개 변형이 쌓일 때까지 호출
+
+import argparse
+import asyncio
+import json
+from typing import List
+
+from app.core.llm_cache import get_llm_cache
+from app.core.config import PBTI_GPT_MODE
+from app.models.schemas import PbtiRequest
+from app.services.pbti.gpt_service import (
+    PBTI_SECTIONS,
+    PBTI_SECTIONS_ROUTE,
+    build_pbti_profile,
+    prompt_recommendation,
+    prompt_keywords,
+    prompt_perfume_style,
+    prompt_scent_point,
+    prompt_summary,
+    prompt_sections,
+    prompt_cache_key,
+    section_route,
+    call_gpt_async,
+    call_gpt_sections_async
+)
+
+
+async def _fill_key(cache, cache_key: str, call) -> int:
+    """키의 변형 개수가 채워질 때까지 호출 (실패 대비 시도 횟수 제한)"""
+    attempts = 0
+    while cache.variant_count(cache_key) < cache.variants_per_key and attempts < cache.variants_per_key * 2:
+        attempts += 1
+        try:
+            await call()
+        except Exception as e:
+            print(f"[OpenAI Error] warm-up 호출 실패: {e}")
+    return attempts
+
+
+async def warm_request(cache, request: PbtiRequest) -> int:
+    """답변 조합 하나에 대한 모든 프롬프트 warm-up, 실제 호출 횟수 반환"""
+    profile = build_pbti_profile(request)
+    keywords = profile["keywords"]
+
+    if PBTI_GPT_MODE == "single":
+        prompt = prompt_sections(request, keywords, PBTI_SECTIONS)
+        return await _fill_key(
+            cache,
+            prompt_cache_key(prompt, PBTI_SECTIONS_ROUTE, PBTI_SECTIONS),
+            lambda: call_gpt_sections_async(request, keywords, PBTI_SECTIONS)
+        )
+
+    calls = 0
+    builders = (prompt_recommendation, prompt_keywords, prompt_perfume_style, prompt_scent_point, prompt_summary)
+    for section, builder in zip(PBTI_SECTIONS, builders):
+        prompt = builder(request, keywords)
+        route = section_route(section)
+        calls += await _fill_key(
+            cache, prompt_cache_key(prompt, route), lambda p=prompt, r=route: call_gpt_async(p, r)
+        )
+    return calls
+
+
+async def warm(requests: List[PbtiRequest], concurrency: int) -> None:
+    cache = get_llm_cache()
+    if cache is None:
+        print("❌ LLM_CACHE_ENABLED=false - warm-up을 건너뜁니다.")
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(index: int, request: PbtiRequest) -> int:
+        async with semaphore:
+            calls = await warm_request(cache, request)
+            print(f"🔥 [{index + 1}/{len(requests)}] GPT 호출 {calls}회")
+            return calls
+
+    total_calls = sum(await asyncio.gather(*[_run(i, r) for i, r in enumerate(requests)]))
+    print(f"✅ warm-up 완료 - 답변 조합 {len(requests)}개, GPT 호출 {total_calls}회")
+    print(f"📊 캐시 상태: {cache.stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PBTI LLM 응답 캐시 warm-up")
+    parser.add_argument("answers_path", help="답변 조합 JSONL 파일 경로")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 처리할 답변 조합 수")
+    args = parser.parse_args()
+
+    with open(args.answers_path, encoding="utf-8") as f:
+        requests = [PbtiRequest(**json.loads(line)) for line in f if line.strip()]
+
+    asyncio.run(warm(requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,143 @@
 # app/recommend_full.py
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from app.services.generator import generate_scenario_sync
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+from app.services.generator import generate_scenario, stream_scenario, build_template_scenario
+from app.services.scenario_pool import scenario_pool
 from app.services.recommenders.tf_idf import PerfumeRecommender
 from app.services.recommenders.sbert import SBERTPerfumeRecommender
 from app.services.recommenders.hybrid import HybridPerfumeRecommender
-from app.core.config import settings
+from app.core.config import settings, RECOMMEND_DEADLINE_SECONDS
+from app.core.utils import format_sse
+from app.core.llm_gateway import get_llm_gateway_stats
+from app.core.metrics import REGISTRY, stats_lines
+from app.core.logger import bind_context, get_logger, kv
+from app.core.singleflight import (
+    recommend_flight,
+    scenario_flight,
+    make_request_key,
+    get_singleflight_stats
+)
 
-# 글로벌 객체 초기화 (S3에서 로딩)
-tfidf = PerfumeRecommender()
-sbert = SBERTPerfumeRecommender()
-hybrid = HybridPerfumeRecommender(tfidf, sbert)
+logger = get_logger("recommend")
+
+# 전역 추천기 (lifespan 워밍업에서 병렬 생성, 그 전에 요청이 오면 처음 호출한 스레드가 생성)
+_tfidf = None
+_sbert = None
+_hybrid = None
+_tfidf_lock = threading.Lock()
+_sbert_lock = threading.Lock()
+_hybrid_lock = threading.Lock()
+
+def get_tfidf_recommender() -> PerfumeRecommender:
+    """전역 TF-IDF 추천기 반환 (없으면 S3 로드 + 벡터화)"""
+    global _tfidf
+    if _tfidf is None:
+        with _tfidf_lock:
+            if _tfidf is None:
+                _tfidf = PerfumeRecommender()
+    return _tfidf
+
+def get_sbert_recommender() -> SBERTPerfumeRecommender:
+    """전역 SBERT 추천기 반환 (없으면 S3 로드 + 모델 로드 + 임베딩)"""
+    global _sbert
+    if _sbert is None:
+        with _sbert_lock:
+            if _sbert is None:
+                _sbert = SBERTPerfumeRecommender()
+    return _sbert
+
+def get_hybrid_recommender() -> HybridPerfumeRecommender:
+    """전역 하이브리드 추천기 반환 (TF-IDF / SBERT 추천기를 먼저 생성)"""
+    global _hybrid
+    if _hybrid is None:
+        tfidf, sbert = get_tfidf_recommender(), get_sbert_recommender()
+        with _hybrid_lock:
+            if _hybrid is None:
+                _hybrid = HybridPerfumeRecommender(tfidf, sbert)
+    return _hybrid
+
+# 시간 예산 초과 / GPT 오류로 템플릿 시나리오를 사용한 횟수
+_degraded_stats = {"requests": 0, "degraded": 0, "deadline_exceeded": 0, "llm_error": 0}
+REGISTRY.register_collector(lambda: stats_lines("recommend_full", _degraded_stats))
+
+class RecommendDeadlineExceeded(Exception):
+    """시간 예산 안에 하이브리드 추천이 끝나지 않음"""
+
+def _new_deadline() -> Optional[float]:
+    """요청 deadline (time.monotonic 기준, RECOMMEND_DEADLINE_SECONDS가 0이면 None)"""
+    if RECOMMEND_DEADLINE_SECONDS <= 0:
+        return None
+    return time.monotonic() + RECOMMEND_DEADLINE_SECONDS
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """deadline (time.monotonic 기준) 까지 남은 시간 (초, 0 이상, deadline이 없으면 None)"""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+async def _await_recommendation(future: asyncio.Future, deadline: Optional[float]) -> dict:
+    """시간 예산 안에서 하이브리드 추천 결과 대기 (초과 시 RecommendDeadlineExceeded)"""
+    try:
+        return await asyncio.wait_for(future, timeout=_remaining(deadline))
+    except asyncio.TimeoutError:
+        _degraded_stats["deadline_exceeded"] += 1
+        raise RecommendDeadlineExceeded(f"추천 시간 예산 초과 ({RECOMMEND_DEADLINE_SECONDS}초)")
+
+def _hybrid_recommend(keywords: list[str], deadline: Optional[float] = None) -> asyncio.Future:
+    """
+    하이브리드 추천 (CPU 바운드) 을 스레드풀에서 실행
+    - 시드와 무관한 TF-IDF / SBERT 후보 점수 계산은 입력 원문이 같은 동시 요청끼리 공유
+      (single-flight, 호출자마다 복사본)
+    - MMR 다양성 선별은 요청마다 자기 시드로 따로 수행 (시드 랜덤화 유지)
+    deadline이 지나면 선택 단계(대체 추천)는 생략
+    """
+    return asyncio.ensure_future(_hybrid_recommend_async(keywords, deadline))
+
+async def _hybrid_recommend_async(keywords: list[str], deadline: Optional[float]) -> dict:
+    loop = asyncio.get_event_loop()
+    candidates = await recommend_flight.do(
+        make_request_key(keywords, exact=True),
+        lambda: loop.run_in_executor(None, bind_context(lambda: get_hybrid_recommender().score_candidates(*keywords))),
+        copy_result=True
+    )
+    return await loop.run_in_executor(
+        None, bind_context(lambda: get_hybrid_recommender().recommend(*keywords, deadline=deadline, candidates=candidates))
+    )
+
+async def get_scenario(keywords: list[str], timeout: Optional[float] = None) -> str:
+    """
+    감성 시나리오 반환 (실패 시 예외 전달)
+    - 같은 키워드 조합이 동시에 들어오면 생성 한 번을 공유 (single-flight)
+    - 시나리오 풀이 켜져 있으면 미리 생성된 변형을 즉시 반환
+    - timeout은 직접 생성하는 GPT 호출에 남은 시간 예산으로 전달
+    """
+    return await scenario_flight.do(make_request_key(keywords), lambda: _get_scenario(keywords, timeout))
+
+async def _get_scenario(keywords: list[str], timeout: Optional[float] = None) -> str:
+    if scenario_pool is not None:
+        return await scenario_pool.get_scenario(keywords, timeout=timeout)
+    return await generate_scenario(keywords, settings.OPENAI_API_KEY, timeout=timeout)
+
+async def _get_scenario_within(keywords: list[str], deadline: Optional[float]) -> Optional[str]:
+    """
+    남은 시간 예산 안에서 시나리오 반환, 초과/실패 시 None
+    (대기만 중단하고 공유 생성 작업은 계속 진행되어 시나리오 풀을 채움)
+    """
+    try:
+        remaining = _remaining(deadline)
+        return await asyncio.wait_for(get_scenario(keywords, timeout=remaining), timeout=remaining)
+    except asyncio.TimeoutError:
+        logger.warning("⏱️ 시나리오 생성 시간 예산 초과 - 템플릿 시나리오로 대체", extra=kv(
+            deadline_seconds=RECOMMEND_DEADLINE_SECONDS
+        ))
+        _degraded_stats["deadline_exceeded"] += 1
+    except Exception as e:
+        logger.error("시나리오 생성 실패", extra=kv(error=f"{type(e).__name__}: {e}"))
+        _degraded_stats["llm_error"] += 1
+    return None
 
 async def recommend_full(
     ambience: str, 
@@ -30,33 +156,143 @@ async def recommend_full(
     :param personality: 성격 키워드
     :return: {
         "scenario": str,
-        "recommendations": list[dict]
+        "recommendations": list[dict],
+        "degraded": bool
     }
     """
     keywords = [ambience, style, gender, season, personality]
+    deadline = _new_deadline()
+    _degraded_stats["requests"] += 1
 
     # 병렬 처리: GPT 시나리오 생성과 하이브리드 추천을 동시에 실행
-    loop = asyncio.get_event_loop()
+    # 1. 하이브리드 추천 (CPU 바운드) - 스레드풀에서 실행
+    recommend_future = _hybrid_recommend(keywords, deadline)
     
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        # 1. GPT 시나리오 생성 (I/O 바운드)
-        scenario_future = loop.run_in_executor(
-            executor, generate_scenario_sync, keywords, settings.OPENAI_API_KEY
-        )
-        
-        # 2. 하이브리드 추천 (CPU 바운드)
-        recommend_future = loop.run_in_executor(
-            executor, 
-            lambda: hybrid.recommend(ambience, style, gender, season, personality)
-        )
-        
-        # 두 작업이 모두 완료될 때까지 대기
-        scenario, hybrid_result = await asyncio.gather(
-            scenario_future, 
-            recommend_future
-        )
+    # 2. GPT 시나리오 (I/O 바운드) - 시간 예산 안에서 시나리오 풀 또는 비동기 호출
+    scenario, hybrid_result = await asyncio.gather(
+        _get_scenario_within(keywords, deadline),
+        _await_recommendation(recommend_future, deadline)
+    )
+
+    # 3. 시간 예산 초과 / GPT 오류 시 추천 향수 노트 기반 템플릿 시나리오로 대체
+    degraded = scenario is None
+    if degraded:
+        _degraded_stats["degraded"] += 1
+        scenario = build_template_scenario(keywords, hybrid_result["results"])
 
     return {
         "scenario": scenario,
-        "recommendations": hybrid_result["results"]
+        "recommendations": hybrid_result["results"],
+        "degraded": degraded
+    }
+
+async def _produce_scenario(keywords: list[str], queue: asyncio.Queue, deadline: Optional[float]) -> None:
+    """
+    시나리오 토큰을 큐에 넣는 생산자 (큐 항목: (토큰 조각, 전체 시나리오, 실패 여부))
+    - 시나리오 풀에 변형이 있으면 한 번에 넣고, 없으면 모델 스트림 토큰을 순서대로 넣음
+    - 모델 스트림 요청에는 남은 시간 예산을 timeout으로 전달
+    - 마지막에 (None, 전체 시나리오, 실패 여부) 를 넣어 종료를 알림
+    """
+    if scenario_pool is not None:
+        pooled = scenario_pool.take_pooled(keywords)
+        if pooled is not None:
+            await queue.put((pooled, None, False))
+            await queue.put((None, pooled, False))
+            return
+    
+    parts = []
+    failed = False
+    try:
+        async for delta in stream_scenario(keywords, settings.OPENAI_API_KEY, timeout=_remaining(deadline)):
+            parts.append(delta)
+            await queue.put((delta, None, False))
+        scenario = "".join(parts).strip()
+        if scenario_pool is not None:
+            scenario_pool.add_generated(keywords, scenario)
+    except Exception as e:
+        logger.error("시나리오 스트리밍 실패", extra=kv(error=f"{type(e).__name__}: {e}", streamed=len(parts)))
+        _degraded_stats["llm_error"] += 1
+        # 이미 일부 토큰을 보냈다면 그대로 두고, 하나도 못 보냈으면 소비자가 템플릿으로 대체 (둘 다 degraded)
+        scenario = "".join(parts).strip() or None
+        failed = True
+    await queue.put((None, scenario, failed))
+
+async def recommend_full_stream(
+    ambience: str, 
+    style: str, 
+    gender: str, 
+    season: str, 
+    personality: str
+) -> AsyncIterator[str]:
+    """
+    감성 시나리오 + 향수 추천 스트리밍 (SSE 메시지 단위로 반환)
+    
+    - event: recommendations → 하이브리드 추천이 끝나는 즉시 추천 목록 전송
+    - event: scenario → 이후 시나리오 토큰 조각을 생성되는 대로 전송 ({"delta": str})
+    - event: done → 완성된 전체 시나리오 + degraded 여부 전송
+    - event: error → 추천 실패 시 전송 후 종료
+    
+    시나리오 스트림은 추천과 동시에 시작하고, 추천 전송 전에 도착한 토큰은 큐에 쌓아둠
+    시간 예산 안에 토큰을 하나도 받지 못하면 템플릿 시나리오를 한 번에 전송 (degraded)
+    스트림이 중간에 실패하면 이미 보낸 부분을 전체 시나리오로 두고 degraded로 표시
+    """
+    keywords = [ambience, style, gender, season, personality]
+    deadline = _new_deadline()
+    _degraded_stats["requests"] += 1
+    
+    recommend_future = _hybrid_recommend(keywords, deadline)
+    queue = asyncio.Queue()
+    scenario_task = asyncio.ensure_future(_produce_scenario(keywords, queue, deadline))
+    
+    try:
+        try:
+            hybrid_result = await _await_recommendation(recommend_future, deadline)
+        except Exception as e:
+            yield format_sse("error", {"detail": f"추천 실패: {str(e)}"})
+            return
+        yield format_sse("recommendations", {"recommendations": hybrid_result["results"]})
+        
+        sent_any = False
+        while True:
+            try:
+                # 첫 토큰 이후에는 스트림이 끝날 때까지 기다림 (이미 보낸 문장을 끊지 않음)
+                timeout = None if sent_any else _remaining(deadline)
+                delta, scenario, failed = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("⏱️ 시나리오 스트림 시간 예산 초과 - 템플릿 시나리오로 대체", extra=kv(
+                    deadline_seconds=RECOMMEND_DEADLINE_SECONDS
+                ))
+                _degraded_stats["deadline_exceeded"] += 1
+                delta, scenario, failed = None, None, True
+            
+            if delta is not None:
+                sent_any = True
+                yield format_sse("scenario", {"delta": delta})
+                continue
+            
+            # 중간에 끊긴 스트림은 받은 부분까지만 두고 degraded로 표시
+            degraded = failed or scenario is None
+            if degraded:
+                _degraded_stats["degraded"] += 1
+            if scenario is None:
+                scenario = build_template_scenario(keywords, hybrid_result["results"])
+                yield format_sse("scenario", {"delta": scenario})
+            yield format_sse("done", {"scenario": scenario, "degraded": degraded})
+            return
+    finally:
+        # 클라이언트 연결이 끊기면 시나리오 스트림도 정리
+        if not scenario_task.done():
+            scenario_task.cancel()
+
+def get_recommend_status() -> Dict[str, Any]:
+    """추천 서비스 상태 확인 (디버깅용)"""
+    return {
+        "status": "healthy",
+        "data_count": len(_tfidf.df) if _tfidf is not None else 0,
+        "recommenders_loaded": {"tfidf": _tfidf is not None, "sbert": _sbert is not None},
+        "deadline_seconds": RECOMMEND_DEADLINE_SECONDS,
+        "degraded": dict(_degraded_stats),
+        "scenario_pool": scenario_pool.stats() if scenario_pool is not None else {"enabled": False},
+        "singleflight": get_singleflight_stats(),
+        "llm_gateway": get_llm_gateway_stats()
     }
@@ -1,7 +1,9 @@
 # recommender_hybrid.py
+import logging
 import numpy as np
 import random
 import hashlib
+import time
 from sklearn.metrics.pairwise import cosine_similarity
 from app.core.config import (
     DEFAULT_TOP_N, 
@@ -18,6 +20,11 @@ from app.core.config import (
     ENABLE_SEED_RANDOMIZATION
 )
 from app.core.utils import safe_str
+from app.core.metrics import timed_stage, observe_stage
+from app.core.logger import get_logger, kv
+from app.core.profiling import traced
+
+logger = get_logger("hybrid")
 
 
 class HybridPerfumeRecommender:
@@ -319,19 +326,22 @@ class HybridPerfumeRecommender:
         
         return final_seed
     
-    def _ensure_diversity(self, candidates: list, top_n: int, user_keywords: list = None) -> list:
+    @timed_stage("mmr")
+    def _ensure_diversity(self, candidates: list, top_n: int, user_keywords: list = None, diversity_seed: int = None) -> list:
         """
         다양성을 보장하는 최종 선별 알고리즘
         - MMR 등들라리 선별을 통한 다양성 최적화
         - 키워드 기반 다양성 고려 추가
+        - diversity_seed를 주면 그 시드로 고정 (골든 테스트 재현용)
         """
         if len(candidates) <= top_n:
             return candidates
         
-        # 다양성 시드 적용
-        diversity_seed = self._generate_diversity_seed(user_keywords or [])
-        random.seed(diversity_seed)
-        print(f"🎲 다양성 시드 적용: {diversity_seed}")
+        # 다양성 시드 적용 (요청별 Random 인스턴스 → 동시 요청끼리 전역 random 상태를 공유하지 않음)
+        if diversity_seed is None:
+            diversity_seed = self._generate_diversity_seed(user_keywords or [])
+        rng = random.Random(diversity_seed)
+        logger.debug("🎲 다양성 시드 적용", extra=kv(seed=diversity_seed))
         
         selected = []
         remaining = candidates.copy()
@@ -339,7 +349,7 @@ class HybridPerfumeRecommender:
         # 첫 번째 선택에 약간의 랜덤성 추가 (상위 3개 중에서 선택)
         if ENABLE_SEED_RANDOMIZATION and len(remaining) >= 3:
             top_3_candidates = remaining[:3]
-            first_choice = random.choice(top_3_candidates)
+            first_choice = rng.choice(top_3_candidates)
             remaining.remove(first_choice)
             selected.append(first_choice)
         else:
@@ -371,7 +381,7 @@ class HybridPerfumeRecommender:
                 
                 if total_weight > 0:
                     # 가중치 기반 랜덤 선택
-                    rand_val = random.uniform(0, total_weight)
+                    rand_val = rng.uniform(0, total_weight)
                     cumulative = 0
                     selected_idx = top_candidates[0][0]  # 기본값
                     
@@ -394,6 +404,7 @@ class HybridPerfumeRecommender:
         
         return selected
     
+    @timed_stage("brand_filter")
     def _apply_brand_diversity_filter(self, candidates: list, top_n: int) -> list:
         """
         브랜드 다양성을 보장하는 사전 필터링
@@ -447,11 +458,16 @@ class HybridPerfumeRecommender:
         
         final_candidates = selected_candidates + remaining_candidates
         
-        print(f"🎨 브랜드 다양성 필터링 - 전체: {len(candidates)}개, 선별: {len(final_candidates[:top_n*3])}개")
-        print(f"🎨 브랜드 분포: {dict(brand_quotas)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎨 브랜드 다양성 필터링", extra=kv(
+                candidates=len(candidates),
+                selected=len(final_candidates[:top_n*3]),
+                brand_distribution=dict(brand_quotas)
+            ))
         
         return final_candidates[:top_n*3]  # MMR용 후보군 반환
     
+    @timed_stage("diversity_validation")
     def _validate_recommendation_diversity(self, results: list, threshold: float = 0.6) -> dict:
         """
         추천 결과의 다양성 검증
@@ -514,6 +530,7 @@ class HybridPerfumeRecommender:
             "tier_diversity": round(tier_diversity, 3)
         }
     
+    @timed_stage("alternative_fallback")
     def _get_alternative_recommendations(self, original_results: list, user_keywords: list, top_n: int) -> list:
         """
         다양성 부족 시 대체 추천 생성
@@ -548,9 +565,39 @@ class HybridPerfumeRecommender:
             return alternative_candidates[:top_n]
             
         except Exception as e:
-            print(f"❌ 대체 추천 생성 실패: {e}")
+            logger.error("❌ 대체 추천 생성 실패", extra=kv(error=str(e)))
             return original_results
 
+    @traced("hybrid.recommend")
+    def score_candidates(
+        self,
+        ambience: str,
+        style: str,
+        gender: str,
+        season: str,
+        personality: str,
+        top_n: int = DEFAULT_TOP_N
+    ) -> dict:
+        """
+        TF-IDF / SBERT 확장 후보군 점수 계산 (시드와 무관한 결정적 단계)
+        - 같은 입력이면 결과가 같으므로 동시 요청끼리 공유 가능 (recommend의 candidates로 전달)
+        """
+        # 후보군 확장: 더 많은 후보를 확보하여 다양성 개선
+        expansion_factor = 5  # 기존 2배에서 5배로 확장
+        expanded_top_n = max(top_n * expansion_factor, 15)  # 최소 15개 보장
+        
+        logger.debug("📈 후보군 확장", extra=kv(top_n=top_n, expanded_top_n=expanded_top_n))
+        
+        # 추천 결과 얻기 (확장된 후보군)
+        return {
+            "tfidf": self.tfidf.recommend(
+                ambience, style, gender, season, personality, top_n=expanded_top_n
+            ),
+            "sbert": self.sbert.recommend(
+                ambience, style, gender, season, personality, top_n=expanded_top_n
+            )
+        }
+
     def recommend(
         self, 
         ambience: str, 
@@ -559,7 +606,10 @@ class HybridPerfumeRecommender:
         season: str, 
         personality: str,
         top_n: int = DEFAULT_TOP_N, 
-        alpha: float = None
+        alpha: float = None,
+        deadline: float = None,
+        diversity_seed: int = None,
+        candidates: dict = None
     ) -> dict:
         """
         고도화된 하이브리드 추천 시스템
@@ -567,31 +617,24 @@ class HybridPerfumeRecommender:
         - MMR 기반 다양성 보장
         - 데이터셋 장소 속성 내부 활용
         - 개선된 유사도 계산
+        - deadline (time.monotonic 기준) 이 지나면 선택 단계인 대체 추천 생략
+        - diversity_seed: MMR 다양성 시드 고정 (기본: 요청마다 새 시드)
+        - candidates: score_candidates 결과 (같은 top_n으로 계산한 것, 없으면 여기서 계산)
         """
-
-        # 후보군 확장: 더 많은 후보를 확보하여 다양성 개선
-        expansion_factor = 5  # 기존 2배에서 5배로 확장
-        expanded_top_n = max(top_n * expansion_factor, 15)  # 최소 15개 보장
-        
-        print(f"📈 후보군 확장 - 요청: {top_n}개, 후보군: {expanded_top_n}개")
-        
-        # 추천 결과 얻기 (확장된 후보군)
-        tfidf_result = self.tfidf.recommend(
-            ambience, style, gender, season, personality, top_n=expanded_top_n
-        )
-        sbert_result = self.sbert.recommend(
-            ambience, style, gender, season, personality, top_n=expanded_top_n
-        )
+        if candidates is None:
+            candidates = self.score_candidates(ambience, style, gender, season, personality, top_n=top_n)
+        tfidf_result, sbert_result = candidates["tfidf"], candidates["sbert"]
+        fusion_started = time.perf_counter()
 
         # 동적 가중치 계산
         if alpha is None:
             alpha = self._calculate_dynamic_alpha(tfidf_result["average_similarity"])
         
-        print(f"🔧 하이브리드 가중치 최적화 - TF-IDF: {alpha:.2f}, SBERT: {1-alpha:.2f}")
+        logger.debug("🔧 하이브리드 가중치 최적화", extra=kv(tfidf=round(alpha, 2), sbert=round(1 - alpha, 2)))
 
         # TF-IDF 결과가 없는 경우 SBERT 단독 사용
         if tfidf_result["average_similarity"] == 0:
-            print("⚠️ TF-IDF 결과 없음 - SBERT 단독 모드로 전환")
+            logger.warning("⚠️ TF-IDF 결과 없음 - SBERT 단독 모드로 전환")
             final_results = sbert_result["results"][:top_n]
             return {
                 "average_similarity": sbert_result["average_similarity"],
@@ -600,7 +643,7 @@ class HybridPerfumeRecommender:
         
         # SBERT 결과가 없는 경우 TF-IDF 단독 사용 (추가 안전장치)
         if not sbert_result["results"]:
-            print("⚠️ SBERT 결과 없음 - TF-IDF 단독 모드로 전환")
+            logger.warning("⚠️ SBERT 결과 없음 - TF-IDF 단독 모드로 전환")
             final_results = tfidf_result["results"][:top_n]
             return {
                 "average_similarity": tfidf_result["average_similarity"],
@@ -612,7 +655,7 @@ class HybridPerfumeRecommender:
             tfidf_scores = {f"{r['brand']}|{r['name']}": r.get("similarity", 0) for r in tfidf_result["results"] if r.get('brand') and r.get('name')}
             sbert_scores = {f"{r['brand']}|{r['name']}": r.get("similarity", 0) for r in sbert_result["results"] if r.get('brand') and r.get('name')}
         except Exception as e:
-            print(f"❌ 스코어 매핑 중 오류: {e}")
+            logger.error("❌ 스코어 매핑 중 오류", extra=kv(error=str(e)))
             # Fallback: 가장 좋은 단일 결과 반환
             best_result = tfidf_result if tfidf_result["average_similarity"] > sbert_result["average_similarity"] else sbert_result
             return {
@@ -620,12 +663,12 @@ class HybridPerfumeRecommender:
                 "results": best_result["results"][:top_n]
             }
         
-        # 안전한 항목 결합
-        all_items = list({*tfidf_scores.keys(), *sbert_scores.keys()})
+        # 안전한 항목 결합 (정렬해서 동점 후보 순서가 해시 시드에 따라 달라지지 않게 함)
+        all_items = sorted({*tfidf_scores.keys(), *sbert_scores.keys()})
         combined_candidates = []
         
         if not all_items:
-            print("❌ 결합할 추천 결과가 없음 - 기본 결과 반환")
+            logger.error("❌ 결합할 추천 결과가 없음 - 기본 결과 반환")
             return {
                 "average_similarity": 0.1,
                 "results": []
@@ -641,7 +684,7 @@ class HybridPerfumeRecommender:
                 
                 # 안전한 파싱
                 if "|" not in item:
-                    print(f"⚠️ 잘못된 아이템 형식: {item}")
+                    logger.warning("⚠️ 잘못된 아이템 형식", extra=kv(item=item))
                     continue
                     
                 brand, name = item.split("|", 1)  # 최대 1번만 분할
@@ -657,24 +700,25 @@ class HybridPerfumeRecommender:
                     item_info["similarity"] = round(final_score, 4)
                     combined_candidates.append(item_info)
                 else:
-                    print(f"⚠️ 아이템 정보 찾을 수 없음: {brand} | {name}")
+                    logger.warning("⚠️ 아이템 정보 찾을 수 없음", extra=kv(brand=brand, name=name))
                     
             except Exception as e:
-                print(f"❌ 아이템 처리 중 오류: {item}, 에러: {e}")
+                logger.error("❌ 아이템 처리 중 오류", extra=kv(item=item, error=str(e)))
                 continue
         
         # 점수순 정렬 (안전한 처리)
         try:
             combined_candidates.sort(key=lambda x: x.get("similarity", 0), reverse=True)
         except Exception as e:
-            print(f"❌ 정렬 중 오류: {e}")
+            logger.error("❌ 정렬 중 오류", extra=kv(error=str(e)))
             # 정렬 실패 시 그대로 사용
+        observe_stage("fusion", time.perf_counter() - fusion_started)
         
         # 브랜드 다양성 사전 필터링
         try:
             diverse_candidates = self._apply_brand_diversity_filter(combined_candidates, top_n)
         except Exception as e:
-            print(f"❌ 브랜드 다양성 필터링 중 오류: {e}")
+            logger.error("❌ 브랜드 다양성 필터링 중 오류", extra=kv(error=str(e)))
             diverse_candidates = combined_candidates
         
         # 키워드 준비
@@ -682,9 +726,9 @@ class HybridPerfumeRecommender:
         
         # MMR 기반 다양성 보장 선별 (키워드 전달)
         try:
-            final_results = self._ensure_diversity(diverse_candidates, top_n, user_keywords)
+            final_results = self._ensure_diversity(diverse_candidates, top_n, user_keywords, diversity_seed)
         except Exception as e:
-            print(f"❌ 다양성 선별 중 오류: {e}")
+            logger.error("❌ 다양성 선별 중 오류", extra=kv(error=str(e)))
             # Fallback: 브랜드 다양성 필터링된 결과에서 상위 N개 선택
             final_results = diverse_candidates[:top_n]
             
@@ -695,7 +739,7 @@ class HybridPerfumeRecommender:
                 name = result.get("name", "")
                 
                 if not brand or not name:
-                    print(f"⚠️ 브랜드 또는 향수명이 누락됨: {result}")
+                    logger.warning("⚠️ 브랜드 또는 향수명이 누락됨", extra=kv(index=i))
                     result["relatedKeywords"] = user_keywords[:3]
                     continue
                 
@@ -715,26 +759,31 @@ class HybridPerfumeRecommender:
                     else:
                         result["relatedKeywords"] = user_keywords[:3]
                 else:
-                    print(f"⚠️ DB에서 향수를 찾을 수 없음: {brand} - {name}")
+                    logger.warning("⚠️ DB에서 향수를 찾을 수 없음", extra=kv(brand=brand, name=name))
                     result["relatedKeywords"] = user_keywords[:3]
                     
             except Exception as e:
-                print(f"❌ 키워드 업데이트 실패 (인덱스 {i}): {e}")
+                logger.error("❌ 키워드 업데이트 실패", extra=kv(index=i, error=str(e)))
                 result["relatedKeywords"] = user_keywords[:3]
 
         # 다양성 검증 및 재추천 시스템
         diversity_check = self._validate_recommendation_diversity(final_results)
-        print(f"📋 다양성 검증 - 점수: {diversity_check['diversity_score']}, 브랜드: {diversity_check['brand_diversity']}")
+        logger.debug("📋 다양성 검증", extra=kv(
+            score=diversity_check["diversity_score"], brand=diversity_check["brand_diversity"]
+        ))
         
         # 다양성이 부족한 경우 대체 추천 생성
-        if not diversity_check["is_diverse"] and len(final_results) >= 2:
-            print("⚠️ 다양성 부족 감지 - 대체 추천 시도")
+        if deadline is not None and time.monotonic() >= deadline:
+            if not diversity_check["is_diverse"]:
+                logger.info("⏱️ 시간 예산 초과 - 대체 추천 생략")
+        elif not diversity_check["is_diverse"] and len(final_results) >= 2:
+            logger.debug("⚠️ 다양성 부족 감지 - 대체 추천 시도")
             alternative_results = self._get_alternative_recommendations(final_results, user_keywords, top_n)
             
             # 대체 추천의 다양성 재검증
             alt_diversity = self._validate_recommendation_diversity(alternative_results)
             if alt_diversity["diversity_score"] > diversity_check["diversity_score"]:
-                print(f"✅ 대체 추천 적용 - 개선된 다양성: {alt_diversity['diversity_score']}")
+                logger.debug("✅ 대체 추천 적용", extra=kv(diversity_score=alt_diversity["diversity_score"]))
                 final_results = alternative_results
                 diversity_check = alt_diversity
         
@@ -743,20 +792,25 @@ class HybridPerfumeRecommender:
             similarity_scores = [r.get("similarity", 0) for r in final_results if r.get("similarity") is not None]
             avg_score = sum(similarity_scores) / len(similarity_scores) if similarity_scores else 0
         except Exception as e:
-            print(f"❌ 평균 점수 계산 실패: {e}")
+            logger.error("❌ 평균 점수 계산 실패", extra=kv(error=str(e)))
             avg_score = 0.1  # 기본값
         
         # 최종 검증
         if not final_results:
-            print("❌ 최종 결과가 비어있음 - 빈 결과 반환")
+            logger.error("❌ 최종 결과가 비어있음 - 빈 결과 반환")
             return {
                 "average_similarity": 0,
                 "results": []
             }
         
-        print(f"✅ 추천 완료 - {len(final_results)}개 결과, 평균 유사도: {avg_score:.4f}")
-        print(f"✅ 최종 다양성 - 브랜드: {diversity_check['brand_diversity']}, 노트: {diversity_check['note_diversity']}")
-        print(f"✅ 확장 다양성 - 향수계열: {diversity_check['family_diversity']}, 가격대: {diversity_check['tier_diversity']}")
+        logger.info("✅ 추천 완료", extra=kv(
+            results=len(final_results),
+            avg_similarity=round(avg_score, 4),
+            brand_diversity=diversity_check["brand_diversity"],
+            note_diversity=diversity_check["note_diversity"],
+            family_diversity=diversity_check["family_diversity"],
+            tier_diversity=diversity_check["tier_diversity"]
+        ))
 
         return {
             "average_similarity": round(avg_score, 4),
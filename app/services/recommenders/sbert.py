@@ -2,10 +2,12 @@
 import pandas as pd
 import numpy as np
 from app.core.utils import safe_str, load_excel_from_s3
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
+from app.core.metrics import timed_stage
+from app.core.model_registry import get_sentence_model
 from app.core.config import (
     SBERT_MODEL_NAME, 
+    SBERT_ENCODER_BACKEND, 
     DEFAULT_TOP_N, 
     S3_BUCKET, 
     S3_KEY
@@ -21,7 +23,7 @@ class SBERTPerfumeRecommender:
             SBERTPerfumeRecommender._cache = load_excel_from_s3(S3_BUCKET, S3_KEY)
         self.df = SBERTPerfumeRecommender._cache
         self.df = self.df.dropna(subset=["향수이름", "향수 키워드"])
-        self.model = SentenceTransformer(SBERT_MODEL_NAME)
+        self.model = get_sentence_model(SBERT_MODEL_NAME, SBERT_ENCODER_BACKEND)  # 프로세스 전역 공유 인스턴스
 
         self._prepare_texts()
         self._embed_texts()
@@ -63,55 +65,41 @@ class SBERTPerfumeRecommender:
         )
 
     def _embed_texts(self):
-        """다층 벡터 임베딩 생성"""
+        """다층 벡터 임베딩 생성 (인코더 백엔드와 무관하게 encode 결과는 numpy 배열)"""
         # 전체 텍스트 임베딩
-        self.embeddings = self.model.encode(
-            self.df["full_text"].tolist(), 
-            convert_to_tensor=True
-        ).cpu().numpy()
+        self.embeddings = self.model.encode(self.df["full_text"].tolist())
         
         # 그룹별 임베딩 (더 정밀한 분석용)
-        self.core_embeddings = self.model.encode(
-            self.df["core_text"].tolist(),
-            convert_to_tensor=True
-        ).cpu().numpy()
-        
-        self.note_embeddings = self.model.encode(
-            self.df["note_text"].tolist(),
-            convert_to_tensor=True
-        ).cpu().numpy()
-        
-        self.context_embeddings = self.model.encode(
-            self.df["context_text"].tolist(),
-            convert_to_tensor=True
-        ).cpu().numpy()
+        self.core_embeddings = self.model.encode(self.df["core_text"].tolist())
+        
+        self.note_embeddings = self.model.encode(self.df["note_text"].tolist())
+        
+        self.context_embeddings = self.model.encode(self.df["context_text"].tolist())
 
+    @timed_stage("sbert_related_keywords")
     def _get_top_related_keywords(self, keywords: list[str], perfume_text: str, topn: int = 3) -> list[str]:
-        perfume_vec = self.model.encode(perfume_text, convert_to_tensor=True).cpu().numpy()
-        scores = {}
-
-        for kw in keywords:
-            try:
-                kw_vec = self.model.encode(kw, convert_to_tensor=True).cpu().numpy()
-                sim = cosine_similarity([kw_vec], [perfume_vec])[0][0]
-                scores[kw] = sim
-            except Exception:
-                continue
+        # 향수 문장 + 키워드를 encode 한 번으로 처리 (동시 요청과 함께 배칭됨)
+        try:
+            vectors = self.model.encode([perfume_text, *keywords])
+        except Exception:
+            return []
+        similarities = cosine_similarity(vectors[1:], vectors[:1])[:, 0]
+        scores = dict(zip(keywords, similarities))
 
         sorted_kws = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         return [kw for kw, _ in sorted_kws[:topn]]
 
+    @timed_stage("sbert_encode")
     def _create_weighted_query_embedding(self, ambience: str, style: str, gender: str, season: str, personality: str) -> np.ndarray:
         """가중치가 적용된 쿼리 임베딩 생성"""
         
         # 1. 핵심 키워드 기반 쿼리
         core_query = f"이 향수는 {ambience}, {style}, {personality} 느낌의 향수입니다."
-        core_embedding = self.model.encode(core_query, convert_to_tensor=True).cpu().numpy()
         
         # 2. 컨텍스트 기반 쿼리 (성별, 계절)
         context_parts = [gender, season]
         context_query = f"이 향수는 {', '.join(context_parts)}에 어울리는 향수입니다."
-        context_embedding = self.model.encode(context_query, convert_to_tensor=True).cpu().numpy()
+        core_embedding, context_embedding = self.model.encode([core_query, context_query])
         
         # 3. 가중 평균으로 결합
         weighted_embedding = (
@@ -121,21 +109,22 @@ class SBERTPerfumeRecommender:
         
         return weighted_embedding
     
+    @timed_stage("sbert_similarity")
     def _calculate_multi_layer_similarity(self, query_embedding: np.ndarray, ambience: str, style: str, gender: str, season: str, personality: str) -> np.ndarray:
         """다층 벡터 기반 유사도 계산"""
         
         # 1. 전체 유사도 (70% 비중)
         full_similarities = cosine_similarity([query_embedding], self.embeddings)[0]
         
-        # 2. 핵심 속성 유사도 (20% 비중)
         core_query = f"{ambience} {style} {personality}"
-        core_query_emb = self.model.encode(core_query, convert_to_tensor=True).cpu().numpy()
+        context_parts = [gender, season]
+        context_query = " ".join(context_parts)
+        core_query_emb, context_query_emb = self.model.encode([core_query, context_query])
+        
+        # 2. 핵심 속성 유사도 (20% 비중)
         core_similarities = cosine_similarity([core_query_emb], self.core_embeddings)[0]
         
         # 3. 컨텍스트 속성 유사도 (10% 비중)
-        context_parts = [gender, season]
-        context_query = " ".join(context_parts)
-        context_query_emb = self.model.encode(context_query, convert_to_tensor=True).cpu().numpy()
         context_similarities = cosine_similarity([context_query_emb], self.context_embeddings)[0]
         
         # 가중 결합
@@ -4,6 +4,8 @@ from app.core.utils import safe_str
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from app.core.utils import load_excel_from_s3
+from app.core.metrics import timed_stage
+from app.core.logger import get_logger, kv
 from app.core.config import S3_BUCKET, S3_KEY
 from app.core.config import (
     TFIDF_NGRAM_RANGE,
@@ -17,6 +19,8 @@ from app.core.config import (
     NOTE_DIVERSITY_RATIO
 )
 
+logger = get_logger("tfidf")
+
 
 class PerfumeRecommender:
     _cache = None  # 캐싱: 한 번만 로드
@@ -167,6 +171,7 @@ class PerfumeRecommender:
         sorted_keywords = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         return [kw for kw, _ in sorted_keywords[:3]]
 
+    @timed_stage("tfidf_scoring")
     def recommend(self, ambience: str, style: str, gender: str, season: str, personality: str, top_n: int = 3) -> dict:
         """
         개선된 TF-IDF 추천 시스템
@@ -178,13 +183,12 @@ class PerfumeRecommender:
         
         # 키워드 희소성 기반 동적 가중치 적용
         weighted_query = self._apply_keyword_weights(" ".join(user_keywords), user_keywords)
-        print(f"🎯 키워드 가중치 적용 - 원본: {user_keywords}")
-        print(f"🎯 가중치 적용 후: {weighted_query}")
+        logger.debug("🎯 키워드 가중치 적용", extra=kv(keywords=user_keywords, weighted_query=weighted_query))
         
         query_vec = self.vectorizer.transform([weighted_query])
 
         if query_vec.nnz == 0:
-            print("❌ query 벡터가 0입니다. 유사도 계산 불가")
+            logger.warning("❌ query 벡터가 0입니다. 유사도 계산 불가")
             return {
                 "average_similarity": 0,
                 "results": []
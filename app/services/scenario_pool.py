@@ -0,0 +1,176 @@
+# app/services/scenario_pool.py
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Any, Optional
+
+from app.core.config import (
+    settings,
+    SCENARIO_POOL_ENABLED,
+    SCENARIO_POOL_SIZE,
+    SCENARIO_POOL_LOW_WATERMARK,
+    SCENARIO_POOL_MAX_SERVES,
+    SCENARIO_POOL_MAX_KEYS
+)
+from app.services.generator import generate_scenario
+from app.core.metrics import REGISTRY, stats_lines
+from app.core.logger import get_logger, kv
+
+logger = get_logger("scenario")
+
+
+def normalize_keywords(keywords: List[str]) -> tuple:
+    """키워드 5-튜플 정규화 (필드 순서는 유지, 공백/대소문자 차이 무시)"""
+    return tuple(" ".join(str(k).split()).lower() for k in keywords)
+
+
+class _PoolEntry:
+    """키워드 조합 하나의 시나리오 변형 풀"""
+
+    def __init__(self):
+        self.variants = []  # [시나리오, 제공 횟수] 목록
+        self.refilling = False
+        self.last_access = time.time()
+
+
+class ScenarioPool:
+    """
+    키워드 조합별 시나리오 변형 풀 캐시
+    - 키당 pool_size개의 미리 생성된 시나리오를 보관하고 랜덤으로 즉시 반환
+    - 한 변형은 max_serves번 제공되면 풀에서 제거 (출력 다양성 유지)
+    - 남은 변형이 low_watermark 미만이면 백그라운드에서 GPT로 다시 채움
+    - 풀이 비어 있는 첫 요청만 GPT 응답을 기다림
+    """
+
+    def __init__(
+        self,
+        generate: Callable[..., Awaitable[str]],
+        pool_size: int = SCENARIO_POOL_SIZE,
+        low_watermark: int = SCENARIO_POOL_LOW_WATERMARK,
+        max_serves: int = SCENARIO_POOL_MAX_SERVES,
+        max_keys: int = SCENARIO_POOL_MAX_KEYS
+    ):
+        self.generate = generate
+        self.pool_size = max(1, pool_size)
+        self.low_watermark = min(low_watermark, self.pool_size)
+        self.max_serves = max(1, max_serves)
+        self.max_keys = max_keys
+        self._pools = OrderedDict()
+        self._tasks = set()  # 백그라운드 refill 태스크 참조 유지
+        self._stats = {"hits": 0, "misses": 0, "generated": 0, "generation_errors": 0, "refills": 0}
+
+    async def get_scenario(self, keywords: List[str], timeout: Optional[float] = None) -> str:
+        """
+        키워드 조합에 맞는 시나리오 반환 (풀에 있으면 즉시, 없으면 생성)
+        - timeout: 요청 경로에서 직접 생성할 때 LLM 호출에 전달할 남은 시간 예산
+        - 생성 실패 시 예외를 전달하고, 다음 요청을 위해 백그라운드 refill은 시작
+        """
+        scenario = self.take_pooled(keywords)
+        if scenario is not None:
+            return scenario
+
+        try:
+            scenario = await self.generate(keywords, timeout=timeout)
+        except Exception:
+            self._stats["generation_errors"] += 1
+            key = normalize_keywords(keywords)
+            self._schedule_refill(key, self._get_entry(key), keywords)
+            raise
+
+        self.add_generated(keywords, scenario)
+        return scenario
+
+    def take_pooled(self, keywords: List[str]) -> Optional[str]:
+        """풀에 변형이 있으면 하나를 꺼내 반환 (없으면 None, miss로 집계)"""
+        key = normalize_keywords(keywords)
+        entry = self._get_entry(key)
+
+        if not entry.variants:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["hits"] += 1
+        scenario = self._take_variant(entry)
+        self._schedule_refill(key, entry, keywords)
+        return scenario
+
+    def add_generated(self, keywords: List[str], scenario: str) -> None:
+        """요청 경로에서 직접 생성한 시나리오를 풀에 넣어 재사용 (이번 요청에서 1회 제공)"""
+        key = normalize_keywords(keywords)
+        entry = self._get_entry(key)
+        self._stats["generated"] += 1
+        if self.max_serves > 1 and len(entry.variants) < self.pool_size:
+            entry.variants.append([scenario, 1])
+        self._schedule_refill(key, entry, keywords)
+
+    def _get_entry(self, key: tuple) -> _PoolEntry:
+        entry = self._pools.get(key)
+        if entry is None:
+            entry = _PoolEntry()
+            self._pools[key] = entry
+            # 키 개수 상한 초과 시 가장 오래 사용되지 않은 조합부터 제거
+            while len(self._pools) > self.max_keys:
+                self._pools.popitem(last=False)
+        else:
+            self._pools.move_to_end(key)
+        entry.last_access = time.time()
+        return entry
+
+    def _take_variant(self, entry: _PoolEntry) -> str:
+        variant = random.choice(entry.variants)
+        variant[1] += 1
+        if variant[1] >= self.max_serves:
+            entry.variants.remove(variant)
+        return variant[0]
+
+    def _schedule_refill(self, key: tuple, entry: _PoolEntry, keywords: List[str]) -> None:
+        if entry.refilling or len(entry.variants) >= self.low_watermark:
+            return
+        entry.refilling = True
+        task = asyncio.ensure_future(self._refill(key, entry, list(keywords)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, key: tuple, entry: _PoolEntry, keywords: List[str]) -> None:
+        """풀을 pool_size개까지 백그라운드에서 채움"""
+        self._stats["refills"] += 1
+        try:
+            missing = self.pool_size - len(entry.variants)
+            results = await asyncio.gather(
+                *[self.generate(keywords) for _ in range(missing)],
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self._stats["generation_errors"] += 1
+                    logger.warning("시나리오 풀 채우기 실패", extra=kv(error=f"{type(result).__name__}: {result}"))
+                    continue
+                self._stats["generated"] += 1
+                # 채우는 사이 LRU에서 밀려난 조합이면 버림
+                if self._pools.get(key) is entry and len(entry.variants) < self.pool_size:
+                    entry.variants.append([result, 0])
+        finally:
+            entry.refilling = False
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 통계 (hit rate 포함)"""
+        stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["keys"] = len(self._pools)
+        stats["pooled_variants"] = sum(len(entry.variants) for entry in self._pools.values())
+        stats["refilling"] = len(self._tasks)
+        return stats
+
+
+async def _generate_with_settings_key(keywords: List[str], timeout: Optional[float] = None) -> str:
+    return await generate_scenario(keywords, settings.OPENAI_API_KEY, timeout=timeout)
+
+
+# 전역 시나리오 풀 (SCENARIO_POOL_ENABLED=false면 None)
+scenario_pool = ScenarioPool(_generate_with_settings_key) if SCENARIO_POOL_ENABLED else None
+
+if scenario_pool is not None:
+    REGISTRY.register_collector(lambda: stats_lines("scenario_pool", scenario_pool.stats()))
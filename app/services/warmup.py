@@ -0,0 +1,198 @@
+# app/services/warmup.py
+# 시작 시 워밍업 (추천기 병렬 생성 + 추론 예열) 과 준비 상태 추적 (GET /health/ready)
+import asyncio
+import functools
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import (
+    WARMUP_ON_STARTUP,
+    WARMUP_QUERY,
+    WARMUP_PBTI_MBTI_TYPES,
+    WARMUP_RETRY_BASE_SECONDS,
+    WARMUP_RETRY_MAX_SECONDS,
+    MODEL_LOAD_POLICY,
+    SBERT_MODEL_NAME,
+    PBTI_SBERT_MODEL_NAME,
+    SBERT_ENCODER_BACKEND,
+    PBTI_ENCODER_BACKEND
+)
+from app.core.logger import get_logger, kv
+from app.core.metrics import REGISTRY, Gauge
+from app.core.model_registry import SERVICE_MODELS, model_key, model_registry
+from app.services.recommend_full import get_tfidf_recommender, get_sbert_recommender, get_hybrid_recommender
+from app.services.pbti.pbti_recommender import warm_perfume_recommendations
+
+logger = get_logger("warmup")
+
+COMPONENT_READY = REGISTRY.register(Gauge(
+    "app_component_ready", "구성 요소 준비 여부 (1: 준비 완료)", ["component"]
+))
+COMPONENT_LOAD_SECONDS = REGISTRY.register(Gauge(
+    "app_component_load_seconds", "구성 요소 생성 + 예열 시간 (초)", ["component"]
+))
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class ReadinessTracker:
+    """
+    구성 요소별 준비 상태
+    - pending → loading → ready | failed (failed는 재시도 대기 중, 다음 시도 때 다시 loading)
+    - 모든 구성 요소가 ready여야 준비 완료 (워밍업을 끄면 첫 요청 때 생성하므로 lazy로 표시하고 준비 완료로 봄)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self.started_at = _now_iso()
+
+    def register(self, name: str, status: str = "pending") -> None:
+        with self._lock:
+            self._components[name] = {"status": status}
+        COMPONENT_READY.set(1 if status in ("ready", "lazy") else 0, component=name)
+
+    def mark_loading(self, name: str) -> None:
+        with self._lock:
+            self._components[name] = {"status": "loading", "started_at": _now_iso()}
+
+    def mark_ready(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._components[name].update({"status": "ready", "loaded_at": _now_iso(), "seconds": round(seconds, 3)})
+        COMPONENT_READY.set(1, component=name)
+        COMPONENT_LOAD_SECONDS.set(seconds, component=name)
+
+    def mark_failed(self, name: str, error: str, attempts: int = 1, retry_in: Optional[float] = None) -> None:
+        with self._lock:
+            self._components.setdefault(name, {}).update({
+                "status": "failed", "failed_at": _now_iso(), "error": error,
+                "attempts": attempts, "retry_in_seconds": retry_in
+            })
+        COMPONENT_READY.set(0, component=name)
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return all(component["status"] in ("ready", "lazy") for component in self._components.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            components = {name: dict(component) for name, component in self._components.items()}
+        statuses = {component["status"] for component in components.values()}
+        if statuses <= {"ready", "lazy"}:
+            status = "ready"
+        elif "failed" in statuses:
+            status = "failed"
+        else:
+            status = "starting"
+        return {"status": status, "started_at": self.started_at, "components": components}
+
+
+readiness = ReadinessTracker()
+
+
+def _warm_tfidf() -> None:
+    get_tfidf_recommender().recommend(*WARMUP_QUERY)
+
+
+def _warm_sbert() -> None:
+    # 첫 encode 호출의 지연 (토크나이저 / 스레드풀 초기화) 을 여기서 소모
+    get_sbert_recommender().recommend(*WARMUP_QUERY)
+
+
+def _warm_hybrid() -> None:
+    get_hybrid_recommender().recommend(*WARMUP_QUERY)
+
+
+def _warm_pbti() -> None:
+    # 모델 로드 + 향수 임베딩 + 16개 유형 추천 결과 미리 계산
+    warm_perfume_recommendations(WARMUP_PBTI_MBTI_TYPES)
+
+
+def _model_components() -> Dict[str, tuple]:
+    """eager 정책: 모델마다 별도 구성 요소로 병렬 로드 (lazy면 추천기 생성 때 로드)"""
+    if MODEL_LOAD_POLICY != "eager":
+        return {}
+    return {
+        f"model:{model_key(name, backend)}": (functools.partial(model_registry.get, name, backend), ())
+        for name, backend in SERVICE_MODELS
+    }
+
+
+def _model_dependency(model_name: str, backend: str) -> tuple:
+    return (f"model:{model_key(model_name, backend)}",) if MODEL_LOAD_POLICY == "eager" else ()
+
+
+# 구성 요소 → (예열 함수, 먼저 준비되어야 하는 구성 요소)
+COMPONENTS: Dict[str, tuple] = {
+    **_model_components(),
+    "tfidf": (_warm_tfidf, ()),
+    "sbert": (_warm_sbert, _model_dependency(SBERT_MODEL_NAME, SBERT_ENCODER_BACKEND)),
+    "pbti": (_warm_pbti, _model_dependency(PBTI_SBERT_MODEL_NAME, PBTI_ENCODER_BACKEND)),
+    "hybrid": (_warm_hybrid, ("tfidf", "sbert"))
+}
+
+
+async def warm_up(components: Optional[Dict[str, tuple]] = None) -> bool:
+    """
+    구성 요소를 스레드풀에서 병렬로 생성 + 예열 (의존 구성 요소가 있으면 그것부터 기다림)
+    - S3 다운로드 / 모델 추론은 GIL을 놓는 구간이 길어 순차 생성보다 빠름
+    - 실패한 구성 요소는 백오프(WARMUP_RETRY_BASE_SECONDS부터 2배씩, 최대 WARMUP_RETRY_MAX_SECONDS) 후 재시도
+      (시작 시 S3 일시 장애 등으로 /health/ready가 계속 503에 머물지 않도록 성공할 때까지 반복)
+    - 의존 구성 요소가 있으면 그것이 준비될 때까지 pending으로 대기
+    """
+    components = components or COMPONENTS
+    loop = asyncio.get_event_loop()
+    started = time.perf_counter()
+    for name in components:
+        readiness.register(name)
+
+    tasks: Dict[str, asyncio.Future] = {}
+
+    async def run(name: str, func: Callable[[], None], depends_on: tuple) -> bool:
+        if depends_on:
+            await asyncio.gather(*(tasks[dependency] for dependency in depends_on))
+        attempts = 0
+        while True:
+            attempts += 1
+            readiness.mark_loading(name)
+            component_started = time.perf_counter()
+            try:
+                await loop.run_in_executor(None, func)
+            except Exception as e:
+                retry_in = min(WARMUP_RETRY_MAX_SECONDS, WARMUP_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+                readiness.mark_failed(name, f"{type(e).__name__}: {e}", attempts, round(retry_in, 1))
+                logger.error("워밍업 실패", extra=kv(
+                    component=name, attempts=attempts, retry_in=round(retry_in, 1), error=str(e)
+                ), exc_info=True)
+                await asyncio.sleep(retry_in)
+                continue
+            seconds = time.perf_counter() - component_started
+            readiness.mark_ready(name, seconds)
+            logger.info("워밍업 완료", extra=kv(component=name, attempts=attempts, seconds=round(seconds, 3)))
+            return True
+
+    for name, (func, depends_on) in components.items():
+        tasks[name] = asyncio.ensure_future(run(name, func, depends_on))
+    results = await asyncio.gather(*tasks.values())
+    logger.info("전체 워밍업 종료", extra=kv(
+        ready=sum(results), total=len(results), seconds=round(time.perf_counter() - started, 3)
+    ))
+    return all(results)
+
+
+def start_warmup() -> Optional[asyncio.Task]:
+    """
+    lifespan 시작 시 호출 - 워밍업을 백그라운드 task로 실행 (그동안 /health/live 는 응답)
+    - 워밍업을 꺼도 eager 정책이면 모델 로드만 수행
+    """
+    if not WARMUP_ON_STARTUP:
+        model_components = _model_components()
+        for name in COMPONENTS:
+            if name not in model_components:
+                readiness.register(name, status="lazy")
+        return asyncio.ensure_future(warm_up(model_components)) if model_components else None
+    return asyncio.ensure_future(warm_up())
@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# 오프라인 벤치마크 (합성 향수 카탈로그 + S3 / OpenAI / 인코더 스텁)
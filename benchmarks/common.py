@@ -0,0 +1,63 @@
+# benchmarks/common.py
+# 벤치마크 결과 저장 공통 함수 (커밋 간 비교를 위해 git 정보 포함)
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def base_metadata(label: str = "") -> Dict[str, Any]:
+    """실행 환경 + git 커밋 정보"""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "label": label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def latency_summary(seconds: List[float]) -> Dict[str, Any]:
+    """지연 시간 목록(초) → ms 단위 mean / p50 / p95 / p99 / max"""
+    if not seconds:
+        return {"requests": 0}
+    ms = np.array(seconds) * 1000
+    return {
+        "requests": len(seconds),
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+        "max": round(float(ms.max()), 3)
+    }
+
+
+def save_results(output_dir: str, meta: Dict[str, Any], results: List[Dict[str, Any]], prefix: str = "") -> str:
+    """결과 JSON 저장 (파일명: [prefix_]시각_커밋[-dirty][_label].json)"""
+    os.makedirs(output_dir, exist_ok=True)
+    name = datetime.now().strftime("%Y%m%d-%H%M%S") + "_" + (meta["git_commit"] or "nogit")[:8]
+    if prefix:
+        name = f"{prefix}_{name}"
+    if meta["git_dirty"]:
+        name += "-dirty"
+    if meta["label"]:
+        name += f"_{meta['label']}"
+    path = os.path.join(output_dir, name + ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,65 @@
+# benchmarks/compare.py
+# 두 벤치마크 결과 비교 (커밋 간 회귀 확인)
+#   python -m benchmarks.compare benchmarks/results/A.json benchmarks/results/B.json
+import argparse
+import json
+from typing import Any, Dict, Optional
+
+METRICS = (
+    ("construct_seconds", "생성(s)"),
+    ("rss_delta_mb", "메모리(MB)"),
+    ("latency_ms.p50", "p50(ms)"),
+    ("latency_ms.p95", "p95(ms)"),
+    ("latency_ms.p99", "p99(ms)")
+)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _get(entry: Dict[str, Any], dotted: str) -> Optional[float]:
+    value = entry
+    for key in dotted.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if before is None or after is None:
+        return "-"
+    if not before:
+        return f"{after}"
+    return f"{before} → {after} ({(after - before) / before * 100:+.1f}%)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+
+    before, after = _load(args.before), _load(args.after)
+    print(f"before: {before['meta'].get('git_commit')} ({before['meta'].get('timestamp')})")
+    print(f"after : {after['meta'].get('git_commit')} ({after['meta'].get('timestamp')})")
+    if before["meta"].get("encoder") != after["meta"].get("encoder"):
+        print("⚠️ 인코더 설정이 달라 비교가 정확하지 않을 수 있습니다")
+
+    before_index = {(entry["target"], entry["size"]): entry for entry in before["results"]}
+    for entry in after["results"]:
+        key = (entry["target"], entry["size"])
+        previous = before_index.get(key)
+        if previous is None:
+            continue
+        print(f"\n[{key[0]} / {key[1]}개]")
+        for metric, label in METRICS:
+            text = _change(_get(previous, metric), _get(entry, metric))
+            if text != "-":
+                print(f"  {label:10s} {text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# benchmarks/encode_batching.py
+# encode 마이크로 배칭 효과 측정 (동시성 단계별로 직접 encode vs BatchingEncoder 처리량 / 지연 비교)
+#   python -m benchmarks.encode_batching --concurrency 1,4,16,32
+#   python -m benchmarks.encode_batching --encoder real --backend onnx-int8 --window-ms 2,5
+import argparse
+import threading
+import time
+from typing import Any, Dict, List
+
+from benchmarks.common import DEFAULT_OUTPUT_DIR, base_metadata, latency_summary, save_results
+from benchmarks.encoders import sbert_query_texts
+from benchmarks.stubs import StubEncoder
+from app.core.config import SBERT_MODEL_NAME, ENCODE_BATCH_MAX_SIZE
+from app.core.encode_batcher import BatchingEncoder
+from app.core.model_registry import ModelRegistry
+
+
+class SimulatedCostEncoder(StubEncoder):
+    """
+    스텁 인코더 + forward 비용 흉내 (호출당 고정 비용 + 문장당 비용)
+    - 연산 자원 하나를 락으로 공유 → 동시 호출이 torch 스레드를 두고 경쟁하는 상황 재현
+    """
+
+    def __init__(self, call_ms: float, text_ms: float, **kwargs):
+        super().__init__(**kwargs)
+        self.call_seconds = call_ms / 1000
+        self.text_seconds = text_ms / 1000
+        self._compute = threading.Lock()
+
+    def encode(self, sentences, **kwargs):
+        count = 1 if isinstance(sentences, str) else len(sentences)
+        with self._compute:
+            time.sleep(self.call_seconds + self.text_seconds * count)
+        return super().encode(sentences, **kwargs)
+
+
+def run_level(encoder: Any, groups: List[List[str]], concurrency: int, duration: float) -> Dict[str, Any]:
+    """closed loop: 스레드마다 encode 호출(문장 묶음 하나)을 끝나는 즉시 반복"""
+    seconds: List[float] = []
+    texts = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(index: int) -> None:
+        position = index
+        while time.perf_counter() < deadline:
+            group = groups[position % len(groups)]
+            position += concurrency
+            started = time.perf_counter()
+            encoder.encode(group)
+            elapsed = time.perf_counter() - started
+            with lock:
+                seconds.append(elapsed)
+                texts[0] += len(group)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "calls_per_second": round(len(seconds) / elapsed, 2),
+        "texts_per_second": round(texts[0] / elapsed, 2),
+        "latency_ms": latency_summary(seconds)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="encode 마이크로 배칭 효과 측정")
+    parser.add_argument("--concurrency", default="1,4,16,32", help="동시 호출 스레드 수 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=5.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--window-ms", default="2", help="배칭 대기 시간 후보 (쉼표 구분, ms)")
+    parser.add_argument("--max-batch", type=int, default=ENCODE_BATCH_MAX_SIZE)
+    parser.add_argument("--group-size", type=int, default=6, help="호출 하나의 문장 수 (SBERT 관련 키워드 계산: 향수 1 + 키워드 5)")
+    parser.add_argument("--encoder", choices=("stub", "real"), default="stub", help="stub: 비용 흉내 인코더, real: 실제 모델")
+    parser.add_argument("--model", default=SBERT_MODEL_NAME)
+    parser.add_argument("--backend", default="torch", help="real 인코더 백엔드 (torch | onnx | onnx-int8)")
+    parser.add_argument("--call-ms", type=float, default=4.0, help="stub: 호출당 고정 비용 (ms)")
+    parser.add_argument("--text-ms", type=float, default=0.3, help="stub: 문장당 비용 (ms)")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    levels = [int(value) for value in args.concurrency.split(",") if value.strip()]
+    windows = [float(value) for value in args.window_ms.split(",") if value.strip()]
+    if args.encoder == "stub":
+        encoder = SimulatedCostEncoder(args.call_ms, args.text_ms)
+    else:
+        encoder = ModelRegistry().get(args.model, args.backend)
+
+    texts = sbert_query_texts(200, seed=7)
+    groups = [texts[start:start + args.group_size] for start in range(0, len(texts) - args.group_size + 1, args.group_size)]
+    modes = [("direct", None)] + [(f"batch {window:g}ms", window) for window in windows]
+    print(f"🧺 encode 배칭: {args.encoder} 인코더, 호출당 {args.group_size}문장, 단계별 {args.duration}s")
+
+    results = []
+    for concurrency in levels:
+        for mode, window in modes:
+            target = encoder if window is None else BatchingEncoder(encoder, "benchmark", window_ms=window, max_batch=args.max_batch)
+            entry = {"concurrency": concurrency, "mode": mode, **run_level(target, groups, concurrency, args.duration)}
+            if window is not None:
+                stats = target.stats()
+                target.close()
+                entry["avg_batch_calls"] = stats["avg_batch_calls"]
+                entry["avg_batch_texts"] = stats["avg_batch_texts"]
+            results.append(entry)
+            latency = entry["latency_ms"]
+            batch = f", 배치당 호출 {entry['avg_batch_calls']}" if "avg_batch_calls" in entry else ""
+            print(
+                f"  c={concurrency:<3d} {mode:12s} {entry['texts_per_second']:9.1f} 문장/s, "
+                f"p50 {latency['p50']}ms, p95 {latency['p95']}ms, p99 {latency['p99']}ms{batch}"
+            )
+
+    meta = {
+        **base_metadata(args.label),
+        "encoder": args.encoder,
+        "model": args.model if args.encoder == "real" else None,
+        "backend": args.backend if args.encoder == "real" else None,
+        "group_size": args.group_size,
+        "max_batch": args.max_batch,
+        "duration_seconds": args.duration,
+        "stub_cost_ms": {"call": args.call_ms, "text": args.text_ms} if args.encoder == "stub" else None
+    }
+    path = save_results(args.output_dir, meta, results, prefix="batching")
+    print(f"💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# benchmarks/encoders.py
+# 인코더 백엔드 비교 (torch vs ONNX Runtime fp32 / int8): 질의당 지연 시간 + torch 대비 코사인 유사도
+#   python -m benchmarks.encoders                                   # 두 모델 × onnx,onnx-int8
+#   python -m benchmarks.encoders --backends onnx-int8 --min-cosine onnx-int8=0.97 --threads 1
+# 실제 SBERT 모델이 필요함 (hub 또는 MODEL_DIR), 허용 오차를 벗어나면 종료 코드 1
+import argparse
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.catalog import generate_catalog, sample_queries
+from benchmarks.common import DEFAULT_OUTPUT_DIR, base_metadata, latency_summary, save_results
+from app.core.config import SBERT_MODEL_NAME, PBTI_SBERT_MODEL_NAME, WARMUP_PBTI_MBTI_TYPES
+from app.core.model_registry import ModelRegistry, model_key
+from app.core.onnx_encoder import ONNX_MODEL_FILES
+from app.services.pbti.mbti_analyzer import build_user_description
+
+# 백엔드별 기본 최소 코사인 유사도 (torch 임베딩 기준)
+DEFAULT_MIN_COSINE = {"onnx": 0.9999, "onnx-int8": 0.98}
+
+
+def sbert_query_texts(count: int, seed: int) -> List[str]:
+    """/recommend 요청 하나가 인코딩하는 질의 문장 (SBERTPerfumeRecommender 템플릿과 동일)"""
+    texts = []
+    for ambience, style, gender, season, personality in sample_queries(count, seed=seed):
+        texts += [
+            f"이 향수는 {ambience}, {style}, {personality} 느낌의 향수입니다.",
+            f"이 향수는 {gender}, {season}에 어울리는 향수입니다.",
+            f"{ambience} {style} {personality}",
+            f"{gender} {season}",
+            ambience
+        ]
+    return texts
+
+
+def pbti_query_texts() -> List[str]:
+    """MBTI 유형별 사용자 설명 문장 (PBTIPerfumeRecommender 질의, 16개)"""
+    return [build_user_description(mbti) for mbti in WARMUP_PBTI_MBTI_TYPES]
+
+
+def catalog_texts(size: int, seed: int) -> List[str]:
+    df = generate_catalog(size, seed=seed)
+    return (df["향수 키워드"] + ". " + df["한줄소개"].fillna("")).tolist()
+
+
+def _cosines(reference: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    return np.sum(reference * candidate, axis=1) / np.where(norms == 0, 1.0, norms)
+
+
+def measure(encoder: Any, queries: List[str], batch: List[str], warmup: int) -> Dict[str, Any]:
+    """질의당 encode 지연 (한 문장씩, 서비스 호출 방식) + 배치 encode 시간 (카탈로그 임베딩)"""
+    for text in queries[:warmup]:
+        encoder.encode(text)
+    seconds, embeddings = [], []
+    for text in queries:
+        started = time.perf_counter()
+        embeddings.append(encoder.encode(text))
+        seconds.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    encoder.encode(batch)
+    return {
+        "embeddings": np.vstack(embeddings),
+        "query_latency_ms": latency_summary(seconds),
+        "batch_seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def run_model(registry: ModelRegistry, model_name: str, backends: List[str], queries: List[str], batch: List[str], args) -> List[Dict[str, Any]]:
+    results = []
+    reference = None
+    for backend in ["torch", *backends]:
+        started = time.perf_counter()
+        encoder = registry.get(model_name, backend)
+        load_seconds = time.perf_counter() - started
+        measured = measure(encoder, queries, batch, args.warmup)
+        entry = {
+            "model": model_name,
+            "backend": backend,
+            "load_seconds": round(load_seconds, 3),
+            "model_bytes": registry.stats()["models"][model_key(model_name, backend)]["parameter_bytes"],
+            "query_latency_ms": measured["query_latency_ms"],
+            "batch_size": len(batch),
+            "batch_seconds": measured["batch_seconds"]
+        }
+        if reference is None:
+            reference = measured["embeddings"]
+        else:
+            cosines = _cosines(reference, measured["embeddings"])
+            entry["cosine"] = {
+                "min": round(float(cosines.min()), 6),
+                "mean": round(float(cosines.mean()), 6),
+                "p01": round(float(np.percentile(cosines, 1)), 6)
+            }
+            entry["min_cosine_required"] = args.min_cosine[backend]
+            entry["passed"] = entry["cosine"]["min"] >= args.min_cosine[backend]
+        results.append(entry)
+        _print_entry(entry, results[0])
+    return results
+
+
+def _print_entry(entry: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    latency = entry["query_latency_ms"]
+    speedup = baseline["query_latency_ms"]["p50"] / latency["p50"] if latency["p50"] else 0.0
+    size = f"{entry['model_bytes'] / 1e6:.0f}MB" if entry["model_bytes"] else "-"
+    line = (
+        f"  {entry['backend']:10s} p50 {latency['p50']:7.3f}ms  p95 {latency['p95']:7.3f}ms  "
+        f"(x{speedup:.2f})  배치 {entry['batch_size']}개 {entry['batch_seconds']:.2f}s  크기 {size}"
+    )
+    if "cosine" in entry:
+        mark = "✅" if entry["passed"] else "❌"
+        line += f"  cos min {entry['cosine']['min']:.5f} / mean {entry['cosine']['mean']:.5f} {mark}"
+    print(line)
+
+
+def _parse_min_cosine(text: str) -> Dict[str, float]:
+    values = dict(DEFAULT_MIN_COSINE)
+    for part in text.split(","):
+        if part.strip():
+            backend, _, value = part.partition("=")
+            if backend.strip() not in ONNX_MODEL_FILES:
+                raise ValueError(f"알 수 없는 백엔드: {backend} ({', '.join(ONNX_MODEL_FILES)})")
+            values[backend.strip()] = float(value)
+    return values
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="인코더 백엔드 비교 (질의당 지연 시간 + 코사인 동등성)")
+    parser.add_argument("--models", default=f"{SBERT_MODEL_NAME},{PBTI_SBERT_MODEL_NAME}", help="모델 이름 목록 (쉼표 구분)")
+    parser.add_argument("--backends", default=",".join(ONNX_MODEL_FILES), help="torch와 비교할 백엔드 (쉼표 구분)")
+    parser.add_argument("--queries", type=int, default=40, help="SBERT 질의 조합 수 (조합당 5문장)")
+    parser.add_argument("--batch-size", type=int, default=500, help="배치 encode에 쓸 카탈로그 문장 수")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--min-cosine", default="", help="백엔드별 최소 코사인 (예: onnx=0.9999,onnx-int8=0.98)")
+    parser.add_argument("--threads", type=int, default=0, help="torch / onnxruntime 스레드 수 (0: 기본값)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    try:
+        args.min_cosine = _parse_min_cosine(args.min_cosine)
+    except ValueError as e:
+        parser.error(str(e))
+    backends = [backend.strip() for backend in args.backends.split(",") if backend.strip()]
+    unknown = [backend for backend in backends if backend not in ONNX_MODEL_FILES]
+    if unknown:
+        parser.error(f"알 수 없는 백엔드: {unknown} ({', '.join(ONNX_MODEL_FILES)})")
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    registry = ModelRegistry(onnx_threads=args.threads)
+    batch = catalog_texts(args.batch_size, args.seed)
+    results = []
+    for model_name in [name.strip() for name in args.models.split(",") if name.strip()]:
+        queries = pbti_query_texts() if model_name == PBTI_SBERT_MODEL_NAME else sbert_query_texts(args.queries, args.seed)
+        print(f"🧪 {model_name}: 질의 {len(queries)}개 (한 문장씩), 배치 {len(batch)}개")
+        results.extend(run_model(registry, model_name, backends, queries, batch, args))
+
+    meta = {
+        **base_metadata(args.label),
+        "queries": args.queries,
+        "batch_size": args.batch_size,
+        "threads": args.threads,
+        "seed": args.seed
+    }
+    path = save_results(args.output_dir, meta, results, prefix="encoders")
+    print(f"💾 결과 저장: {path}")
+    failed = [f"{entry['model']}@{entry['backend']}" for entry in results if entry.get("passed") is False]
+    if failed:
+        print(f"❌ 코사인 허용 오차 초과: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
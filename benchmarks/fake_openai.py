@@ -0,0 +1,221 @@
+# benchmarks/fake_openai.py
+# OpenAI chat.completions 호환 fake 서버 (지연 / 오류 분포 설정, 스트리밍 지원)
+#   python -m benchmarks.fake_openai --port 9100 --ttft-median 0.6 --error-rate 0.02
+#   → 앱은 OPENAI_BASE_URL=http://127.0.0.1:9100/v1 로 실행
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class FakeLLMSettings:
+    """
+    응답 지연 / 오류 분포
+    - 첫 토큰 지연: 로그정규분포 (중앙값 ttft_median, 분산 ttft_sigma)
+    - 이후 출력 토큰마다 token_seconds 추가 (출력 토큰 ≈ 글자 수 / 2)
+    - error_rate: 500, rate_limit_rate: 429 (openai 클라이언트가 재시도)
+    """
+    ttft_median: float = 0.5
+    ttft_sigma: float = 0.4
+    token_seconds: float = 0.01
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: int = 0
+
+
+# 섹션별 프롬프트 (gpt_service.prompt_*) 에 대한 고정 응답
+_SECTION_RESPONSES = [
+    ("'perfumeStyle' 객체", {"perfumeStyle": {
+        "description": "선명하고 또렷한 인상을 남기는 향기",
+        "notes": [
+            {"category": category, "categoryDescription": f"{category} 노트의 분위기"}
+            for category in ("시트러스", "앰버", "머스크", "우디", "플로럴")
+        ]
+    }}),
+    ("'scentPoint' 배열", {"scentPoint": [
+        {"category": category, "point": point}
+        for category, point in (("시트러스", 5), ("우디", 4), ("머스크", 3), ("플로럴", 2), ("스파이시", 1))
+    ]}),
+    ('"keywords" 필드', {"keywords": [
+        {"keyword": keyword, "keywordDescription": f"{keyword} 성향을 담은 향"}
+        for keyword in ("상쾌한", "차분한", "따뜻한", "세련된")
+    ]}),
+    ("'recommendation' 필드", {"recommendation": "당신은 어디서든 존재감을 뽐내는 리더 타입! 밝고 또렷한 향이 당신의 에너지를 더 빛나게 해줄 거예요."}),
+    ("'summary' 필드", {"summary": "사람들과의 에너지 흐름을 잘 이끌어내는 계획형 외향인"})
+]
+
+_SCENARIO_TEXT = (
+    "가을 저녁, 따뜻한 조명이 켜진 골목을 천천히 걸어요. 코끝을 스치는 부드러운 우디 향이 "
+    "오늘 하루의 피로를 조용히 감싸 안아요. 당신의 차분한 분위기가 주변을 은은하게 물들여요."
+)
+
+
+def _from_schema(schema: Dict[str, Any]) -> Any:
+    """response_format json_schema에 맞는 더미 값 생성"""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][0]
+    if kind == "object":
+        return {key: _from_schema(value) for key, value in schema.get("properties", {}).items()}
+    if kind == "array":
+        count = max(schema.get("minItems", 0), min(schema.get("maxItems", 5), 5))
+        return [_from_schema(schema.get("items", {})) for _ in range(count)]
+    if kind == "integer":
+        return 3
+    if kind == "number":
+        return 0.5
+    if kind == "boolean":
+        return True
+    return "테스트 응답"
+
+
+def build_content(body: Dict[str, Any]) -> str:
+    """요청에 맞는 응답 본문 (structured output → 스키마, PBTI 섹션 프롬프트 → 섹션 JSON, 그 외 → 시나리오)"""
+    response_format = body.get("response_format") or {}
+    if response_format.get("type") == "json_schema":
+        return json.dumps(_from_schema(response_format["json_schema"]["schema"]), ensure_ascii=False)
+    prompt = "\n".join(str(message.get("content", "")) for message in body.get("messages", []))
+    for marker, payload in _SECTION_RESPONSES:
+        if marker in prompt:
+            return json.dumps(payload, ensure_ascii=False)
+    return _SCENARIO_TEXT
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+def _chunks(text: str, size: int = 4) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def create_app(settings: FakeLLMSettings) -> FastAPI:
+    app = FastAPI(title="fake OpenAI")
+    rng = random.Random(settings.seed)
+    stats = {"requests": 0, "errors": 0, "rate_limited": 0, "streams": 0}
+
+    def _ttft() -> float:
+        return settings.ttft_median * rng.lognormvariate(0, settings.ttft_sigma)
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return {"status": "ok", **stats}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        draw = rng.random()
+        if draw < settings.rate_limit_rate:
+            stats["rate_limited"] += 1
+            await asyncio.sleep(0.01)
+            return JSONResponse(
+                {"error": {"message": "Rate limit reached (fake)", "type": "rate_limit_error"}},
+                status_code=429,
+                headers={"retry-after": "0.1"}
+            )
+        if draw < settings.rate_limit_rate + settings.error_rate:
+            stats["errors"] += 1
+            await asyncio.sleep(_ttft())
+            return JSONResponse({"error": {"message": "Internal error (fake)", "type": "server_error"}}, status_code=500)
+
+        content = build_content(body)
+        model = body.get("model", "fake")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        prompt_tokens = _estimate_tokens(json.dumps(body.get("messages", []), ensure_ascii=False))
+        completion_tokens = _estimate_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+
+        if body.get("stream"):
+            stats["streams"] += 1
+            include_usage = (body.get("stream_options") or {}).get("include_usage", False)
+            return StreamingResponse(
+                _stream(completion_id, model, content, usage if include_usage else None),
+                media_type="text/event-stream"
+            )
+
+        await asyncio.sleep(_ttft() + settings.token_seconds * completion_tokens)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }
+
+    async def _stream(completion_id: str, model: str, content: str, usage) -> AsyncIterator[str]:
+        def chunk(choices: List[Dict[str, Any]], **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": choices,
+                **extra
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        await asyncio.sleep(_ttft())
+        yield chunk([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+        for piece in _chunks(content):
+            await asyncio.sleep(settings.token_seconds * _estimate_tokens(piece))
+            yield chunk([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+        yield chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+        if usage is not None:
+            yield chunk([], usage=usage)
+        yield "data: [DONE]\n\n"
+
+    return app
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    """fake 서버 지연 / 오류 분포 옵션 (load_test에서도 사용)"""
+    parser.add_argument("--ttft-median", type=float, default=0.5, help="첫 토큰 지연 중앙값 (초)")
+    parser.add_argument("--ttft-sigma", type=float, default=0.4, help="첫 토큰 지연 로그정규 sigma")
+    parser.add_argument("--token-seconds", type=float, default=0.01, help="출력 토큰당 추가 지연 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--llm-seed", type=int, default=0)
+
+
+def settings_from_args(args: argparse.Namespace) -> FakeLLMSettings:
+    return FakeLLMSettings(
+        ttft_median=args.ttft_median,
+        ttft_sigma=args.ttft_sigma,
+        token_seconds=args.token_seconds,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.llm_seed
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="fake OpenAI 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(settings_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
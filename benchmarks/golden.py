@@ -0,0 +1,241 @@
+# benchmarks/golden.py
+# 추천 순위 골든 테스트 (성능 개선 전후로 추천 결과가 바뀌지 않았는지 확인)
+#   python -m benchmarks.golden record                 → benchmarks/golden/stub.json 생성
+#   python -m benchmarks.golden check                  → 골든 파일과 비교 (불일치 시 종료 코드 1)
+#   python -m benchmarks.golden check --min-recall 0.9 --min-tau 0.8 --score-tolerance 0.001
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+# app 모듈 import 전에 설정 (요청마다 INFO 로그, 실제 API 키 사용 방지)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from benchmarks.catalog import generate_catalog, sample_queries
+from benchmarks.common import base_metadata, latency_summary
+from benchmarks.stubs import install_catalog, install_stub_encoder
+from app.services.recommenders.tf_idf import PerfumeRecommender
+from app.services.recommenders.sbert import SBERTPerfumeRecommender
+from app.services.recommenders.hybrid import HybridPerfumeRecommender
+
+TARGETS = ("tfidf", "sbert", "hybrid")
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+
+# 순위 비교 대상 필드 (합성 카탈로그의 향수이름은 행 번호를 포함해 고유함)
+Ranking = List[Tuple[str, float]]
+
+
+def _ranking(result: Dict[str, Any]) -> Ranking:
+    return [(item["name"], float(item["similarity"])) for item in result.get("results", [])]
+
+
+def run_queries(settings: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    골든 설정대로 추천기를 만들고 고정 질의 실행
+    → {target: {"rankings": [[(id, score), ...], ...], "latency_ms": {...}}}
+    """
+    if settings["encoder"] == "stub":
+        install_stub_encoder()
+    install_catalog(generate_catalog(settings["catalog_size"], seed=settings["catalog_seed"]))
+    queries = [list(query) for query in sample_queries(settings["queries"], seed=settings["query_seed"])]
+    top_n = settings["top_n"]
+
+    tfidf = PerfumeRecommender()
+    sbert = SBERTPerfumeRecommender()
+    hybrid = HybridPerfumeRecommender(tfidf, sbert)
+    calls: Dict[str, Callable[[int, List[str]], Dict[str, Any]]] = {
+        "tfidf": lambda index, query: tfidf.recommend(*query, top_n=top_n),
+        "sbert": lambda index, query: sbert.recommend(*query, top_n=top_n),
+        # 질의마다 고정 다양성 시드 (MMR 확률 선택 재현)
+        "hybrid": lambda index, query: hybrid.recommend(
+            *query, top_n=top_n, diversity_seed=settings["diversity_seed"] + index
+        )
+    }
+
+    outputs = {}
+    for target in settings["targets"]:
+        rankings, samples = [], []
+        for index, query in enumerate(queries):
+            started = time.perf_counter()
+            result = calls[target](index, query)
+            samples.append(time.perf_counter() - started)
+            rankings.append(_ranking(result))
+        outputs[target] = {"rankings": rankings, "latency_ms": latency_summary(samples)}
+    outputs["_queries"] = queries
+    return outputs
+
+
+def recall_at_k(expected: List[str], actual: List[str], k: int) -> float:
+    """골든 상위 k개 중 현재 상위 k개에 포함된 비율 (결과 개수가 늘어난 경우도 잡도록 큰 쪽 개수 기준)"""
+    golden, current = expected[:k], actual[:k]
+    if not golden and not current:
+        return 1.0
+    return len(set(golden) & set(current)) / max(len(golden), len(current))
+
+
+def kendall_tau(expected: List[str], actual: List[str]) -> float:
+    """공통 항목의 상대 순서 일치도 (-1 ~ 1, 공통 항목이 2개 미만이면 1)"""
+    common = [item for item in expected if item in set(actual)]
+    if len(common) < 2:
+        return 1.0
+    position = {item: index for index, item in enumerate(actual)}
+    concordant = discordant = 0
+    for i in range(len(common)):
+        for j in range(i + 1, len(common)):
+            if position[common[i]] < position[common[j]]:
+                concordant += 1
+            else:
+                discordant += 1
+    return (concordant - discordant) / (concordant + discordant)
+
+
+def compare_target(
+    golden: Dict[str, Any],
+    current: Dict[str, Any],
+    k: int,
+    score_tolerance: float
+) -> Dict[str, Any]:
+    """대상 하나의 골든 / 현재 순위 비교 (질의별 recall@k, Kendall tau, 최대 점수 차이)"""
+    per_query = []
+    for index, (expected, actual) in enumerate(zip(golden["rankings"], current["rankings"])):
+        expected_ids = [item for item, _ in expected]
+        actual_ids = [item for item, _ in actual]
+        expected_scores = {item: score for item, score in expected}
+        score_diffs = [abs(score - expected_scores[item]) for item, score in actual if item in expected_scores]
+        per_query.append({
+            "index": index,
+            "identical": expected_ids == actual_ids,
+            "recall": recall_at_k(expected_ids, actual_ids, k),
+            "tau": kendall_tau(expected_ids, actual_ids),
+            "max_score_diff": max(score_diffs) if score_diffs else 0.0,
+            "scores_within_tolerance": all(diff <= score_tolerance for diff in score_diffs)
+        })
+    count = len(per_query) or 1
+    return {
+        "identical": sum(q["identical"] for q in per_query),
+        "queries": len(per_query),
+        "mean_recall": round(sum(q["recall"] for q in per_query) / count, 4),
+        "min_recall": round(min((q["recall"] for q in per_query), default=1.0), 4),
+        "mean_tau": round(sum(q["tau"] for q in per_query) / count, 4),
+        "min_tau": round(min((q["tau"] for q in per_query), default=1.0), 4),
+        "max_score_diff": round(max((q["max_score_diff"] for q in per_query), default=0.0), 6),
+        "per_query": per_query
+    }
+
+
+def _golden_path(args: argparse.Namespace) -> str:
+    return args.golden or os.path.join(GOLDEN_DIR, f"{args.encoder}.json")
+
+
+def record(args: argparse.Namespace) -> int:
+    settings = {
+        "encoder": args.encoder,
+        "catalog_size": args.catalog_size,
+        "catalog_seed": args.catalog_seed,
+        "queries": args.queries,
+        "query_seed": args.query_seed,
+        "diversity_seed": args.diversity_seed,
+        "top_n": args.top_n,
+        "targets": [target.strip() for target in args.targets.split(",") if target.strip()]
+    }
+    unknown = set(settings["targets"]) - set(TARGETS)
+    if unknown:
+        print(f"❌ 알 수 없는 대상: {sorted(unknown)}")
+        return 2
+
+    outputs = run_queries(settings)
+    golden = {
+        "meta": {**base_metadata(args.label), "settings": settings},
+        "queries": outputs.pop("_queries"),
+        "targets": outputs
+    }
+    path = _golden_path(args)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(golden, f, ensure_ascii=False, indent=1)
+    for target, output in outputs.items():
+        latency = output["latency_ms"]
+        print(f"  {target:7s} p50 {latency['p50']}ms, p95 {latency['p95']}ms")
+    print(f"💾 골든 파일 저장: {path} ({datetime.now().isoformat(timespec='seconds')})")
+    return 0
+
+
+def check(args: argparse.Namespace) -> int:
+    path = _golden_path(args)
+    if not os.path.exists(path):
+        print(f"❌ 골든 파일이 없습니다: {path} (먼저 record 실행)")
+        return 2
+    with open(path, encoding="utf-8") as f:
+        golden = json.load(f)
+
+    settings = golden["meta"]["settings"]
+    outputs = run_queries(settings)
+    if outputs.pop("_queries") != golden["queries"]:
+        print("❌ 질의 세트가 골든 파일과 다릅니다 (catalog.sample_queries 변경 여부 확인)")
+        return 2
+
+    k = args.k or settings["top_n"]
+    print(f"골든: {path} (커밋 {str(golden['meta'].get('git_commit'))[:8]}, 질의 {settings['queries']}개, recall@{k})")
+    failed = False
+    for target in settings["targets"]:
+        report = compare_target(golden["targets"][target], outputs[target], k, args.score_tolerance)
+        before, after = golden["targets"][target]["latency_ms"], outputs[target]["latency_ms"]
+        target_failed = (
+            report["min_recall"] < args.min_recall
+            or report["min_tau"] < args.min_tau
+            or report["max_score_diff"] > args.score_tolerance
+        )
+        failed = failed or target_failed
+        print(
+            f"  {'❌' if target_failed else '✅'} {target:7s} 동일 {report['identical']}/{report['queries']}, "
+            f"recall@{k} 평균 {report['mean_recall']} (최소 {report['min_recall']}), "
+            f"tau 평균 {report['mean_tau']} (최소 {report['min_tau']}), "
+            f"점수 차 최대 {report['max_score_diff']} | "
+            f"p50 {before['p50']} → {after['p50']}ms, p95 {before['p95']} → {after['p95']}ms"
+        )
+        if target_failed and args.verbose:
+            for query in report["per_query"]:
+                if not query["identical"] or not query["scores_within_tolerance"]:
+                    print(
+                        f"      질의 {query['index']} {golden['queries'][query['index']]}: "
+                        f"recall {query['recall']:.2f}, tau {query['tau']:.2f}, 점수 차 {query['max_score_diff']:.6f}"
+                    )
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추천 순위 골든 테스트 (TF-IDF / SBERT / Hybrid)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="골든 파일 생성 / 갱신")
+    record_parser.add_argument("--catalog-size", type=int, default=2000)
+    record_parser.add_argument("--catalog-seed", type=int, default=42)
+    record_parser.add_argument("--queries", type=int, default=30, help="고정 질의 수")
+    record_parser.add_argument("--query-seed", type=int, default=7)
+    record_parser.add_argument("--diversity-seed", type=int, default=1000, help="Hybrid 다양성 시드 시작값 (질의 순번을 더함)")
+    record_parser.add_argument("--top-n", type=int, default=10)
+    record_parser.add_argument("--targets", default=",".join(TARGETS))
+    record_parser.add_argument("--label", default="")
+
+    check_parser = subparsers.add_parser("check", help="골든 파일과 현재 결과 비교")
+    check_parser.add_argument("--k", type=int, default=None, help="recall@k의 k (기본: 골든 top_n)")
+    check_parser.add_argument("--min-recall", type=float, default=1.0, help="질의별 최소 recall@k")
+    check_parser.add_argument("--min-tau", type=float, default=1.0, help="질의별 최소 Kendall tau")
+    check_parser.add_argument("--score-tolerance", type=float, default=1e-4, help="같은 항목의 허용 점수 차이")
+    check_parser.add_argument("--verbose", action="store_true", help="불일치 질의 출력")
+
+    for sub in (record_parser, check_parser):
+        sub.add_argument("--encoder", choices=("stub", "real"), default="stub", help="stub: 해시 인코더, real: 실제 SBERT 모델")
+        sub.add_argument("--golden", default=None, help="골든 파일 경로 (기본: benchmarks/golden/<encoder>.json)")
+    args = parser.parse_args()
+
+    sys.exit(record(args) if args.command == "record" else check(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+# benchmarks/load_test.py
+# HTTP 부하 테스트 (fake OpenAI 서버 + 합성 카탈로그 앱을 띄우고 동시성 단계별 측정)
+#   python -m benchmarks.load_test --concurrency 1,8,32 --duration 20
+#   python -m benchmarks.load_test --mix recommend=1 --ttft-median 1.2 --error-rate 0.05
+#   python -m benchmarks.load_test --target-url http://127.0.0.1:8000 --concurrency 4   (이미 실행 중인 앱)
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from benchmarks.common import DEFAULT_OUTPUT_DIR, base_metadata, latency_summary, save_results
+from benchmarks.fake_openai import add_settings_arguments
+from benchmarks.workload import ENDPOINTS, Workload, choose_endpoint, parse_mix
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"프로세스가 종료되었습니다 (code {process.returncode}): {url}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"준비 시간 초과: {url}")
+
+
+def _spawn(module: str, arguments: List[str]) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-m", module, *arguments], cwd=PROJECT_ROOT)
+
+
+@contextmanager
+def local_stack(args: argparse.Namespace) -> Iterator[str]:
+    """fake OpenAI 서버 + 앱을 하위 프로세스로 실행하고 앱 주소 반환 (종료 시 정리)"""
+    llm_port, app_port = _free_port(), _free_port()
+    processes = []
+    try:
+        llm_arguments = [
+            "--port", str(llm_port),
+            "--ttft-median", str(args.ttft_median),
+            "--ttft-sigma", str(args.ttft_sigma),
+            "--token-seconds", str(args.token_seconds),
+            "--error-rate", str(args.error_rate),
+            "--rate-limit-rate", str(args.rate_limit_rate),
+            "--llm-seed", str(args.llm_seed)
+        ]
+        processes.append(_spawn("benchmarks.fake_openai", llm_arguments))
+        _wait_ready(f"http://127.0.0.1:{llm_port}/health", processes[-1], timeout=30)
+
+        app_arguments = [
+            "--port", str(app_port),
+            "--llm-url", f"http://127.0.0.1:{llm_port}/v1",
+            "--catalog-size", str(args.catalog_size),
+            "--encoder", args.encoder
+        ]
+        if args.llm_cache:
+            app_arguments.append("--llm-cache")
+        processes.append(_spawn("benchmarks.serve_app", app_arguments))
+        app_url = f"http://127.0.0.1:{app_port}"
+        # 워밍업(추천기 생성 + 예열) 이 끝나야 200 → 측정에 콜드 스타트가 섞이지 않음
+        _wait_ready(f"{app_url}/health/ready", processes[-1], timeout=args.startup_timeout)
+        yield app_url
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+async def run_level(
+    base_url: str,
+    concurrency: int,
+    duration: float,
+    mix: Dict[str, float],
+    seed: int,
+    timeout: float
+) -> List[Dict[str, Any]]:
+    """
+    동시성 한 단계 측정 (closed loop: 워커마다 응답을 받으면 바로 다음 요청)
+    - duration초 동안 시작한 요청만 집계 (종료 시점에 진행 중인 요청은 끝까지 기다림)
+    """
+    samples = defaultdict(list)
+    status_counts = defaultdict(lambda: defaultdict(int))
+    degraded = defaultdict(int)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+
+        async def worker(index: int) -> None:
+            rng = random.Random(seed * 1000 + index)
+            workload = Workload(seed=seed + index)
+            while time.perf_counter() < deadline:
+                name = choose_endpoint(rng, mix)
+                path, body_method = ENDPOINTS[name]
+                request_started = time.perf_counter()
+                try:
+                    response = await client.post(path, json=getattr(workload, body_method)())
+                    status = str(response.status_code)
+                    if response.status_code == 200 and name == "recommend" and response.json().get("degraded"):
+                        degraded[name] += 1
+                except httpx.TimeoutException:
+                    status = "timeout"
+                except httpx.HTTPError:
+                    status = "connection_error"
+                samples[name].append((time.perf_counter() - request_started, status))
+                status_counts[name][status] += 1
+
+        await asyncio.gather(*(worker(index) for index in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    results = []
+    for name in mix:
+        entries = samples.get(name, [])
+        ok = [seconds for seconds, status in entries if status == "200"]
+        errors = len(entries) - len(ok)
+        entry = {
+            "endpoint": name,
+            "concurrency": concurrency,
+            "requests": len(entries),
+            "throughput_rps": round(len(entries) / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(errors / len(entries), 4) if entries else 0.0,
+            "status_counts": dict(status_counts[name]),
+            "latency_ms": latency_summary(ok)
+        }
+        if name == "recommend":
+            entry["degraded_rate"] = round(degraded[name] / len(ok), 4) if ok else 0.0
+        results.append(entry)
+    return results
+
+
+def _print_level(results: List[Dict[str, Any]]) -> None:
+    for entry in results:
+        latency = entry["latency_ms"]
+        degraded = f", degraded {entry['degraded_rate'] * 100:.1f}%" if "degraded_rate" in entry else ""
+        # 성공 응답이 하나도 없으면 지연 시간 분포가 없음 (latency_summary([]) → {"requests": 0})
+        percentiles = (
+            f"p50 {latency['p50']}ms, p95 {latency['p95']}ms, p99 {latency['p99']}ms"
+            if latency.get("requests") else "성공 응답 없음"
+        )
+        print(
+            f"  c={entry['concurrency']:<3d} {entry['endpoint']:9s} {entry['throughput_rps']:7.2f} rps, "
+            f"{percentiles}, 오류 {entry['error_rate'] * 100:.1f}%{degraded}"
+        )
+
+
+async def run_levels(base_url: str, args: argparse.Namespace, levels: List[int], mix: Dict[str, float]) -> List[Dict[str, Any]]:
+    results = []
+    if args.warmup > 0:
+        print(f"🔥 워밍업 {args.warmup}s")
+        await run_level(base_url, max(levels), args.warmup, mix, args.seed + 999, args.request_timeout)
+    for concurrency in levels:
+        level_results = await run_level(base_url, concurrency, args.duration, mix, args.seed, args.request_timeout)
+        _print_level(level_results)
+        results.extend(level_results)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트 (/recommend/full, /pbti/full-result)")
+    parser.add_argument("--concurrency", default="1,4,16,32", help="동시성 단계 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=15.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 시간 (초, 0이면 생략)")
+    parser.add_argument("--mix", default="recommend=0.5,pbti=0.5", help="엔드포인트 비율 (예: recommend=0.7,pbti=0.3)")
+    parser.add_argument("--request-timeout", type=float, default=30.0)
+    parser.add_argument("--target-url", default=None, help="이미 실행 중인 앱 주소 (지정 시 서버를 띄우지 않음)")
+    parser.add_argument("--catalog-size", type=int, default=5000)
+    parser.add_argument("--encoder", choices=("stub", "real"), default="stub")
+    parser.add_argument("--llm-cache", action="store_true", help="앱의 LLM 응답 캐시 사용")
+    parser.add_argument("--startup-timeout", type=float, default=180.0, help="앱 준비 대기 시간 (초)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    levels = [int(value) for value in args.concurrency.split(",") if value.strip()]
+
+    meta = {
+        **base_metadata(args.label),
+        "mix": mix,
+        "duration_seconds": args.duration,
+        "seed": args.seed,
+        "target_url": args.target_url
+    }
+    if args.target_url is None:
+        meta.update({
+            "catalog_size": args.catalog_size,
+            "encoder": args.encoder,
+            "llm_cache": args.llm_cache,
+            "fake_llm": {
+                "ttft_median": args.ttft_median,
+                "ttft_sigma": args.ttft_sigma,
+                "token_seconds": args.token_seconds,
+                "error_rate": args.error_rate,
+                "rate_limit_rate": args.rate_limit_rate
+            }
+        })
+
+    def run(base_url: str) -> List[Dict[str, Any]]:
+        print(f"🚀 부하 테스트: {base_url} (동시성 {levels}, 단계별 {args.duration}s)")
+        return asyncio.run(run_levels(base_url, args, levels, mix))
+
+    results: Optional[List[Dict[str, Any]]]
+    if args.target_url:
+        results = run(args.target_url.rstrip("/"))
+    else:
+        with local_stack(args) as base_url:
+            results = run(base_url)
+
+    path = save_results(args.output_dir, meta, results, prefix="load")
+    print(f"💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# benchmarks/replay.py
+# 캡처한 트래픽(TRAFFIC_CAPTURE_PATH JSONL)을 한 개 이상의 빌드에 같은 간격으로 재생하고 나란히 비교
+#   python -m benchmarks.replay /tmp/perfume_traffic.jsonl --target http://127.0.0.1:8000
+#   python -m benchmarks.replay traffic.jsonl --target http://old:8000 --target http://new:8000 --speed 2
+#   python -m benchmarks.replay traffic.jsonl --target http://new:8000 --speed 0 --max-in-flight 16   (최대 속도)
+import argparse
+import asyncio
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.common import DEFAULT_OUTPUT_DIR, base_metadata, latency_summary, save_results
+
+
+def load_capture(paths: List[str], limit: Optional[int] = None, endpoints: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """캡처 파일(들)을 읽어 시각 순으로 정렬 (깨진 줄은 건너뜀)"""
+    entries = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if endpoints and entry.get("path") not in endpoints:
+                    continue
+                entries.append(entry)
+    entries.sort(key=lambda entry: entry["ts"])
+    return entries[:limit] if limit else entries
+
+
+def _summarize(records: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """경로별 처리량 / 지연 / 오류율 (records: {"path", "seconds", "status"})"""
+    by_path = defaultdict(list)
+    for record in records:
+        by_path[record["path"]].append(record)
+        by_path["all"].append(record)
+    summary = {}
+    for path, items in by_path.items():
+        ok = [item["seconds"] for item in items if item["status"] == 200]
+        summary[path] = {
+            "requests": len(items),
+            "throughput_rps": round(len(items) / elapsed, 2) if elapsed else 0.0,
+            "error_rate": round(1 - len(ok) / len(items), 4) if items else 0.0,
+            "latency_ms": latency_summary(ok)
+        }
+    return summary
+
+
+def captured_summary(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """캡처 당시(운영) 지연 / 처리량 - 재생 결과와 같은 형식"""
+    elapsed = entries[-1]["ts"] - entries[0]["ts"] if len(entries) > 1 else 0.0
+    records = [{"path": entry["path"], "seconds": entry["ms"] / 1000, "status": entry["status"]} for entry in entries]
+    return _summarize(records, elapsed)
+
+
+async def replay(
+    base_url: str,
+    entries: List[Dict[str, Any]],
+    speed: float,
+    max_in_flight: int,
+    timeout: float
+) -> Dict[str, Any]:
+    """
+    캡처 순서 / 간격대로 요청 재생 (open loop: 응답을 기다리지 않고 예정 시각에 보냄)
+    - speed: 1이면 원래 간격, 2면 두 배 빠르게, 0이면 간격 없이 max_in_flight 한도까지 바로 보냄
+    - 클라이언트가 밀려 예정 시각보다 늦게 보낸 정도(schedule_lag)도 기록 → 크면 결과를 신뢰하기 어려움
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    records = []
+    lags = []
+    origin = entries[0]["ts"]
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def send(entry: Dict[str, Any], scheduled: float) -> None:
+            async with semaphore:
+                lags.append(max(0.0, time.perf_counter() - scheduled))
+                request_started = time.perf_counter()
+                try:
+                    response = await client.post(entry["path"], json=entry["body"])
+                    status = response.status_code
+                except httpx.TimeoutException:
+                    status = "timeout"
+                except httpx.HTTPError:
+                    status = "connection_error"
+                records.append({"path": entry["path"], "seconds": time.perf_counter() - request_started, "status": status})
+
+        started = time.perf_counter()
+        tasks = []
+        for entry in entries:
+            scheduled = started + ((entry["ts"] - origin) / speed if speed > 0 else 0.0)
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(send(entry, scheduled)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    result = _summarize(records, elapsed)
+    result["_replay"] = {
+        "elapsed_seconds": round(elapsed, 3),
+        "schedule_lag_ms": latency_summary(lags)
+    }
+    return result
+
+
+def _cell(summary: Optional[Dict[str, Any]]) -> str:
+    if not summary or not summary["latency_ms"].get("requests"):
+        return "-"
+    latency = summary["latency_ms"]
+    return (
+        f"{summary['throughput_rps']:.2f}rps p50 {latency['p50']:.0f} p95 {latency['p95']:.0f} "
+        f"p99 {latency['p99']:.0f}ms err {summary['error_rate'] * 100:.1f}%"
+    )
+
+
+def print_report(columns: Dict[str, Dict[str, Any]]) -> None:
+    """경로별로 캡처 / 대상 빌드 결과를 나란히 출력"""
+    paths = sorted({path for result in columns.values() for path in result if not path.startswith("_")})
+    width = max(len(name) for name in columns)
+    for path in paths:
+        print(f"\n[{path}]")
+        for name, result in columns.items():
+            print(f"  {name:{width}s}  {_cell(result.get(path))}")
+    for name, result in columns.items():
+        if "_replay" in result:
+            lag = result["_replay"]["schedule_lag_ms"]
+            if lag.get("p95", 0) > 100:
+                print(f"⚠️ {name}: 예정 시각보다 늦게 보낸 요청이 많습니다 (p95 {lag['p95']}ms) - --max-in-flight를 늘리거나 --speed를 낮추세요")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캡처 트래픽 재생 + 빌드 간 지연 / 처리량 비교")
+    parser.add_argument("capture", nargs="+", help="캡처 JSONL 파일 (TRAFFIC_CAPTURE_PATH, 회전된 .1 파일 포함 가능)")
+    parser.add_argument("--target", action="append", required=True, help="재생 대상 앱 주소 (여러 번 지정 시 차례로 재생)")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 속도 배율 (1: 원래 간격, 0: 간격 없이)")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="동시에 보낼 수 있는 최대 요청 수")
+    parser.add_argument("--limit", type=int, default=None, help="앞에서부터 재생할 요청 수")
+    parser.add_argument("--endpoint", action="append", default=None, help="재생할 경로만 선택 (예: /pbti/full-result)")
+    parser.add_argument("--request-timeout", type=float, default=60.0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    entries = load_capture(args.capture, args.limit, args.endpoint)
+    if not entries:
+        parser.error("재생할 요청이 없습니다")
+    span = entries[-1]["ts"] - entries[0]["ts"]
+    print(f"📼 {len(entries)}개 요청 (캡처 구간 {span:.1f}s, 재생 속도 {args.speed or '최대'})")
+
+    columns = {"captured": captured_summary(entries)}
+    for target in args.target:
+        print(f"▶️ 재생: {target}")
+        columns[target] = asyncio.run(
+            replay(target.rstrip("/"), entries, args.speed, args.max_in_flight, args.request_timeout)
+        )
+    print_report(columns)
+
+    meta = {
+        **base_metadata(args.label),
+        "capture": args.capture,
+        "requests": len(entries),
+        "speed": args.speed,
+        "max_in_flight": args.max_in_flight
+    }
+    results = [{"source": name, "summary": summary} for name, summary in columns.items()]
+    path = save_results(args.output_dir, meta, results, prefix="replay")
+    print(f"\n💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# benchmarks/run.py
+# 추천기 오프라인 벤치마크 실행기
+#   python -m benchmarks.run --sizes 1000,10000 --requests 200
+#   python -m benchmarks.run --sizes 1000,50000,200000 --targets tfidf,pbti --encoder real
+import argparse
+import gc
+import os
+import resource
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# app 모듈 import 전에 설정 (요청마다 INFO 로그, LLM 캐시 파일, 실제 API 키 사용 방지)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+import numpy as np
+
+from benchmarks.catalog import generate_catalog, sample_queries
+from benchmarks.common import DEFAULT_OUTPUT_DIR, base_metadata, latency_summary, save_results
+from benchmarks.stubs import install_catalog, install_stub_encoder, install_stub_llm
+from app.core.model_registry import model_registry
+from app.services.recommenders.tf_idf import PerfumeRecommender
+from app.services.recommenders.sbert import SBERTPerfumeRecommender
+from app.services.recommenders.hybrid import HybridPerfumeRecommender
+from app.services.pbti.pbti_recommender import PBTIPerfumeRecommender
+
+TARGETS = ("tfidf", "sbert", "hybrid", "pbti")
+MBTI_TYPES = [a + b + c + d for a in "EI" for b in "NS" for c in "TF" for d in "JP"]
+
+
+def _rss_mb() -> float:
+    """현재 RSS (MB) - /proc이 없으면 최대 RSS로 대체"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss / 1024 / 1024 if sys.platform == "darwin" else maxrss / 1024
+
+
+def _construct(factory: Callable[[], Any]) -> tuple:
+    gc.collect()
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    instance = factory()
+    seconds = time.perf_counter() - started
+    return instance, round(seconds, 4), round(_rss_mb() - rss_before, 1)
+
+
+def _latency(call: Callable[[Any], Any], inputs: List[Any], warmup: int) -> Dict[str, Any]:
+    for item in inputs[:warmup]:
+        call(item)
+    samples = []
+    for item in inputs[warmup:]:
+        started = time.perf_counter()
+        call(item)
+        samples.append(time.perf_counter() - started)
+    return latency_summary(samples)
+
+
+def _reset_class_caches() -> None:
+    # 크기별 생성 시간에 모델 로드가 매번 포함되도록 공유 모델도 해제
+    model_registry.clear()
+    PerfumeRecommender._cache = None
+    SBERTPerfumeRecommender._cache = None
+    PBTIPerfumeRecommender._cache = None
+
+
+def run_size(size: int, targets: List[str], requests: int, warmup: int, seed: int) -> List[Dict[str, Any]]:
+    """카탈로그 크기 하나에 대해 대상 추천기 생성 + 요청 지연 측정"""
+    started = time.perf_counter()
+    catalog = generate_catalog(size, seed=seed)
+    print(f"📦 카탈로그 {size}개 생성 ({time.perf_counter() - started:.2f}s)")
+    install_catalog(catalog)
+
+    queries = sample_queries(requests + warmup, seed=seed + 1)
+    rng = np.random.default_rng(seed + 2)
+    mbti_inputs = [str(rng.choice(MBTI_TYPES)) for _ in range(requests + warmup)]
+
+    results = []
+    built = {}
+
+    def record(target: str, construct: Optional[tuple], latency: Dict[str, Any]) -> None:
+        entry = {"target": target, "size": size, "latency_ms": latency}
+        if construct is not None:
+            entry["construct_seconds"], entry["rss_delta_mb"] = construct
+        results.append(entry)
+        construct_text = f"생성 {entry['construct_seconds']}s / +{entry['rss_delta_mb']}MB, " if construct else ""
+        print(f"  {target:7s} {construct_text}p50 {latency['p50']}ms, p95 {latency['p95']}ms, p99 {latency['p99']}ms")
+
+    for target in ("tfidf", "sbert"):
+        if target in targets or "hybrid" in targets:
+            factory = PerfumeRecommender if target == "tfidf" else SBERTPerfumeRecommender
+            instance, seconds, rss = _construct(factory)
+            built[target] = instance
+            if target in targets:
+                record(target, (seconds, rss), _latency(lambda q: instance.recommend(*q), queries, warmup))
+
+    if "hybrid" in targets:
+        hybrid = HybridPerfumeRecommender(built["tfidf"], built["sbert"])
+        record("hybrid", None, _latency(lambda q: hybrid.recommend(*q), queries, warmup))
+
+    if "pbti" in targets:
+        pbti, seconds, rss = _construct(PBTIPerfumeRecommender)
+        # 유형별 결과 캐시를 거치지 않은 계산 비용 측정
+        record("pbti", (seconds, rss), _latency(pbti._recommend_uncached, mbti_inputs, warmup))
+        del pbti
+
+    built.clear()
+    _reset_class_caches()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추천기 오프라인 벤치마크 (S3 / OpenAI 스텁)")
+    parser.add_argument("--sizes", default="1000,10000", help="카탈로그 크기 목록 (쉼표 구분, 예: 1000,50000,200000)")
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"측정 대상 ({', '.join(TARGETS)})")
+    parser.add_argument("--requests", type=int, default=100, help="대상별 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--encoder", choices=("stub", "real"), default="stub", help="stub: 해시 인코더, real: 실제 SBERT 모델")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--label", default="", help="결과 파일명에 붙일 이름")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    targets = [target.strip() for target in args.targets.split(",") if target.strip()]
+    unknown = set(targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"알 수 없는 대상: {sorted(unknown)}")
+
+    install_stub_llm()
+    if args.encoder == "stub":
+        install_stub_encoder()
+
+    meta = {
+        **base_metadata(args.label),
+        "encoder": args.encoder,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "seed": args.seed
+    }
+    results = []
+    for size in (int(value) for value in args.sizes.split(",")):
+        results.extend(run_size(size, targets, args.requests, args.warmup, args.seed))
+
+    path = save_results(args.output_dir, meta, results)
+    print(f"💾 결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
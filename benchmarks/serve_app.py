@@ -0,0 +1,42 @@
+# benchmarks/serve_app.py
+# 합성 카탈로그 + fake OpenAI 서버로 FastAPI 앱 실행 (부하 테스트 대상)
+#   python -m benchmarks.serve_app --port 8100 --llm-url http://127.0.0.1:9100/v1 --catalog-size 5000
+import argparse
+import os
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="부하 테스트용 앱 실행 (S3 없이 합성 카탈로그 사용)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--llm-url", required=True, help="fake OpenAI 서버 주소 (예: http://127.0.0.1:9100/v1)")
+    parser.add_argument("--catalog-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--encoder", choices=("stub", "real"), default="stub", help="stub: 해시 인코더, real: 실제 SBERT 모델")
+    parser.add_argument("--llm-cache", action="store_true", help="LLM 응답 캐시 사용 (기본: 꺼짐, 매 요청 LLM 호출)")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 설정 (config는 import 시점에 환경 변수를 읽음)
+    os.environ["OPENAI_BASE_URL"] = args.llm_url
+    os.environ["OPENAI_API_KEY"] = "fake"
+    os.environ["LOG_LEVEL"] = args.log_level
+    if not args.llm_cache:
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    # 추천기 생성(startup 워밍업 / 첫 요청) 전에 카탈로그 / 인코더 교체
+    import uvicorn
+    from benchmarks.catalog import generate_catalog
+    from benchmarks.stubs import install_catalog, install_stub_encoder
+
+    install_catalog(generate_catalog(args.catalog_size, seed=args.seed))
+    if args.encoder == "stub":
+        install_stub_encoder()
+
+    from app.main import app
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
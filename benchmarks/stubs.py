@@ -0,0 +1,107 @@
+# benchmarks/stubs.py
+# S3 / OpenAI / SentenceTransformer 스텁 (네트워크 없이 추천기 생성)
+import asyncio
+import hashlib
+import re
+from types import SimpleNamespace
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+import app.core.utils as utils
+from app.core import model_registry
+from app.core.llm_gateway import llm_gateway
+from app.services.recommenders import sbert, tf_idf
+from app.services.pbti import pbti_recommender
+
+
+def _s3_disabled(bucket: str, key: str):
+    raise RuntimeError(f"벤치마크에서는 S3를 사용하지 않습니다: s3://{bucket}/{key}")
+
+
+def install_catalog(df: pd.DataFrame) -> None:
+    """
+    추천기 클래스 캐시에 카탈로그를 넣어 S3 로드를 건너뜀
+    (실수로 S3를 호출하면 바로 실패하도록 로더도 교체)
+    """
+    for module in (utils, sbert, tf_idf, pbti_recommender):
+        module.load_excel_from_s3 = _s3_disabled
+    tf_idf.PerfumeRecommender._cache = df
+    sbert.SBERTPerfumeRecommender._cache = df
+    pbti_recommender.PBTIPerfumeRecommender._cache = df
+
+
+class StubEncoder:
+    """
+    SentenceTransformer 대체 인코더 (모델 다운로드 없음, 결정적)
+    - 토큰별 해시 시드 벡터의 합을 정규화 → 겹치는 단어가 많을수록 유사도가 높음
+    - 실제 모델보다 훨씬 빠르므로 인코딩을 제외한 추천 로직 비용 측정용
+    """
+
+    def __init__(self, model_name: str = "stub", dim: int = 384, **kwargs):
+        self.model_name = model_name
+        self.dim = dim
+        self._token_vectors = {}
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            seed = int.from_bytes(hashlib.md5(token.encode("utf-8")).digest()[:8], "little")
+            vector = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+            self._token_vectors[token] = vector
+        return vector
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        tokens = re.findall(r"\w+", text.lower())
+        if not tokens:
+            return np.zeros(self.dim, dtype=np.float32)
+        vector = np.sum([self._token_vector(token) for token in tokens], axis=0)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def encode(self, sentences: Union[str, List[str]], **kwargs):
+        if isinstance(sentences, str):
+            return self._encode_one(sentences)
+        return np.vstack([self._encode_one(text) for text in sentences]) if sentences else np.zeros((0, self.dim))
+
+
+def install_stub_encoder(dim: int = 384) -> None:
+    """모델 레지스트리가 StubEncoder를 로드하도록 교체 (이미 로드된 모델은 해제)"""
+    def factory(model_name: str, *args, **kwargs) -> StubEncoder:
+        return StubEncoder(model_name, dim=dim)
+
+    model_registry.SentenceTransformer = factory
+    model_registry.model_registry.clear()
+
+
+class StubLLMClient:
+    """
+    AsyncOpenAI chat.completions.create 호환 스텁
+    - 고정 응답을 latency초 뒤에 반환 (usage 포함)
+    """
+
+    def __init__(self, content: str = "{}", latency: float = 0.0):
+        self.content = content
+        self.latency = latency
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._acreate))
+
+    def _response(self, kwargs: Dict) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(
+            model=kwargs.get("model"),
+            choices=[SimpleNamespace(index=0, finish_reason="stop", message=SimpleNamespace(role="assistant", content=self.content))],
+            usage=SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+        )
+
+    async def _acreate(self, **kwargs) -> SimpleNamespace:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._response(kwargs)
+
+
+def install_stub_llm(content: str = "{}", latency: float = 0.0) -> StubLLMClient:
+    """LLM 게이트웨이의 OpenAI 클라이언트를 스텁으로 교체 (비동기 클라이언트 반환)"""
+    async_client = StubLLMClient(content, latency)
+    llm_gateway._get_async_client = lambda api_key: async_client
+    return async_client
@@ -0,0 +1,69 @@
+# benchmarks/workload.py
+# 부하 테스트용 요청 생성기 (실사용에 가까운 키워드 / 답변 분포)
+import random
+from typing import Any, Dict, List
+
+from benchmarks.catalog import sample_queries
+
+# PBTI 질문별 선택지 (mbti_analyzer.AXIS_RULES 판별 단어를 포함하는 두 가지 답변)
+PBTI_ANSWER_OPTIONS = {
+    "qOne": ["일어나자마자 바로 칫솔을 든다", "세수하고 수건으로 닦고 나서 움직인다"],
+    "qTwo": ["버튼을 눌러 바로 분사해 본다", "중간에 내리는 향을 기다린다"],
+    "qThree": ["알림처럼 미리 챙겨 둔다", "버스가 오면 가방에서 꺼내 뿌린다"],
+    "qFour": ["신호가 바뀌기 직전에 분사해 둔다", "향이 옅어지면 기다리다 다시 뿌린다"],
+    "qFive": ["공간 전체에 향을 퍼뜨린다", "헹굴 때마다 기분이 좋아지는 향을 고른다"],
+    "qSix": ["목줄에 가볍게 뿌린다", "손목에 레이어링한다"],
+    "qSeven": ["리모컨을 들고 채널을 돌리며 고른다", "광고가 끝날 때까지 확실히 기다린다"],
+    "qEight": ["이불 위에서 잔향을 즐긴다", "방 중앙에서 톡톡 뿌린다"]
+}
+
+_RECOMMEND_FIELDS = ("ambience", "style", "gender", "season", "personality")
+
+
+class Workload:
+    """
+    엔드포인트별 요청 본문 생성기 (같은 seed면 같은 순서)
+    - recommend: 인기 조합이 반복되도록 Zipf 가중치로 키워드 조합 선택 (캐시 적중 / 중복 요청 재현)
+    - pbti: 질문별 선택지 무작위 조합 (2^8 = 256가지 답변)
+    """
+
+    def __init__(self, seed: int = 7, distinct_queries: int = 200, zipf_exponent: float = 1.1):
+        self._rng = random.Random(seed)
+        self._queries = sample_queries(distinct_queries, seed=seed)
+        self._weights = [1.0 / (rank + 1) ** zipf_exponent for rank in range(distinct_queries)]
+
+    def recommend_body(self) -> Dict[str, Any]:
+        query = self._rng.choices(self._queries, weights=self._weights)[0]
+        return dict(zip(_RECOMMEND_FIELDS, query))
+
+    def pbti_body(self) -> Dict[str, Any]:
+        return {field: self._rng.choice(options) for field, options in PBTI_ANSWER_OPTIONS.items()}
+
+
+# 엔드포인트 이름 → (경로, 본문 생성 메서드 이름)
+ENDPOINTS = {
+    "recommend": ("/recommend/full", "recommend_body"),
+    "pbti": ("/pbti/full-result", "pbti_body")
+}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'recommend=0.7,pbti=0.3' → 정규화된 비율"""
+    mix = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"알 수 없는 엔드포인트: {name} ({', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1.0)
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError("요청 비율 합이 0입니다")
+    return {name: weight / total for name, weight in mix.items()}
+
+
+def choose_endpoint(rng: random.Random, mix: Dict[str, float]) -> str:
+    names: List[str] = list(mix)
+    return rng.choices(names, weights=[mix[name] for name in names])[0]
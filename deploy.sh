@@ -61,17 +61,27 @@ sleep 10  # 컨테이너 시작 대기
 if [ "$(docker ps -q -f name=perfume-recommender-container)" ]; then
     echo "✅ 컨테이너가 성공적으로 실행되었습니다!"
     
-    # 헬스체크
-    echo "🩺 API 헬스체크 중..."
-    sleep 5  # API 시작 대기
+    # 헬스체크: 추천기 생성 + 예열 완료 (/health/ready) 까지 대기
+    echo "🩺 API 준비 상태 확인 중 (최대 ${READY_TIMEOUT_SECONDS:=300}초)..."
+    READY=false
+    for _ in $(seq 1 $((READY_TIMEOUT_SECONDS / 5))); do
+        if docker exec perfume-recommender-container curl -fs http://localhost:8000/health/ready > /dev/null 2>&1; then
+            READY=true
+            break
+        fi
+        sleep 5
+    done
     
-    # FastAPI 헬스체크 (Docker 컨테이너 내부에서 확인)
-    if docker exec perfume-recommender-container curl -f http://localhost:8000/docs > /dev/null 2>&1; then
-        echo "✅ FastAPI가 정상적으로 응답하고 있습니다!"
+    if [ "$READY" = true ]; then
+        echo "✅ FastAPI가 요청을 받을 준비가 되었습니다!"
+        docker exec perfume-recommender-container curl -s http://localhost:8000/health/ready || true
+        echo ""
         echo "📋 API 문서: http://localhost:8000/docs (EC2 내부)"
         echo "🔗 Spring Boot 연동: http://perfume-recommender-container:8000"
     else
-        echo "⚠️  FastAPI 응답 확인 실패. 로그를 확인하세요."
+        echo "⚠️  준비 상태 확인 실패. 구성 요소별 상태:"
+        docker exec perfume-recommender-container curl -s http://localhost:8000/health/ready || true
+        echo ""
         echo "📋 로그 확인: docker logs perfume-recommender-container"
     fi
     